@@ -0,0 +1,43 @@
+"""Rewrite stored transcripts in the current TRANSCRIPT_COMPRESSION encoding.
+
+New transcripts are always written compressed; rows stored by older versions
+stay plain JSON (still readable) until this runs. It is safe alongside the API
+and workers. ``--vacuum`` afterwards hands the freed pages back to the disk,
+but needs a moment with no other connection writing.
+
+    python -m app.compact [--vacuum]
+"""
+
+import argparse
+import logging
+import os
+from pathlib import Path
+
+from dotenv import load_dotenv
+
+logger = logging.getLogger(__name__)
+
+
+def _main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--vacuum", action="store_true", help="VACUUM jobs.db after recompressing")
+    args = parser.parse_args()
+
+    from app.services.job_store import job_store
+
+    before = os.path.getsize(job_store.db_path)
+    rewritten = job_store.recompress_results()
+    logger.info("Rewrote %d transcripts as %s", rewritten, job_store._codec.method)
+    if args.vacuum:
+        with job_store._get_connection() as conn:
+            conn.execute("VACUUM")
+            # Under WAL the vacuumed pages land in the -wal file first.
+            conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+        logger.info("%s: %.1f MB -> %.1f MB", job_store.db_path, before / 2**20, os.path.getsize(job_store.db_path) / 2**20)
+    job_store.close()
+
+
+if __name__ == "__main__":
+    load_dotenv(Path(__file__).parent.parent.parent / ".env")
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(name)s: %(message)s")
+    _main()
@@ -1,6 +1,7 @@
 import os
 from pathlib import Path
 from functools import lru_cache
+from typing import Literal
 from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
@@ -9,7 +10,33 @@ class Settings(BaseSettings):
     model_config = SettingsConfigDict(env_file=".env", env_file_encoding="utf-8")
     
     nvidia_api_key: str = Field(default="")
+    nvidia_base_url: str = Field(default="https://integrate.api.nvidia.com/v1")
     artifact_path: Path = Field(default=Path("./artifacts"))
+    # Batch jobs call DataDesigner in slices of this many records and commit each
+    # slice before starting the next, bounding memory and enabling resume.
+    generation_chunk_size: int = Field(default=50, ge=1, le=1000)
+    # LLM quality judge: max in-flight requests and sustained requests/second.
+    scoring_concurrency: int = Field(default=8, ge=1, le=128)
+    scoring_rate_limit: float = Field(default=8.0, gt=0)
+    # Persistent cache of judge verdicts, stored under artifact_path.
+    judge_cache_max_mb: int = Field(default=64, ge=1)
+    # DPO rejected-response generation: max in-flight requests and requests/second.
+    dpo_concurrency: int = Field(default=16, ge=1, le=128)
+    dpo_rate_limit: float = Field(default=16.0, gt=0)
+    # Riva TTS: max in-flight Synthesize requests across turns and transcripts.
+    audio_concurrency: int = Field(default=8, ge=1, le=64)
+    # Persistent cache of synthesised TTS segments, stored under artifact_path.
+    tts_cache_max_mb: int = Field(default=256, ge=1)
+    # Task queue (app/worker.py). With embedded_worker the API process also runs
+    # queued tasks; set it false and run `python -m app.worker` to scale apart.
+    embedded_worker: bool = Field(default=True)
+    worker_concurrency: int = Field(default=2, ge=1, le=64)
+    # A worker must heartbeat within this many seconds or its task is reclaimed.
+    task_lease_seconds: float = Field(default=60.0, ge=5)
+    task_max_attempts: int = Field(default=3, ge=1, le=20)
+    # Encoding of stored transcripts: zstd (with a dictionary trained on the
+    # first few hundred transcripts; zlib if zstandard is missing), zlib or none.
+    transcript_compression: Literal["zstd", "zlib", "none"] = Field(default="zstd")
 
 
 @lru_cache
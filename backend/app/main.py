@@ -1,4 +1,6 @@
+import asyncio
 import os
+from contextlib import asynccontextmanager
 from pathlib import Path
 from dotenv import load_dotenv
 from fastapi import FastAPI
@@ -8,12 +10,43 @@ from fastapi.middleware.cors import CORSMiddleware
 env_path = Path(__file__).parent.parent.parent / ".env"
 load_dotenv(env_path)
 
-from app.routers import generate_router, jobs_router, industries_router, settings_router
+from app.routers import (
+    generate_router,
+    jobs_router,
+    industries_router,
+    settings_router,
+    analytics_router,
+    resume_interrupted_jobs,
+)
+
+
+from app.config import get_settings
+from app.services.job_store import job_store
+from app.worker import worker_from_settings
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Batch jobs commit their progress slice by slice, so anything a previous
+    # version left pending/running without a queued task gets one and continues
+    # from its last committed slice.
+    resume_interrupted_jobs()
+    worker = worker_task = None
+    if get_settings().embedded_worker:
+        worker = worker_from_settings()
+        worker_task = asyncio.create_task(worker.run())
+    yield
+    if worker is not None:
+        worker.stop()
+        await worker_task
+    job_store.close()
+
 
 app = FastAPI(
     title="Contact Center Transcript Generator",
     description="Generate synthetic contact center transcripts using NeMo Data Designer",
     version="0.1.0",
+    lifespan=lifespan,
 )
 
 # CORS for frontend.
@@ -43,6 +76,7 @@ app.include_router(generate_router, prefix="/api/v1")
 app.include_router(jobs_router, prefix="/api/v1")
 app.include_router(industries_router, prefix="/api/v1")
 app.include_router(settings_router, prefix="/api/v1")
+app.include_router(analytics_router, prefix="/api/v1")
 
 
 @app.get("/api/v1/health")
@@ -6,7 +6,7 @@ from .transcript import (
     AgentProfile,
     TranscriptMetadata,
 )
-from .job import GenerationJob, JobStatus
+from .job import GenerationJob, JobStatus, JobSummary
 
 __all__ = [
     "GenerationConfig",
@@ -17,4 +17,5 @@ __all__ = [
     "TranscriptMetadata",
     "GenerationJob",
     "JobStatus",
+    "JobSummary",
 ]
@@ -29,3 +29,20 @@ class GenerationJob(BaseModel):
             total_records=config.num_records,
             created_at=datetime.utcnow().isoformat() + "Z",
         )
+
+
+class JobSummary(BaseModel):
+    """A job as shown in job lists: the columns of ``jobs`` minus its config."""
+
+    id: str
+    status: JobStatus
+    industry: Optional[str] = None
+    progress: float = 0.0
+    total_records: int = Field(alias="totalRecords")
+    completed_records: int = Field(alias="completedRecords", default=0)
+    created_at: str = Field(alias="createdAt")
+    completed_at: Optional[str] = Field(alias="completedAt", default=None)
+    error: Optional[str] = None
+
+    class Config:
+        populate_by_name = True
@@ -54,6 +54,60 @@ class DatasetStats(BaseModel):
     quality_score_distribution: dict = Field(alias="qualityScoreDistribution", default_factory=dict)
     avg_duration_seconds: float = Field(alias="avgDurationSeconds", default=0.0)
     total_transcripts: int = Field(alias="totalTranscripts", default=0)
+    avg_turns: float = Field(alias="avgTurns", default=0.0)
+    escalation_rate: float = Field(alias="escalationRate", default=0.0)
+    avg_csat: Optional[float] = Field(alias="avgCsat", default=None)
+    avg_quality: Optional[float] = Field(alias="avgQuality", default=None)
+
+    class Config:
+        populate_by_name = True
+
+
+class QualityDistribution(BaseModel):
+    scored: int = 0
+    unscored: int = 0
+    mean_overall: float = Field(alias="meanOverall", default=0.0)
+    histogram: list = Field(default_factory=list)
+
+    class Config:
+        populate_by_name = True
+
+
+class JobOverlap(BaseModel):
+    job_id: str = Field(alias="jobId")
+    other_job_id: str = Field(alias="otherJobId")
+    transcripts: int = Field(description="Transcripts of jobId with a near-duplicate in otherJobId")
+
+    class Config:
+        populate_by_name = True
+
+
+class DedupOverlap(BaseModel):
+    threshold: float
+    transcripts_compared: int = Field(alias="transcriptsCompared", default=0)
+    cross_job_duplicates: int = Field(alias="crossJobDuplicates", default=0)
+    combined_removable: int = Field(alias="combinedRemovable", default=0)
+    pairs: list[JobOverlap] = Field(default_factory=list)
+
+    class Config:
+        populate_by_name = True
+
+
+class JobAnalytics(BaseModel):
+    statistics: Optional[DatasetStats] = None
+    bias_report: Optional[BiasReport] = Field(alias="biasReport", default=None)
+    quality_distribution: Optional[QualityDistribution] = Field(alias="qualityDistribution", default=None)
+
+    class Config:
+        populate_by_name = True
+
+
+class AnalyticsReport(BaseModel):
+    job_ids: list[str] = Field(alias="jobIds", default_factory=list)
+    missing_job_ids: list[str] = Field(alias="missingJobIds", default_factory=list)
+    combined: JobAnalytics
+    per_job: dict[str, JobAnalytics] = Field(alias="perJob", default_factory=dict)
+    dedup_overlap: Optional[DedupOverlap] = Field(alias="dedupOverlap", default=None)
 
     class Config:
         populate_by_name = True
@@ -63,6 +117,7 @@ class CurationResult(BaseModel):
     original_count: int = Field(alias="originalCount")
     deduplicated_count: int = Field(alias="deduplicatedCount")
     pii_removed_count: int = Field(alias="piiRemovedCount")
+    pii_category_counts: dict = Field(alias="piiCategoryCounts", default_factory=dict)
     quality_filtered_count: int = Field(alias="qualityFilteredCount")
     final_count: int = Field(alias="finalCount")
     curated_transcripts: list = Field(alias="curatedTranscripts", default_factory=list)
@@ -71,6 +126,23 @@ class CurationResult(BaseModel):
         populate_by_name = True
 
 
+class ScoringSummary(BaseModel):
+    scored: int = 0
+    failed: int = 0
+    retries: int = 0
+    # Both 0 when scoring ran without a verdict cache.
+    cache_hits: int = Field(alias="cacheHits", default=0)
+    cache_misses: int = Field(alias="cacheMisses", default=0)
+    wall_seconds: float = Field(alias="wallSeconds", default=0.0)
+    latency_p50_ms: float = Field(alias="latencyP50Ms", default=0.0)
+    latency_p90_ms: float = Field(alias="latencyP90Ms", default=0.0)
+    latency_p99_ms: float = Field(alias="latencyP99Ms", default=0.0)
+    latency_max_ms: float = Field(alias="latencyMaxMs", default=0.0)
+
+    class Config:
+        populate_by_name = True
+
+
 class CustomerProfile(BaseModel):
     name: str
     age: int
@@ -1,7 +1,8 @@
-from .generate import router as generate_router
+from .generate import router as generate_router, resume_interrupted_jobs
 from .jobs import router as jobs_router
 from .industries import router as industries_router
 from .settings import router as settings_router
+from .analytics import router as analytics_router
 
-__all__ = ["generate_router", "jobs_router", "industries_router", "settings_router"]
+__all__ = ["generate_router", "resume_interrupted_jobs", "jobs_router", "industries_router", "settings_router", "analytics_router"]
 
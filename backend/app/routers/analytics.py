@@ -0,0 +1,51 @@
+"""Analytics router: combined reports over many jobs."""
+import logging
+
+from fastapi import APIRouter, HTTPException, Query
+
+from app.services.analytics import SECTIONS, DatasetAnalytics
+from app.services.job_store import job_store
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter(prefix="/analytics", tags=["analytics"])
+
+MAX_JOBS = 500
+
+
+@router.get("/datasets")
+def dataset_analytics(
+    job_ids: list[str] | None = Query(default=None, alias="jobId"),
+    since: str | None = None,
+    until: str | None = None,
+    include: list[str] = Query(default=list(SECTIONS)),
+    limit: int = Query(default=100, ge=1, le=MAX_JOBS),
+):
+    """Statistics, bias, quality and dedup-overlap figures across several jobs.
+
+    Select jobs with repeated ``jobId`` parameters, or by creation time with
+    ``since``/``until`` (ISO timestamps, newest ``limit`` jobs). ``include``
+    limits the sections computed; bias and overlap stream every transcript,
+    the others read only per-job aggregates. Returns combined and per-job
+    breakdowns.
+    """
+    unknown = set(include) - set(SECTIONS)
+    if unknown:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Unsupported section(s): {', '.join(sorted(unknown))}. Supported: {', '.join(SECTIONS)}",
+        )
+    if job_ids:
+        if len(job_ids) > MAX_JOBS:
+            raise HTTPException(status_code=400, detail=f"At most {MAX_JOBS} jobs per request")
+    else:
+        job_ids = [job.id for job in job_store.list_jobs_created_between(since, until, limit)]
+    if not job_ids:
+        raise HTTPException(status_code=404, detail="No jobs matched")
+
+    try:
+        report = DatasetAnalytics(job_store).analyze(job_ids, include)
+        return report.model_dump(by_alias=True)
+    except Exception as e:
+        logger.error(f"Dataset analytics failed: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
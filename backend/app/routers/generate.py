@@ -1,9 +1,11 @@
 import logging
 from datetime import datetime
-from fastapi import APIRouter, HTTPException, BackgroundTasks
+from fastapi import APIRouter, HTTPException
+from app.config import get_settings
 from app.models import GenerationConfig, GenerationJob
 from app.services import TranscriptGenerator
 from app.services.job_store import job_store
+from app.services.task_queue import task_queue
 
 logger = logging.getLogger(__name__)
 
@@ -22,42 +24,80 @@ async def generate_preview(config: GenerationConfig):
         raise HTTPException(status_code=500, detail=str(e))
 
 
-async def run_batch_generation(job_id: str, config: GenerationConfig):
-    """Background task for batch generation."""
+async def run_batch_generation(job_id: str):
+    """Generate a job's transcripts (the queue's ``generate`` task).
+
+    Records are generated in slices of ``generation_chunk_size``. Each slice is
+    committed together with the job's progress before the next one starts, so
+    memory is bounded by one slice and a job interrupted mid-way, or retried
+    after an error, resumes after its last committed slice instead of
+    starting over. Errors propagate so the queue can retry; the job is marked
+    failed by ``fail_batch_generation`` once no attempts are left.
+    """
     job = job_store.get_job(job_id)
-    if not job:
+    if not job or job.status in ("completed", "failed"):
         return
+    config = job.config
 
     job.status = "running"
     job_store.update_job(job)
-    
-    try:
-        transcripts = await generator.generate_batch(config)
+
+    chunk_size = get_settings().generation_chunk_size
+    cursor = job_store.get_generation_cursor(job_id)
+    while cursor < config.num_records:
+        requested = min(chunk_size, config.num_records - cursor)
+        transcripts = await generator.generate_batch(config, num_records=requested)
         results = [t.model_dump(by_alias=True) for t in transcripts]
-        
-        # Save results to database
-        job_store.save_results(job_id, results)
-        
-        job.status = "completed"
-        job.completed_records = len(transcripts)
-        job.progress = 100.0
-        job.completed_at = datetime.utcnow().isoformat() + "Z"
-        job_store.update_job(job)
-    except Exception as e:
-        # Best-effort: never let a failure to persist the "failed" status leave
-        # the job wedged in "running" forever.
-        job.status = "failed"
-        job.error = str(e)
-        try:
-            job_store.update_job(job)
-        except Exception:
-            logger.exception("Failed to mark job %s as failed", job_id)
+
+        # Advance by what was requested, not what came back: DataDesigner
+        # may drop failed rows, and retrying them forever would never end.
+        cursor += requested
+        job.completed_records += len(results)
+        job.progress = round(cursor / config.num_records * 100, 1)
+        job_store.append_results(job, results, cursor)
+
+    job.status = "completed"
+    job.progress = 100.0
+    job.completed_at = datetime.utcnow().isoformat() + "Z"
+    job_store.update_job(job)
+
+
+def fail_batch_generation(job_id: str, error: str):
+    """Mark a job failed after its generate task ran out of attempts."""
+    job = job_store.get_job(job_id)
+    if job is None or job.status == "completed":
+        return
+    job.status = "failed"
+    job.error = error
+    job_store.update_job(job)
+
+
+def resume_interrupted_jobs() -> int:
+    """Queue a generate task for every pending/running job that lacks one.
+
+    Called once at startup. Jobs submitted through the queue already have
+    their task (a dead worker's lease simply expires); this covers jobs left
+    behind by versions that ran generation in-process. Committed slices are
+    kept, so each job picks up at its generation cursor. Returns the number
+    of jobs queued.
+    """
+    resumed = 0
+    for job in job_store.list_jobs_by_status("pending", "running"):
+        if task_queue.has_active(job.id, "generate"):
+            continue
+        logger.info("Resuming job %s at record %d", job.id, job.completed_records)
+        task_queue.enqueue("generate", job.id, max_attempts=get_settings().task_max_attempts)
+        resumed += 1
+    return resumed
 
 
 @router.post("/batch")
-async def start_batch_generation(config: GenerationConfig, background_tasks: BackgroundTasks):
-    """Start a batch generation job."""
+async def start_batch_generation(config: GenerationConfig):
+    """Start a batch generation job.
+
+    The job is queued; a worker (embedded or ``python -m app.worker``) runs it.
+    """
     job = GenerationJob.create(config)
     job_store.create_job(job)
-    background_tasks.add_task(run_batch_generation, job.id, config)
+    task_queue.enqueue("generate", job.id, max_attempts=get_settings().task_max_attempts)
     return job.model_dump(by_alias=True)
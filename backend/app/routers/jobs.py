@@ -1,14 +1,17 @@
-import json
-import csv
-import io
+import asyncio
 import logging
+import threading
+from typing import Optional
 import uuid
 from pathlib import Path
-from fastapi import APIRouter, HTTPException, BackgroundTasks
-from fastapi.responses import StreamingResponse, FileResponse
-from pydantic import BaseModel
+from fastapi import APIRouter, HTTPException, Query, Request
+from fastapi.responses import StreamingResponse, FileResponse, Response
+from pydantic import BaseModel, Field
+from app.models import JobStatus
+from app.services import json_codec
 from app.services.job_store import job_store
-from app.services.dataset_formats import build_sft_record, build_sft_instruct_record
+from app.services.task_queue import TaskConflict, task_queue
+from app.services.download_stream import EXPORT_FORMATS, negotiate_encoding, stream_export
 from app.config import get_settings
 
 logger = logging.getLogger(__name__)
@@ -48,11 +51,71 @@ def _raise_for_background_error(artifact_path: Path, job_id: str, kind: str, not
     raise HTTPException(status_code=404, detail=not_ready_msg)
 
 
+def _etag_matches(request: Request, etag: str) -> bool:
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    tags = {tag.strip().removeprefix("W/") for tag in header.split(",")}
+    return "*" in tags or etag in tags
+
+
+def _conditional_json(request: Request, etag: str, body) -> Response:
+    """JSON response carrying ``etag``, or an empty 304 if the client already has it.
+
+    ``body`` is a callable returning the serialised JSON, only called on a miss.
+    no-cache makes browsers revalidate on every poll rather than reuse blindly.
+    """
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+    if _etag_matches(request, etag):
+        return Response(status_code=304, headers=headers)
+    return Response(content=body(), media_type="application/json", headers=headers)
+
+
+def _cached_report(request: Request, job_id: str, kind: str, build) -> Response:
+    """Serve a report derived from a job's results, computing it at most once per write.
+
+    The report is cached in the job store under the job's results etag, which
+    every save/append replaces, so it is rebuilt only after the transcripts
+    change. ``build`` returns the report as a JSON-serialisable value.
+    """
+    results_etag = job_store.get_results_etag(job_id)
+    if results_etag is None:
+        raise HTTPException(status_code=404, detail="Job results not found")
+
+    def body() -> str:
+        cached = job_store.get_report(job_id, kind, results_etag)
+        if cached is not None:
+            return cached
+        serialised = json_codec.dumps(build())
+        job_store.save_report(job_id, kind, results_etag, serialised)
+        return serialised
+
+    return _conditional_json(request, f'"{results_etag}-{kind}"', body)
+
+
+MAX_JOBS_PAGE = 200
+
+
 @router.get("")
-async def list_jobs():
-    """List all generation jobs."""
-    jobs = job_store.list_jobs()
-    return [job.model_dump(by_alias=True) for job in jobs]
+def list_jobs(
+    cursor: Optional[str] = None,
+    limit: int = Query(default=50, ge=1, le=MAX_JOBS_PAGE),
+    status: Optional[JobStatus] = None,
+    industry: Optional[str] = None,
+):
+    """List generation jobs, newest first.
+
+    Jobs come as summaries without their config (fetch /jobs/{job_id} for
+    that) in pages of ``limit``: pass the returned ``nextCursor`` back as
+    ``cursor`` until it is null. ``status`` and ``industry`` narrow the list.
+    """
+    try:
+        jobs, next_cursor = job_store.list_job_summaries(
+            limit=limit, cursor=cursor, status=status, industry=industry
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return {"jobs": [job.model_dump(by_alias=True) for job in jobs], "nextCursor": next_cursor}
 
 
 @router.get("/{job_id}")
@@ -64,16 +127,48 @@ async def get_job(job_id: str):
     return job.model_dump(by_alias=True)
 
 
+MAX_RESULTS_PAGE = 500
+
+
+def _project(t: dict, fields: Optional[list[str]]) -> dict:
+    if fields is None:
+        return t
+    return {key: t[key] for key in fields if key in t}
+
+
 @router.get("/{job_id}/results")
-async def get_job_results(job_id: str):
+def get_job_results(
+    job_id: str,
+    request: Request,
+    cursor: Optional[int] = None,
+    limit: Optional[int] = Query(default=None, ge=1, le=MAX_RESULTS_PAGE),
+    scenario: Optional[str] = None,
+    sentiment: Optional[str] = None,
+    resolution_status: Optional[str] = Query(default=None, alias="resolutionStatus"),
+    language: Optional[str] = None,
+    min_quality: Optional[float] = Query(default=None, alias="minQuality"),
+    max_quality: Optional[float] = Query(default=None, alias="maxQuality"),
+    transcript_id: Optional[str] = Query(default=None, alias="transcriptId"),
+    q: Optional[str] = None,
+    fields: Optional[str] = None,
+):
     """Return a job's generated transcripts as a JSON body for in-app viewing.
 
     Unlike /download (which sets Content-Disposition: attachment for file
     downloads), this is a plain read endpoint the Transcript Viewer page uses to
-    render conversations, play audio, and compute KPIs client-side.
+    render conversations and play audio.
+
+    With ``limit`` the transcripts come in pages: pass the returned
+    ``nextCursor`` back as ``cursor`` until it is null. The filters use the
+    indexed transcript columns, ``q`` searches scenario, names and turn text,
+    and ``fields`` (comma-separated top-level keys; ``id`` is always kept)
+    lets list views skip the ``conversation`` bodies. ``total`` counts the
+    filtered transcripts, or is null when ``q`` is set since that would mean
+    scanning the whole job. Responses carry the job's results ETag, so
+    polling with If-None-Match gets a 304 until the transcripts change.
     """
-    transcripts = job_store.get_results(job_id)
-    if not transcripts:
+    results_etag = job_store.get_results_etag(job_id)
+    if results_etag is None or not job_store.has_results(job_id):
         # Distinguish "no such job" (404) from "job exists but results aren't
         # ready yet" (409) so the client can tell the two apart.
         job = job_store.get_job(job_id)
@@ -83,7 +178,36 @@ async def get_job_results(job_id: str):
             status_code=409,
             detail=f"Transcripts not ready yet (job status: {job.status})",
         )
-    return {"transcripts": transcripts}
+
+    q = (q or "").strip() or None
+    filters = {
+        "scenario": scenario,
+        "sentiment": sentiment,
+        "resolution_status": resolution_status,
+        "language": language,
+        "min_quality": min_quality,
+        "max_quality": max_quality,
+        "transcript_id": transcript_id,
+    }
+    keys = None
+    if fields:
+        keys = ["id", *(f.strip() for f in fields.split(",") if f.strip() and f.strip() != "id")]
+
+    def body() -> str:
+        if limit is None:
+            transcripts = list(job_store.iter_results(job_id, search=q, **filters))
+            next_cursor = None
+        else:
+            transcripts, next_cursor = job_store.get_results_page(
+                job_id, after=-1 if cursor is None else cursor, limit=limit, search=q, **filters
+            )
+        return json_codec.dumpb({
+            "transcripts": [_project(t, keys) for t in transcripts],
+            "nextCursor": next_cursor,
+            "total": None if q else job_store.count_results(job_id, **filters),
+        })
+
+    return _conditional_json(request, f'"{results_etag}-results"', body)
 
 
 @router.delete("/{job_id}")
@@ -95,19 +219,23 @@ async def delete_job(job_id: str):
 
 
 @router.get("/{job_id}/download")
-async def download_job(job_id: str, format: str = "json"):
+async def download_job(job_id: str, request: Request, format: str = "json"):
     """Download generated transcripts in various formats."""
     _validate_job_id(job_id)
     settings = get_settings()
 
     if format == "curated":
-        curated_path = settings.artifact_path / f"{job_id}_curated.jsonl"
-        if not curated_path.exists():
+        from app.services.nemo_curator import curated_artifact_path
+        # The artifact is replaced atomically, so serving it during a re-curation
+        # returns the previous complete file rather than a truncated one.
+        curated_path = curated_artifact_path(settings.artifact_path, job_id)
+        if curated_path is None:
             raise HTTPException(status_code=404, detail="Curated dataset not found. Run /curate first.")
+        compressed = curated_path.suffix == ".gz"
         return FileResponse(
             str(curated_path),
-            media_type="application/x-ndjson",
-            filename=f"transcripts_{job_id}_curated.jsonl",
+            media_type="application/gzip" if compressed else "application/x-ndjson",
+            filename=f"transcripts_{job_id}_curated.jsonl" + (".gz" if compressed else ""),
         )
 
     if format == "audio":
@@ -132,100 +260,40 @@ async def download_job(job_id: str, format: str = "json"):
             filename=f"transcripts_{job_id}_dpo.jsonl",
         )
 
-    transcripts = job_store.get_results(job_id)
-    if not transcripts:
+    if format not in EXPORT_FORMATS:
+        raise HTTPException(status_code=400, detail=f"Unsupported format: {format}. Supported: json, jsonl, csv, sft, sft_instruct, curated, audio, dpo")
+    if not job_store.has_results(job_id):
         raise HTTPException(status_code=404, detail="Job results not found")
 
-    if format == "json":
-        content = json.dumps(transcripts, indent=2)
-        return StreamingResponse(
-            io.StringIO(content),
-            media_type="application/json",
-            headers={"Content-Disposition": f"attachment; filename=transcripts_{job_id}.json"},
-        )
-    elif format == "jsonl":
-        lines = [json.dumps(t) for t in transcripts]
-        content = "\n".join(lines)
-        return StreamingResponse(
-            io.StringIO(content),
-            media_type="application/x-ndjson",
-            headers={"Content-Disposition": f"attachment; filename=transcripts_{job_id}.jsonl"},
-        )
-    elif format == "csv":
-        output = io.StringIO()
-        if transcripts:
-            flat_records = []
-            for t in transcripts:
-                qs = t.get("qualityScores") or {}
-                customer = t.get("customer") or {}
-                agent = t.get("agent") or {}
-                metadata = t.get("metadata") or {}
-                flat = {
-                    "id": t.get("id", ""),
-                    "industry": t.get("industry", ""),
-                    "scenario": t.get("scenario", ""),
-                    "language": t.get("language", "english"),
-                    "callType": t.get("callType", ""),
-                    "customerName": customer.get("name", ""),
-                    "customerAge": customer.get("age", ""),
-                    "customerSentiment": customer.get("sentiment", ""),
-                    "agentName": agent.get("name", ""),
-                    "agentExperience": agent.get("experienceLevel", ""),
-                    "conversationTurns": len(t.get("conversation") or []),
-                    "durationSeconds": metadata.get("durationSeconds", ""),
-                    "resolutionStatus": metadata.get("resolutionStatus", ""),
-                    "csatScore": metadata.get("csatScore", ""),
-                    "qualityOverall": qs.get("overall", ""),
-                    "qualityCoherence": qs.get("coherence", ""),
-                    "qualityDiversity": qs.get("diversity", ""),
-                    "createdAt": t.get("createdAt", ""),
-                }
-                flat_records.append(flat)
-
-            writer = csv.DictWriter(output, fieldnames=flat_records[0].keys())
-            writer.writeheader()
-            writer.writerows(flat_records)
-
-        return StreamingResponse(
-            io.StringIO(output.getvalue()),
-            media_type="text/csv",
-            headers={"Content-Disposition": f"attachment; filename=transcripts_{job_id}.csv"},
-        )
-    elif format == "sft":
-        # Supervised Fine-Tuning format: {prompt, response}
-        sft_records = [build_sft_record(t) for t in transcripts]
-        lines = [json.dumps(r) for r in sft_records]
-        content = "\n".join(lines)
-        return StreamingResponse(
-            io.StringIO(content),
-            media_type="application/x-ndjson",
-            headers={"Content-Disposition": f"attachment; filename=transcripts_{job_id}_sft.jsonl"},
-        )
-    elif format == "sft_instruct":
-        # Chat instruction tuning format with messages array
-        sft_records = [build_sft_instruct_record(t) for t in transcripts]
-        lines = [json.dumps(r) for r in sft_records]
-        content = "\n".join(lines)
-        return StreamingResponse(
-            io.StringIO(content),
-            media_type="application/x-ndjson",
-            headers={"Content-Disposition": f"attachment; filename=transcripts_{job_id}_sft_instruct.jsonl"},
-        )
-    else:
-        raise HTTPException(status_code=400, detail=f"Unsupported format: {format}. Supported: json, jsonl, csv, sft, sft_instruct, curated, audio, dpo")
+    # Records are read from the store a page at a time and encoded as they go,
+    # so the export is never materialised in memory as a whole.
+    _, media_type, suffix = EXPORT_FORMATS[format]
+    encoding = negotiate_encoding(request.headers.get("accept-encoding"))
+    headers = {
+        "Content-Disposition": f"attachment; filename=transcripts_{job_id}{suffix}",
+        "Vary": "Accept-Encoding",
+    }
+    if encoding:
+        headers["Content-Encoding"] = encoding
+    return StreamingResponse(
+        stream_export(job_store, job_id, format, encoding),
+        media_type=media_type,
+        headers=headers,
+    )
 
 
 # ─── Quality Scoring ─────────────────────────────────────────────────────────
 
 @router.post("/{job_id}/score")
-def score_job(job_id: str):
+async def score_job(job_id: str, use_cache: bool = True):
     """Score all transcripts in a job using LLM quality judge.
 
-    Defined as a sync handler so FastAPI runs it in a worker thread — the LLM
-    scoring makes sequential blocking HTTP calls and must not run on the event
-    loop, which would freeze all other requests (including status polling).
+    Requests to the judge run concurrently on the event loop (bounded by
+    SCORING_CONCURRENCY and SCORING_RATE_LIMIT); the store reads and writes
+    are blocking and run in a worker thread. Verdicts for conversations that
+    were already judged come from the judge cache unless ``use_cache=false``.
     """
-    transcripts = job_store.get_results(job_id)
+    transcripts = await asyncio.to_thread(job_store.get_results, job_id)
     if not transcripts:
         raise HTTPException(status_code=404, detail="Job results not found")
 
@@ -234,11 +302,21 @@ def score_job(job_id: str):
         raise HTTPException(status_code=400, detail="NVIDIA API key not configured")
 
     try:
-        from app.services.quality_scorer import QualityScorer
-        scorer = QualityScorer(api_key=settings.nvidia_api_key)
-        scored = scorer.score_batch(transcripts)
-        job_store.save_results(job_id, scored)
-        return {"message": f"Scored {len(scored)} transcripts", "job_id": job_id}
+        from app.services.quality_scorer import QualityScorer, get_judge_cache
+        scorer = QualityScorer(
+            api_key=settings.nvidia_api_key,
+            base_url=settings.nvidia_base_url,
+            max_concurrency=settings.scoring_concurrency,
+            requests_per_second=settings.scoring_rate_limit,
+            cache=get_judge_cache() if use_cache else None,
+        )
+        scored, summary = await scorer.score_batch_async(transcripts)
+        await asyncio.to_thread(job_store.save_results, job_id, scored)
+        return {
+            "message": f"Scored {len(scored)} transcripts",
+            "job_id": job_id,
+            "summary": summary.model_dump(by_alias=True),
+        }
     except Exception as e:
         logger.error(f"Quality scoring failed: {e}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -247,17 +325,22 @@ def score_job(job_id: str):
 # ─── Bias & Safety Report ────────────────────────────────────────────────────
 
 @router.get("/{job_id}/bias-report")
-def get_bias_report(job_id: str):
-    """Analyze transcripts for bias and safety issues."""
-    transcripts = job_store.get_results(job_id)
-    if not transcripts:
+def get_bias_report(job_id: str, request: Request):
+    """Analyze transcripts for bias and safety issues.
+
+    Cached per results version and served with an ETag (see _cached_report).
+    """
+    if not job_store.has_results(job_id):
         raise HTTPException(status_code=404, detail="Job results not found")
 
+    def build():
+        from app.services.bias_analyzer import BiasAccumulator
+        return BiasAccumulator().update(job_store.iter_results(job_id)).to_report().model_dump(by_alias=True)
+
     try:
-        from app.services.bias_analyzer import BiasAnalyzer
-        analyzer = BiasAnalyzer()
-        report = analyzer.analyze(transcripts)
-        return report.model_dump(by_alias=True)
+        return _cached_report(request, job_id, "bias", build)
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Bias analysis failed: {e}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -266,17 +349,21 @@ def get_bias_report(job_id: str):
 # ─── Statistics ──────────────────────────────────────────────────────────────
 
 @router.get("/{job_id}/statistics")
-def get_statistics(job_id: str):
-    """Compute dataset statistics for a completed job."""
-    transcripts = job_store.get_results(job_id)
-    if not transcripts:
-        raise HTTPException(status_code=404, detail="Job results not found")
+def get_statistics(job_id: str, request: Request):
+    """Dataset statistics for a completed job.
+
+    Read from the sketch the job store maintains as results are written, so
+    this does not touch the transcripts themselves; cached and served with an
+    ETag like the bias report.
+    """
+    def build():
+        sketch = job_store.get_stats_sketch(job_id)
+        return sketch.to_stats().model_dump(by_alias=True)
 
     try:
-        from app.services.statistics import StatisticsService
-        stats_service = StatisticsService()
-        stats = stats_service.compute(transcripts)
-        return stats.model_dump(by_alias=True)
+        return _cached_report(request, job_id, "statistics", build)
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Statistics computation failed: {e}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -288,6 +375,10 @@ class CurateRequest(BaseModel):
     min_quality_score: float = 0.0
     deduplicate: bool = True
     filter_pii: bool = True
+    # >1 shards the per-transcript stages (not dedup) across a process pool.
+    workers: int = Field(default=1, ge=1, le=32)
+    # Write the curated artifact as {job_id}_curated.jsonl.gz instead.
+    compress: bool = False
 
 
 @router.post("/{job_id}/curate")
@@ -303,18 +394,22 @@ def curate_job(job_id: str, request: CurateRequest):
         settings = get_settings()
         curator = NemoCurator()
         result = curator.curate(
-            transcripts=list(transcripts),  # copy to avoid mutating store
+            transcripts=transcripts,  # never mutated: curation is copy-on-write
             deduplicate=request.deduplicate,
             filter_pii=request.filter_pii,
             min_quality_score=request.min_quality_score,
             artifacts_dir=settings.artifact_path,
             job_id=job_id,
+            workers=request.workers,
+            compress=request.compress,
+            # Only counts are returned; survivors stream straight to the artifact.
+            include_transcripts=False,
         )
-        # Return result without the full transcript list (too large for response)
         return {
             "originalCount": result.original_count,
             "deduplicatedCount": result.deduplicated_count,
             "piiRemovedCount": result.pii_removed_count,
+            "piiCategoryCounts": result.pii_category_counts,
             "qualityFilteredCount": result.quality_filtered_count,
             "finalCount": result.final_count,
         }
@@ -325,98 +420,57 @@ def curate_job(job_id: str, request: CurateRequest):
 
 # ─── DPO Generation ──────────────────────────────────────────────────────────
 
-def _generate_dpo_background(job_id: str, transcripts: list[dict], api_key: str, artifact_path: Path):
-    """Background task to generate DPO dataset."""
-    try:
-        from openai import OpenAI
-        import json
+async def run_dpo_generation(job_id: str, restart: bool = False):
+    """Generate a job's DPO dataset (the queue's ``dpo`` task).
 
-        client = OpenAI(
-            api_key=api_key,
-            base_url="https://integrate.api.nvidia.com/v1",
-        )
+    Errors propagate so the queue can retry; a retry resumes from the
+    transcripts already written. The ``.error`` marker the download endpoint
+    reports is written by the worker once no attempts are left.
+    """
+    from app.services.dpo_generator import DPOGenerator
 
-        dpo_records = []
-        for t in transcripts:
-            turns = t.get("conversation", [])
-            if len(turns) < 2:
-                continue
-
-            # Build the prompt from all customer turns
-            customer_turns = [turn.get("text", "") for turn in turns if turn.get("speaker") == "customer"]
-            agent_turns = [turn.get("text", "") for turn in turns if turn.get("speaker") == "agent"]
-
-            if not customer_turns or not agent_turns:
-                continue
-
-            prompt_text = f"Customer inquiry in {t.get('industry', 'general')} ({t.get('scenario', 'general')}): {customer_turns[0]}"
-            chosen_response = " ".join(agent_turns)
-
-            # Generate a lower-quality "rejected" response
-            try:
-                reject_resp = client.chat.completions.create(
-                    model="meta/llama-3.1-8b-instruct",
-                    messages=[{
-                        "role": "user",
-                        "content": (
-                            f"You are a poor customer service agent. Give a brief, unhelpful, "
-                            f"slightly rude response to: {prompt_text}. Keep it under 50 words."
-                        ),
-                    }],
-                    temperature=0.8,
-                    max_tokens=100,
-                )
-                rejected_response = reject_resp.choices[0].message.content.strip()
-            except Exception:
-                rejected_response = "I don't know. You'll have to call back."
-
-            dpo_records.append({
-                "prompt": prompt_text,
-                "chosen": chosen_response[:500],
-                "rejected": rejected_response,
-                "metadata": {
-                    "industry": t.get("industry"),
-                    "scenario": t.get("scenario"),
-                    "language": t.get("language", "english"),
-                    "transcript_id": t.get("id"),
-                },
-            })
-
-        out_path = artifact_path / f"{job_id}_dpo.jsonl"
-        out_path.parent.mkdir(parents=True, exist_ok=True)
-        with open(out_path, "w", encoding="utf-8") as f:
-            for record in dpo_records:
-                f.write(json.dumps(record) + "\n")
-
-        # Clear any stale failure marker from a previous attempt.
-        err_path = artifact_path / f"{job_id}_dpo.error"
-        err_path.unlink(missing_ok=True)
-        logger.info(f"DPO dataset saved: {out_path} ({len(dpo_records)} records)")
-    except Exception as e:
-        logger.error(f"DPO generation background task failed: {e}")
-        _write_background_error(artifact_path, job_id, "dpo", e)
+    settings = get_settings()
+    transcripts = job_store.get_results(job_id)
+    if not transcripts:
+        raise RuntimeError("Job results not found")
+
+    generator = DPOGenerator(
+        api_key=settings.nvidia_api_key,
+        base_url=settings.nvidia_base_url,
+        max_concurrency=settings.dpo_concurrency,
+        requests_per_second=settings.dpo_rate_limit,
+    )
+    out_path = settings.artifact_path / f"{job_id}_dpo.jsonl"
+    summary = await generator.generate(transcripts, out_path, restart=restart)
+
+    # Clear any stale failure marker from a previous attempt.
+    err_path = settings.artifact_path / f"{job_id}_dpo.error"
+    err_path.unlink(missing_ok=True)
+    logger.info(f"DPO dataset saved: {out_path} ({summary})")
 
 
 @router.post("/{job_id}/generate-dpo")
-async def generate_dpo(job_id: str, background_tasks: BackgroundTasks):
-    """Generate DPO (chosen/rejected) dataset for a completed job."""
+async def generate_dpo(job_id: str, restart: bool = False):
+    """Queue DPO (chosen/rejected) dataset generation for a completed job.
+
+    An interrupted run resumes, skipping transcripts already written;
+    ``restart=true`` discards previous output and starts over.
+    """
     _validate_job_id(job_id)
-    transcripts = job_store.get_results(job_id)
-    if not transcripts:
+    if not job_store.has_results(job_id):
         raise HTTPException(status_code=404, detail="Job results not found")
 
     settings = get_settings()
     if not settings.nvidia_api_key:
         raise HTTPException(status_code=400, detail="NVIDIA API key not configured")
 
-    background_tasks.add_task(
-        _generate_dpo_background,
-        job_id=job_id,
-        transcripts=list(transcripts),
-        api_key=settings.nvidia_api_key,
-        artifact_path=settings.artifact_path,
-    )
-    return {"message": "DPO generation started in background", "job_id": job_id}
+    try:
+        task_id = task_queue.enqueue(
+            "dpo", job_id, {"restart": restart}, max_attempts=settings.task_max_attempts
+        )
+    except TaskConflict as e:
+        raise HTTPException(status_code=409, detail="DPO generation is already running with different options") from e
+    return {"message": "DPO generation queued", "job_id": job_id, "task_id": task_id}
 
 
 # ─── HuggingFace Upload ───────────────────────────────────────────────────────
@@ -461,41 +515,79 @@ def upload_to_hf(job_id: str, request: HFUploadRequest):
 
 # ─── Audio Generation ─────────────────────────────────────────────────────────
 
-def _generate_audio_background(job_id: str, transcripts: list[dict], riva_endpoint: str | None, artifact_path: Path):
-    """Background task to generate audio for all transcripts."""
-    try:
-        from app.services.audio_generator import AudioGenerator
-        generator = AudioGenerator(riva_endpoint=riva_endpoint)
-        generator.generate_batch_audio(transcripts, artifacts_dir=artifact_path, job_id=job_id)
-        (artifact_path / f"{job_id}_audio.error").unlink(missing_ok=True)
-        logger.info(f"Audio generation complete for job {job_id}")
-    except Exception as e:
-        logger.error(f"Audio generation background task failed: {e}")
-        _write_background_error(artifact_path, job_id, "audio", e)
+def run_audio_generation(
+    job_id: str,
+    audio_format: str = "wav",
+    use_cache: bool = True,
+    cancel: Optional[threading.Event] = None,
+):
+    """Generate audio for all of a job's transcripts (the queue's ``audio`` task).
+
+    Runs in a worker thread, which cancelling the awaiting task cannot stop;
+    the worker sets ``cancel`` instead and the run stops at the next
+    transcript. Errors propagate so the queue can retry.
+    """
+    import os
+    from app.services.audio_generator import AudioGenerator, get_tts_cache
+
+    settings = get_settings()
+    transcripts = job_store.get_results(job_id)
+    if not transcripts:
+        raise RuntimeError("Job results not found")
+
+    generator = AudioGenerator(
+        riva_endpoint=os.environ.get("RIVA_ENDPOINT"),
+        max_concurrency=settings.audio_concurrency,
+        cache=get_tts_cache() if use_cache else None,
+    )
+    generator.generate_batch_audio(
+        transcripts,
+        artifacts_dir=settings.artifact_path,
+        job_id=job_id,
+        audio_format=audio_format,
+        cancel=cancel,
+    )
+    (settings.artifact_path / f"{job_id}_audio.error").unlink(missing_ok=True)
+    logger.info(f"Audio generation complete for job {job_id}")
 
 
 @router.post("/{job_id}/generate-audio")
-async def generate_audio(job_id: str, background_tasks: BackgroundTasks):
-    """Generate audio files for all transcripts in a job (async)."""
+async def generate_audio(
+    job_id: str,
+    audio_format: str = "wav",
+    use_cache: bool = True,
+):
+    """Queue audio generation for all transcripts in a job.
+
+    ``audio_format=flac`` bundles lossless FLAC instead of WAV (needs the
+    optional soundfile package). Segments already synthesised for any job
+    come from the TTS cache unless ``use_cache=false``.
+    """
     _validate_job_id(job_id)
-    transcripts = job_store.get_results(job_id)
-    if not transcripts:
+    from app.services.audio_generator import AUDIO_BUNDLE_FORMATS
+    if audio_format not in AUDIO_BUNDLE_FORMATS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Unsupported audio format: {audio_format}. Supported: {', '.join(AUDIO_BUNDLE_FORMATS)}",
+        )
+    if not job_store.has_results(job_id):
         raise HTTPException(status_code=404, detail="Job results not found")
 
     import os
     riva_endpoint = os.environ.get("RIVA_ENDPOINT")
 
-    settings = get_settings()
-    background_tasks.add_task(
-        _generate_audio_background,
-        job_id=job_id,
-        transcripts=list(transcripts),
-        riva_endpoint=riva_endpoint,
-        artifact_path=settings.artifact_path,
-    )
+    try:
+        task_id = task_queue.enqueue(
+            "audio",
+            job_id,
+            {"audioFormat": audio_format, "useCache": use_cache},
+            max_attempts=get_settings().task_max_attempts,
+        )
+    except TaskConflict as e:
+        raise HTTPException(status_code=409, detail="Audio generation is already running with different options") from e
     return {
-        "message": "Audio generation started in background",
+        "message": "Audio generation queued",
         "job_id": job_id,
+        "task_id": task_id,
         "riva_available": riva_endpoint is not None,
     }
-
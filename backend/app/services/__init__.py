@@ -1,4 +1,19 @@
-from .transcript_generator import TranscriptGenerator
-from .job_store import JobStore, job_store
+import importlib
 
-__all__ = ["TranscriptGenerator", "JobStore", "job_store"]
+# Exports are imported on first access: importing one service (e.g. a curation
+# worker process importing app.services.nemo_curator) must not load Data
+# Designer or open the global job store.
+_EXPORTS = {
+    "TranscriptGenerator": "transcript_generator",
+    "JobStore": "job_store",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name: str):
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{_EXPORTS[name]}", __name__), name)
+    globals()[name] = value
+    return value
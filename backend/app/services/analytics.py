@@ -0,0 +1,155 @@
+"""Dataset analytics across many jobs at once."""
+
+import logging
+from collections import Counter, defaultdict
+
+from app.models.transcript import (
+    AnalyticsReport,
+    DedupOverlap,
+    JobAnalytics,
+    JobOverlap,
+    QualityDistribution,
+)
+from app.services.bias_analyzer import BiasAccumulator
+from app.services.job_store import JobStore
+from app.services.nemo_curator import (
+    NemoCurator,
+    _conversation_fingerprint,
+    _near_duplicate_mask,
+    near_duplicate_groups,
+)
+from app.services.statistics import StatsSketch
+
+logger = logging.getLogger(__name__)
+
+SECTIONS = ("statistics", "bias", "quality", "overlap")
+
+_QUALITY_BINS = [f"{lo}-{lo + 1}" for lo in range(10)]
+
+
+def _quality_distribution(values: Counter) -> QualityDistribution:
+    """Summarise a ``quality_overall -> count`` histogram (None = unscored)."""
+    bins = Counter()
+    scored = 0
+    total = 0.0
+    for value, n in values.items():
+        if value is None:
+            continue
+        scored += n
+        total += value * n
+        bins[_QUALITY_BINS[min(int(value), 9)]] += n
+    return QualityDistribution(
+        scored=scored,
+        unscored=values.get(None, 0),
+        meanOverall=round(total / scored, 2) if scored else 0.0,
+        histogram=[{"range": b, "count": bins.get(b, 0)} for b in _QUALITY_BINS],
+    )
+
+
+class DatasetAnalytics:
+    """Combines per-job aggregates into one report over a set of jobs.
+
+    Statistics come from each job's stored StatsSketch and quality figures
+    from the indexed quality column, so neither reads transcripts. Bias and
+    dedup overlap need the text: each job is streamed page by page in a
+    single pass that feeds a BiasAccumulator and keeps only the short dedup
+    fingerprints, so memory does not grow with transcript size.
+    """
+
+    def __init__(self, store: JobStore):
+        self.store = store
+
+    def analyze(self, job_ids: list[str], include=SECTIONS) -> AnalyticsReport:
+        include = set(include)
+        present, missing = [], []
+        for job_id in dict.fromkeys(job_ids):
+            (present if self.store.has_results(job_id) else missing).append(job_id)
+
+        per_job: dict[str, JobAnalytics] = {}
+        sketches: dict[str, StatsSketch] = {}
+        biases: dict[str, BiasAccumulator] = {}
+        qualities: dict[str, Counter] = {}
+        fingerprints: list[str] = []
+        owners: list[str] = []
+
+        for job_id in present:
+            if "statistics" in include:
+                sketches[job_id] = self.store.get_stats_sketch(job_id) or StatsSketch()
+            if "quality" in include:
+                qualities[job_id] = Counter(self.store.count_results_by(job_id, "quality_overall"))
+            if "bias" in include or "overlap" in include:
+                bias = BiasAccumulator()
+                for t in self.store.iter_results(job_id):
+                    if "bias" in include:
+                        bias.add(t)
+                    if "overlap" in include:
+                        fingerprints.append(_conversation_fingerprint(t))
+                        owners.append(job_id)
+                if "bias" in include:
+                    biases[job_id] = bias
+
+            per_job[job_id] = JobAnalytics(
+                statistics=sketches[job_id].to_stats() if job_id in sketches else None,
+                biasReport=biases[job_id].to_report() if job_id in biases else None,
+                qualityDistribution=_quality_distribution(qualities[job_id]) if job_id in qualities else None,
+            )
+
+        combined = JobAnalytics()
+        if "statistics" in include:
+            merged = StatsSketch()
+            for sketch in sketches.values():
+                merged = merged.merge(sketch)
+            combined.statistics = merged.to_stats()
+        if "bias" in include:
+            merged_bias = BiasAccumulator()
+            for bias in biases.values():
+                merged_bias = merged_bias.merge(bias)
+            combined.bias_report = merged_bias.to_report()
+        if "quality" in include:
+            combined.quality_distribution = _quality_distribution(sum(qualities.values(), Counter()))
+
+        return AnalyticsReport(
+            jobIds=present,
+            missingJobIds=missing,
+            combined=combined,
+            perJob=per_job,
+            dedupOverlap=self._overlap(fingerprints, owners) if "overlap" in include else None,
+        )
+
+    @staticmethod
+    def _overlap(fingerprints: list[str], owners: list[str]) -> DedupOverlap:
+        """Near-duplicate overlap between jobs, at the curator's similarity threshold.
+
+        ``combinedRemovable`` is what curation would drop if the jobs were
+        pooled; ``pairs`` counts, per ordered job pair, the transcripts of the
+        first job that have a near-duplicate in the second.
+        """
+        threshold = NemoCurator.SIMILARITY_THRESHOLD
+        report = DedupOverlap(threshold=threshold, transcriptsCompared=len(fingerprints))
+        if len(fingerprints) < 2:
+            return report
+
+        group_of, neighbours = near_duplicate_groups(fingerprints, threshold)
+        jobs_in_group: dict[int, set[str]] = defaultdict(set)
+        for group, owner in zip(group_of, owners):
+            jobs_in_group[group].add(owner)
+
+        pair_counts: Counter = Counter()
+        cross_job = 0
+        for group, owner in zip(group_of, owners):
+            others = set(jobs_in_group[group])
+            for near in neighbours[group]:
+                others |= jobs_in_group[near]
+            others.discard(owner)
+            if others:
+                cross_job += 1
+                for other in others:
+                    pair_counts[(owner, other)] += 1
+
+        report.cross_job_duplicates = cross_job
+        report.combined_removable = _near_duplicate_mask(fingerprints, threshold).count(False)
+        report.pairs = [
+            JobOverlap(jobId=a, otherJobId=b, transcripts=n)
+            for (a, b), n in sorted(pair_counts.items(), key=lambda item: -item[1])
+        ]
+        return report
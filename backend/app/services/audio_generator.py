@@ -2,10 +2,19 @@
 
 import io
 import logging
+import os
 import struct
-import wave
+import tempfile
+import threading
 import zipfile
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
+from types import SimpleNamespace
+
+from app.config import get_settings
+from app.services.disk_cache import DiskCache, content_key
 
 logger = logging.getLogger(__name__)
 
@@ -22,56 +31,179 @@ CUSTOMER_VOICES = {
 # Silence duration in seconds between turns
 SILENCE_DURATION = 0.5
 
+SAMPLE_RATE = 22050
+LANGUAGE_CODE = "en-US"
+
+class AudioCancelled(Exception):
+    """Raised by generate_batch_audio when its ``cancel`` event is set."""
+
+
+# Part of every TTS cache key; bump it if the synthesis request changes in a
+# way that alters the audio for the same (voice, language, rate, text).
+TTS_CACHE_VERSION = "1"
+
+
+def _normalize_text(text: str) -> str:
+    """Collapse whitespace so template phrases that differ only in spacing share audio."""
+    return " ".join(text.split())
+
+
+def tts_cache_key(voice: str, text: str) -> str:
+    """Content address of a synthesised segment's PCM."""
+    return content_key(
+        "riva", TTS_CACHE_VERSION, voice, LANGUAGE_CODE, str(SAMPLE_RATE), _normalize_text(text[:500]),
+    )
+
+
+@lru_cache
+def get_tts_cache() -> DiskCache:
+    """Process-wide synthesised-segment cache under the artifacts directory."""
+    settings = get_settings()
+    return DiskCache(
+        settings.artifact_path / "tts_cache.db",
+        max_bytes=settings.tts_cache_max_mb * 1024 * 1024,
+    )
+
+
+_WAVE_FORMAT_PCM = 1
+_WAV_HEADER = struct.Struct("<4sI4s4sIHHIIHH4sI")
+
+
+@lru_cache(maxsize=32)
+def _silence_pcm(duration_seconds: float, sample_rate: int = 22050, frame_bytes: int = 2) -> bytes:
+    """Raw zeroed PCM, built once per (duration, rate, frame size) and reused."""
+    return bytes(int(sample_rate * duration_seconds) * frame_bytes)
+
+
+def _wav_header(nchannels: int, sampwidth: int, framerate: int, data_bytes: int) -> bytes:
+    """Canonical 44-byte PCM WAV header, as written by the wave module."""
+    block_align = nchannels * sampwidth
+    return _WAV_HEADER.pack(
+        b"RIFF", 36 + data_bytes, b"WAVE",
+        b"fmt ", 16, _WAVE_FORMAT_PCM, nchannels, framerate, framerate * block_align, block_align, sampwidth * 8,
+        b"data", data_bytes,
+    )
+
 
 def _generate_silence_wav(duration_seconds: float, sample_rate: int = 22050) -> bytes:
-    """Generate a WAV file containing silence."""
-    num_samples = int(sample_rate * duration_seconds)
-    buf = io.BytesIO()
-    with wave.open(buf, "wb") as wf:
-        wf.setnchannels(1)
-        wf.setsampwidth(2)  # 16-bit
-        wf.setframerate(sample_rate)
-        wf.writeframes(b"\x00\x00" * num_samples)
-    return buf.getvalue()
+    """Generate a WAV file containing silence (mono, 16-bit)."""
+    pcm = _silence_pcm(duration_seconds, sample_rate)
+    return _wav_header(1, 2, sample_rate, len(pcm)) + pcm
 
 
-def _concat_wav_bytes(wav_list: list[bytes]) -> bytes:
-    """Concatenate multiple WAV byte objects into one WAV file."""
-    if not wav_list:
-        return _generate_silence_wav(0.1)
+def _read_pcm(wav_data: bytes) -> tuple[tuple[int, int, int], memoryview]:
+    """Parse a PCM WAV's chunks with struct.
 
-    all_frames = b""
+    Returns ``((nchannels, sampwidth, framerate), frames)`` where ``frames`` is
+    a memoryview into ``wav_data`` trimmed to whole frames, so nothing is copied.
+    """
+    view = memoryview(wav_data)
+    if len(view) < 12 or view[:4] != b"RIFF" or view[8:12] != b"WAVE":
+        raise ValueError("not a RIFF/WAVE file")
     params = None
-
+    pos = 12
+    while pos + 8 <= len(view):
+        chunk_id = bytes(view[pos:pos + 4])
+        (size,) = struct.unpack_from("<I", view, pos + 4)
+        body = pos + 8
+        if chunk_id == b"fmt ":
+            audio_format, nchannels, framerate, _, _, bits = struct.unpack_from("<HHIIHH", view, body)
+            if audio_format != _WAVE_FORMAT_PCM:
+                raise ValueError(f"unsupported WAV format {audio_format}")
+            params = (nchannels, (bits + 7) // 8, framerate)
+        elif chunk_id == b"data":
+            if params is None:
+                raise ValueError("data chunk before fmt chunk")
+            frame_bytes = params[0] * params[1]
+            available = min(size, len(view) - body)
+            return params, view[body:body + available - available % frame_bytes]
+        pos = body + size + (size & 1)  # chunks are word-aligned
+    raise ValueError("missing fmt or data chunk")
+
+
+def _collect_pcm(wav_list: list[bytes], gap_seconds: float = 0.0) -> tuple[tuple[int, int, int] | None, list]:
+    """Parse segments into frame views, appending ``gap_seconds`` of silence after each.
+
+    Concatenating raw frames only works if the audio format matches. A
+    segment at a different channel count / sample width / sample rate would
+    play back as garbled/chipmunk audio under the first segment's header, so
+    mismatched segments are skipped instead. The silence gap is rendered in
+    the output format from a cached buffer rather than parsed from a WAV.
+    """
+    params = None
+    frames = []
     for wav_data in wav_list:
-        buf = io.BytesIO(wav_data)
         try:
-            with wave.open(buf, "rb") as wf:
-                seg_params = wf.getparams()
-                if params is None:
-                    params = seg_params
-                # Concatenating raw frames only works if the audio format matches.
-                # A segment at a different channel count / sample width / sample
-                # rate would play back as garbled/chipmunk audio under the first
-                # segment's header, so skip mismatched segments instead.
-                elif seg_params[:3] != params[:3]:
-                    logger.warning(
-                        "Skipping WAV segment with mismatched format %s (expected %s)",
-                        seg_params[:3], params[:3],
-                    )
-                    continue
-                all_frames += wf.readframes(wf.getnframes())
-        except Exception as e:
+            seg_params, pcm = _read_pcm(wav_data)
+        except (ValueError, struct.error) as e:
             logger.warning(f"Could not read WAV segment: {e}")
+            continue
+        if params is None:
+            params = seg_params
+        elif seg_params != params:
+            logger.warning(
+                "Skipping WAV segment with mismatched format %s (expected %s)",
+                seg_params, params,
+            )
+            continue
+        frames.append(pcm)
+        if gap_seconds:
+            frames.append(_silence_pcm(gap_seconds, params[2], params[0] * params[1]))
+    return params, frames
+
+
+def _render_wav(params: tuple[int, int, int], frames: list) -> bytes:
+    """Build a WAV file from frame buffers with a single copy into a buffer
+    preallocated at the final size, so assembly is linear in the audio length."""
+    data_bytes = sum(len(f) for f in frames)
+    header = _wav_header(*params, data_bytes)
+    out = bytearray(len(header) + data_bytes)
+    out[:len(header)] = header
+    pos = len(header)
+    for f in frames:
+        out[pos:pos + len(f)] = f
+        pos += len(f)
+    return bytes(out)
+
+
+def _write_wav(fp, params: tuple[int, int, int], frames: list) -> None:
+    """Stream a WAV file to ``fp``: the header is computed up front from the
+    frame lengths, so no part of the file is ever joined in memory."""
+    fp.write(_wav_header(*params, sum(len(f) for f in frames)))
+    for f in frames:
+        fp.write(f)
+
+
+def _encode_flac(params: tuple[int, int, int], frames: list) -> bytes:
+    """Encode PCM frames as FLAC (lossless) with the optional soundfile package."""
+    try:
+        import numpy as np
+        import soundfile as sf
+    except ImportError:
+        raise RuntimeError("soundfile package required for FLAC audio bundles (pip install '.[flac]')")
+    nchannels, sampwidth, framerate = params
+    if sampwidth != 2:
+        raise RuntimeError(f"FLAC bundles support 16-bit PCM only, got {sampwidth * 8}-bit")
+    samples = np.frombuffer(b"".join(frames), dtype="<i2").reshape(-1, nchannels)
+    buf = io.BytesIO()
+    sf.write(buf, samples, framerate, format="FLAC", subtype="PCM_16")
+    return buf.getvalue()
+
 
+# Bundle member encoders: format -> (file suffix, zip compression).
+# PCM barely deflates and FLAC is already compressed, so both are stored.
+AUDIO_BUNDLE_FORMATS = {
+    "wav": (".wav", zipfile.ZIP_STORED),
+    "flac": (".flac", zipfile.ZIP_STORED),
+}
+
+
+def _concat_wav_bytes(wav_list: list[bytes], gap_seconds: float = 0.0) -> bytes:
+    """Concatenate multiple WAV byte objects into one WAV file."""
+    params, frames = _collect_pcm(wav_list, gap_seconds)
     if params is None:
         return _generate_silence_wav(0.1)
-
-    out_buf = io.BytesIO()
-    with wave.open(out_buf, "wb") as wf:
-        wf.setparams(params)
-        wf.writeframes(all_frames)
-    return out_buf.getvalue()
+    return _render_wav(params, frames)
 
 
 class AudioGenerator:
@@ -80,11 +212,36 @@ class AudioGenerator:
 
     Requires RIVA_ENDPOINT environment variable to be set.
     Falls back to placeholder WAV files if Riva is not available.
+
+    Turns are synthesised on a thread pool sharing one gRPC channel (channels
+    multiplex concurrent calls), so at most ``max_concurrency`` Synthesize
+    requests are in flight across all turns and transcripts. ``stub`` injects
+    a ready-made SpeechSynthesisServiceStub, e.g. a local fake in tests.
+
+    With a ``cache``, segment PCM is looked up by (voice, language, rate,
+    normalised text) before calling Riva, and identical turns scheduled while
+    one is still in flight share its result. Placeholder silence comes only
+    from the in-memory ``_silence_pcm`` cache and never touches ``cache`` or
+    its hit/miss counters; silence substituted for a failed Riva call is
+    never stored.
     """
 
-    def __init__(self, riva_endpoint: str | None = None):
+    def __init__(
+        self,
+        riva_endpoint: str | None = None,
+        max_concurrency: int = 8,
+        stub=None,
+        cache: DiskCache | None = None,
+    ):
         self.riva_endpoint = riva_endpoint
-        self._riva_client = None
+        self.max_concurrency = max_concurrency
+        self.cache = cache
+        self._riva_client = stub
+        self._client_lock = threading.Lock()
+        self._inflight: dict[tuple[str, str], Future] = {}
+        self._stats_lock = threading.Lock()
+        self.cache_hits = 0
+        self.cache_misses = 0
 
     def _get_riva_client(self):
         """Get or create Riva TTS client."""
@@ -94,57 +251,100 @@ class AudioGenerator:
         if not self.riva_endpoint:
             return None
 
+        with self._client_lock:
+            if self._riva_client is not None:
+                return self._riva_client
+            try:
+                import riva.client
+                auth = riva.client.Auth(uri=self.riva_endpoint)
+                self._riva_client = riva.client.SpeechSynthesisServiceStub(auth.channel)
+                return self._riva_client
+            except ImportError:
+                logger.warning("nvidia-riva-client not installed. Using placeholder audio.")
+                return None
+            except Exception as e:
+                logger.warning(f"Could not connect to Riva at {self.riva_endpoint}: {e}")
+                return None
+
+    @staticmethod
+    def _build_request(text: str, voice: str):
+        fields = dict(
+            text=text[:500],  # Truncate very long turns
+            language_code=LANGUAGE_CODE,
+            sample_rate_hz=SAMPLE_RATE,
+            voice_name=voice,
+        )
         try:
             import riva.client
-            auth = riva.client.Auth(uri=self.riva_endpoint)
-            self._riva_client = riva.client.SpeechSynthesisServiceStub(auth.channel)
-            return self._riva_client
         except ImportError:
-            logger.warning("nvidia-riva-client not installed. Using placeholder audio.")
-            return None
-        except Exception as e:
-            logger.warning(f"Could not connect to Riva at {self.riva_endpoint}: {e}")
+            # Only reachable with an injected stub.
+            return SimpleNamespace(encoding="LINEAR_PCM", **fields)
+        return riva.client.SynthesizeSpeechRequest(encoding=riva.client.AudioEncoding.LINEAR_PCM, **fields)
+
+    def _cached_pcm(self, key: str) -> bytes | None:
+        if self.cache is None:
             return None
+        pcm = self.cache.get(key)
+        with self._stats_lock:
+            if pcm is None:
+                self.cache_misses += 1
+            else:
+                self.cache_hits += 1
+        return pcm
+
+    def _store_pcm(self, key: str, pcm: bytes):
+        if self.cache is not None:
+            self.cache.put(key, pcm)
+
+    def cache_stats(self) -> dict:
+        """Segment lookups served from the cache (or a shared in-flight call) vs synthesised."""
+        with self._stats_lock:
+            lookups = self.cache_hits + self.cache_misses
+            return {
+                "hits": self.cache_hits,
+                "misses": self.cache_misses,
+                "hitRate": round(self.cache_hits / lookups, 3) if lookups else 0.0,
+            }
 
     def _synthesize_turn(self, text: str, voice: str) -> bytes:
-        """Synthesize a single turn of speech. Returns WAV bytes."""
+        """Synthesize a single turn of speech. Returns WAV bytes. Thread-safe."""
         client = self._get_riva_client()
 
         if client is not None:
-            try:
-                import riva.client
-                req = riva.client.SynthesizeSpeechRequest(
-                    text=text[:500],  # Truncate very long turns
-                    language_code="en-US",
-                    encoding=riva.client.AudioEncoding.LINEAR_PCM,
-                    sample_rate_hz=22050,
-                    voice_name=voice,
-                )
-                resp = client.Synthesize(req)
+            key = tts_cache_key(voice, text)
+            pcm = self._cached_pcm(key)
+            if pcm is None:
+                try:
+                    pcm = client.Synthesize(self._build_request(text, voice)).audio
+                    self._store_pcm(key, pcm)
+                except Exception as e:
+                    logger.warning(f"Riva synthesis failed: {e}")
+            if pcm is not None:
                 # Wrap raw PCM in WAV container
-                buf = io.BytesIO()
-                with wave.open(buf, "wb") as wf:
-                    wf.setnchannels(1)
-                    wf.setsampwidth(2)
-                    wf.setframerate(22050)
-                    wf.writeframes(resp.audio)
-                return buf.getvalue()
-            except Exception as e:
-                logger.warning(f"Riva synthesis failed: {e}")
+                return _wav_header(1, 2, SAMPLE_RATE, len(pcm)) + pcm
 
         # Fallback: generate silence placeholder of appropriate length
-        # Approximate: 150 words per minute, 5 chars per word
-        estimated_duration = max(0.5, len(text) / (150 * 5) * 60)
-        return _generate_silence_wav(min(estimated_duration, 30))
+        # Approximate: 150 words per minute, 5 chars per word. Placeholders
+        # never touch the disk cache or its hit/miss counters: they are
+        # cheaper to rebuild than to look up, and would evict real segments.
+        duration = min(max(0.5, len(text) / (150 * 5) * 60), 30)
+        pcm = _silence_pcm(duration, SAMPLE_RATE)
+        return _wav_header(1, 2, SAMPLE_RATE, len(pcm)) + pcm
 
-    def generate_transcript_audio(self, transcript: dict) -> bytes:
-        """Generate a single audio file for a transcript. Returns WAV bytes."""
+    def _submit_transcript(self, pool: ThreadPoolExecutor, transcript: dict) -> list[Future]:
+        """Schedule every non-empty turn of a transcript; futures are in turn order.
+
+        A turn identical to one still in flight reuses that call's future.
+        """
+        # Sharing an in-flight placeholder is not a cache hit; only count real synthesis.
+        count_hits = self._get_riva_client() is not None
         customer_sentiment = transcript.get("customer", {}).get("sentiment", "neutral")
         customer_voice = CUSTOMER_VOICES.get(customer_sentiment, CUSTOMER_VOICES["neutral"])
 
-        silence = _generate_silence_wav(SILENCE_DURATION)
-        segments = []
+        if len(self._inflight) > 4 * self.max_concurrency:
+            self._inflight = {k: f for k, f in self._inflight.items() if not f.done()}
 
+        futures = []
         for turn in transcript.get("conversation", []):
             speaker = turn.get("speaker", "agent")
             text = turn.get("text", "")
@@ -152,35 +352,121 @@ class AudioGenerator:
                 continue
 
             voice = AGENT_VOICE if speaker == "agent" else customer_voice
-            audio_segment = self._synthesize_turn(text, voice)
-            segments.append(audio_segment)
-            segments.append(silence)
+            future = self._inflight.get((voice, text))
+            if future is not None and not future.done():
+                if count_hits:
+                    with self._stats_lock:
+                        self.cache_hits += 1
+            else:
+                future = pool.submit(self._synthesize_turn, text, voice)
+                self._inflight[(voice, text)] = future
+            futures.append(future)
+        return futures
+
+    @staticmethod
+    def _assemble(futures: list[Future]) -> tuple[tuple[int, int, int], list]:
+        """Collect a transcript's frames in turn order with silence between turns."""
+        if not futures:
+            return (1, 2, SAMPLE_RATE), [_silence_pcm(1.0, SAMPLE_RATE)]
+
+        params, frames = _collect_pcm([future.result() for future in futures], gap_seconds=SILENCE_DURATION)
+        if params is None:
+            return (1, 2, SAMPLE_RATE), [_silence_pcm(0.1, SAMPLE_RATE)]
+        return params, frames
 
-        if not segments:
-            return _generate_silence_wav(1.0)
+    def generate_transcript_audio(self, transcript: dict) -> bytes:
+        """Generate a single audio file for a transcript. Returns WAV bytes."""
+        self._get_riva_client()
+        with ThreadPoolExecutor(max_workers=self.max_concurrency) as pool:
+            return _render_wav(*self._assemble(self._submit_transcript(pool, transcript)))
+
+    def _iter_assembled(self, transcripts: list[dict]):
+        """Yield ``(transcript, params, frames)`` in input order.
 
-        return _concat_wav_bytes(segments)
+        Turns from upcoming transcripts are scheduled while earlier ones are
+        still being synthesised, keeping about twice ``max_concurrency`` turns
+        queued so the pool never idles at transcript boundaries while memory
+        stays bounded to a small window of transcripts.
+        """
+        self._get_riva_client()  # connect once, before the workers share it
+        target = 2 * self.max_concurrency
+        upcoming = iter(transcripts)
+        window: deque = deque()
+        queued = 0
+        with ThreadPoolExecutor(max_workers=self.max_concurrency) as pool:
+            while True:
+                while queued < target:
+                    transcript = next(upcoming, None)
+                    if transcript is None:
+                        break
+                    futures = self._submit_transcript(pool, transcript)
+                    window.append((transcript, futures))
+                    queued += len(futures)
+                if not window:
+                    return
+                transcript, futures = window.popleft()
+                queued -= len(futures)
+                yield (transcript, *self._assemble(futures))
+
+    def iter_transcript_audio(self, transcripts: list[dict]):
+        """Yield ``(transcript, wav_bytes)`` in input order."""
+        for transcript, params, frames in self._iter_assembled(transcripts):
+            yield transcript, _render_wav(params, frames)
 
     def generate_batch_audio(
         self,
         transcripts: list[dict],
         artifacts_dir: Path,
         job_id: str,
+        audio_format: str = "wav",
+        cancel: threading.Event | None = None,
     ) -> Path:
         """
         Generate audio for all transcripts in a batch.
-        Returns path to the ZIP file containing all WAV files.
+        Returns path to the ZIP file containing one file per transcript.
+
+        WAV members are streamed straight into the archive segment by segment
+        rather than built in memory first; ``audio_format="flac"`` stores
+        FLAC-encoded members instead (requires soundfile). The archive is
+        written to a temp file of its own next to the final path and renamed
+        into place when complete, so concurrent runs never share a file.
+        ``cancel`` is checked between transcripts and before the rename; once
+        set, the temp file is removed and AudioCancelled is raised.
         """
+        if audio_format not in AUDIO_BUNDLE_FORMATS:
+            raise ValueError(f"Unsupported audio format: {audio_format}")
+        suffix, compression = AUDIO_BUNDLE_FORMATS[audio_format]
+
         zip_path = artifacts_dir / f"{job_id}_audio.zip"
         zip_path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=zip_path.parent, prefix=f".{zip_path.name}.", suffix=".tmp")
+        os.close(fd)
+        tmp_path = Path(tmp_name)
 
-        with zipfile.ZipFile(zip_path, "w", zipfile.ZIP_DEFLATED) as zf:
-            for i, transcript in enumerate(transcripts):
-                transcript_id = transcript.get("id", f"transcript_{i}")
-                logger.info(f"Generating audio for transcript {transcript_id} ({i+1}/{len(transcripts)})")
-
-                wav_bytes = self.generate_transcript_audio(transcript)
-                wav_filename = f"{transcript_id}.wav"
-                zf.writestr(wav_filename, wav_bytes)
+        def check_cancelled():
+            if cancel is not None and cancel.is_set():
+                raise AudioCancelled(f"Audio generation for job {job_id} was cancelled")
 
+        try:
+            with zipfile.ZipFile(tmp_path, "w", compression) as zf:
+                for i, (transcript, params, frames) in enumerate(self._iter_assembled(transcripts)):
+                    check_cancelled()
+                    transcript_id = transcript.get("id", f"transcript_{i}")
+                    logger.info(f"Generated audio for transcript {transcript_id} ({i+1}/{len(transcripts)})")
+
+                    member = f"{transcript_id}{suffix}"
+                    if audio_format == "flac":
+                        zf.writestr(member, _encode_flac(params, frames))
+                    else:
+                        data_bytes = 44 + sum(len(f) for f in frames)
+                        with zf.open(member, "w", force_zip64=data_bytes >= zipfile.ZIP64_LIMIT) as out:
+                            _write_wav(out, params, frames)
+            check_cancelled()
+            tmp_path.replace(zip_path)
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            raise
+
+        if self.cache is not None:
+            logger.info(f"TTS segment cache for job {job_id}: {self.cache_stats()}")
         return zip_path
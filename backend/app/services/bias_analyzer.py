@@ -2,7 +2,10 @@
 
 import re
 import logging
+from bisect import bisect_left
 from collections import Counter
+from dataclasses import dataclass, field
+from itertools import islice
 from app.models.transcript import BiasReport
 
 logger = logging.getLogger(__name__)
@@ -30,24 +33,75 @@ AFRICAN_NAMES = {"jackson", "washington", "johnson", "williams", "davis", "adeba
                  "nkosi", "amara", "kofi", "kwame", "ama", "abebe"}
 
 
+_WORD_RE = re.compile(r"\b\w+\b")
+_SAFETY_RES = [re.compile(pattern, re.IGNORECASE) for pattern in OFFENSIVE_PATTERNS]
+# Every safety match starts with a word from its pattern's first group, so a
+# turn whose lower-cased text contains none of these cannot match.
+_SAFETY_TRIGGERS = tuple(
+    word
+    for pattern in OFFENSIVE_PATTERNS
+    for word in re.search(r"\(([^()]*)\)", pattern).group(1).split("|")
+)
+# On ASCII text \w is [A-Za-z0-9_]: mapping every other character to a space
+# and splitting yields exactly the tokens _WORD_RE finds, without the regex.
+_ASCII_NON_WORD = str.maketrans({
+    chr(c): " " for c in range(128) if not (chr(c).isalnum() or chr(c) == "_")
+})
+_BATCH_SEP = "\x00"
+
+
+def _pronoun_counts(lowered: list[str]) -> tuple[int, int]:
+    """Male and female pronoun totals over already lower-cased texts."""
+    words: list[str] = []
+    ascii_texts = []
+    for text in lowered:
+        if text.isascii():
+            ascii_texts.append(text)
+        else:
+            words.extend(_WORD_RE.findall(text))
+    words.extend(" ".join(ascii_texts).translate(_ASCII_NON_WORD).split())
+    male = sum(words.count(w) for w in MALE_PRONOUNS)
+    female = sum(words.count(w) for w in FEMALE_PRONOUNS)
+    return male, female
+
+
 def _extract_pronouns(text: str) -> tuple[int, int]:
     """Count male vs female pronoun occurrences."""
-    words = re.findall(r"\b\w+\b", text.lower())
-    male = sum(1 for w in words if w in MALE_PRONOUNS)
-    female = sum(1 for w in words if w in FEMALE_PRONOUNS)
-    return male, female
+    return _pronoun_counts([text.lower()])
 
 
 def _check_safety(text: str) -> list[str]:
     """Return list of safety flags found in text."""
     flags = []
-    for pattern in OFFENSIVE_PATTERNS:
-        matches = re.findall(pattern, text, re.IGNORECASE)
+    for pattern, regex in zip(OFFENSIVE_PATTERNS, _SAFETY_RES):
+        matches = regex.findall(text)
         if matches:
             flags.append(f"Pattern '{pattern}' matched: {matches[:2]}")
     return flags
 
 
+def _safety_candidates(lowered: list[str]) -> list[int]:
+    """Indices of the turns that may match a safety pattern, in order.
+
+    Trigger words are located with str.find over all turns joined by NUL, so
+    only these turns need the regexes. Non-ASCII turns are always included,
+    as IGNORECASE folds a few characters (e.g. U+017F) that lower() keeps.
+    """
+    candidates = {i for i, text in enumerate(lowered) if not text.isascii()}
+    ends = []
+    pos = -1
+    for text in lowered:
+        pos += len(text) + 1
+        ends.append(pos)
+    joined = _BATCH_SEP.join(lowered)
+    for word in _SAFETY_TRIGGERS:
+        found = joined.find(word)
+        while found != -1:
+            candidates.add(bisect_left(ends, found))
+            found = joined.find(word, found + 1)
+    return sorted(candidates)
+
+
 def _name_origin_label(name: str) -> str:
     # Match on whole name tokens, not substrings. Substring matching wrongly
     # classifies e.g. "linda" as asian (contains "li") or "diana" as hispanic
@@ -62,11 +116,120 @@ def _name_origin_label(name: str) -> str:
     return "western"
 
 
-class BiasAnalyzer:
-    """Analyzes a batch of transcripts for bias and safety issues."""
+# Safety flags kept verbatim in a report; the grade still counts all of them.
+MAX_REPORTED_FLAGS = 20
 
-    def analyze(self, transcripts: list[dict]) -> BiasReport:
-        if not transcripts:
+# Transcripts BiasAccumulator.update scans together: enough for the batched
+# pronoun and trigger-word scans to pay off, few enough to bound memory.
+UPDATE_BATCH_SIZE = 200
+
+
+@dataclass
+class BiasAccumulator:
+    """Mergeable running totals behind a BiasReport.
+
+    Pronoun counts, sentiment and name-origin Counters and the flag count are
+    plain sums, and the reported flags keep the first MAX_REPORTED_FLAGS in
+    input order, so accumulating a job's transcripts in pages, or merging the
+    accumulators of several jobs, yields the same report as one pass.
+    """
+
+    total: int = 0
+    agent_male: int = 0
+    agent_female: int = 0
+    customer_male: int = 0
+    customer_female: int = 0
+    sentiment: Counter = field(default_factory=Counter)
+    name_origins: Counter = field(default_factory=Counter)
+    flag_count: int = 0
+    flags: list[str] = field(default_factory=list)
+
+    def add(self, t: dict):
+        """Fold one transcript into the totals."""
+        self._update_batch([t])
+
+    def _add_flags(self, flags: list[str]):
+        self.flag_count += len(flags)
+        room = MAX_REPORTED_FLAGS - len(self.flags)
+        if room > 0:
+            self.flags.extend(flags[:room])
+
+    def update(self, transcripts) -> "BiasAccumulator":
+        """Fold transcripts into the totals.
+
+        ``transcripts`` may be any iterable, e.g. JobStore.iter_results: it
+        is consumed UPDATE_BATCH_SIZE transcripts at a time, so only one
+        batch and its turn texts are held in memory.
+        """
+        transcripts = iter(transcripts)
+        while batch := list(islice(transcripts, UPDATE_BATCH_SIZE)):
+            self._update_batch(batch)
+        return self
+
+    def _update_batch(self, transcripts: list[dict]):
+        """Each turn is lower-cased once; pronouns are counted over one token
+        list per speaker role, and only turns containing a safety trigger
+        word are run through the safety patterns.
+        """
+        texts: list[str] = []
+        lowered: list[str] = []
+        agent_lowered: list[str] = []
+        customer_lowered: list[str] = []
+        for t in transcripts:
+            for turn in t.get("conversation", []):
+                text = turn.get("text", "")
+                low = text.lower()
+                texts.append(text)
+                lowered.append(low)
+                (agent_lowered if turn.get("speaker") == "agent" else customer_lowered).append(low)
+
+        # --- Gender bias ---
+        male, female = _pronoun_counts(agent_lowered)
+        self.agent_male += male
+        self.agent_female += female
+        male, female = _pronoun_counts(customer_lowered)
+        self.customer_male += male
+        self.customer_female += female
+
+        candidates = iter(_safety_candidates(lowered))
+        candidate = next(candidates, None)
+        turn_end = 0
+        for t in transcripts:
+            self.total += 1
+
+            # --- Sentiment distribution ---
+            self.sentiment[t.get("customer", {}).get("sentiment", "unknown")] += 1
+
+            # --- Demographic diversity ---
+            customer_name = t.get("customer", {}).get("name", "")
+            agent_name = t.get("agent", {}).get("name", "")
+            self.name_origins[_name_origin_label(customer_name)] += 1
+            self.name_origins[_name_origin_label(agent_name)] += 1
+
+            # --- Safety flags ---
+            turn_end += len(t.get("conversation", []))
+            while candidate is not None and candidate < turn_end:
+                flags = _check_safety(texts[candidate])
+                if flags:
+                    self._add_flags([f"Transcript {t.get('id', '?')[:8]}: {flag}" for flag in flags])
+                candidate = next(candidates, None)
+
+    def merge(self, other: "BiasAccumulator") -> "BiasAccumulator":
+        """Return the accumulator of both transcript sets, ``self`` first."""
+        return BiasAccumulator(
+            total=self.total + other.total,
+            agent_male=self.agent_male + other.agent_male,
+            agent_female=self.agent_female + other.agent_female,
+            customer_male=self.customer_male + other.customer_male,
+            customer_female=self.customer_female + other.customer_female,
+            sentiment=self.sentiment + other.sentiment,
+            name_origins=self.name_origins + other.name_origins,
+            flag_count=self.flag_count + other.flag_count,
+            flags=(self.flags + other.flags)[:MAX_REPORTED_FLAGS],
+        )
+
+    def to_report(self) -> BiasReport:
+        if not self.total:
             return BiasReport(
                 genderBiasScore=0.0,
                 sentimentDistribution={},
@@ -76,55 +239,19 @@ class BiasAnalyzer:
                 totalAnalyzed=0,
             )
 
-        # --- Gender bias ---
-        agent_male = agent_female = 0
-        customer_male = customer_female = 0
-
-        for t in transcripts:
-            for turn in t.get("conversation", []):
-                text = turn.get("text", "")
-                m, f = _extract_pronouns(text)
-                if turn.get("speaker") == "agent":
-                    agent_male += m
-                    agent_female += f
-                else:
-                    customer_male += m
-                    customer_female += f
-
-        total_gendered = agent_male + agent_female + customer_male + customer_female
+        total_gendered = self.agent_male + self.agent_female + self.customer_male + self.customer_female
         if total_gendered > 0:
             # Bias = deviation from 50/50 split
-            male_ratio = (agent_male + customer_male) / total_gendered
+            male_ratio = (self.agent_male + self.customer_male) / total_gendered
             gender_bias = abs(male_ratio - 0.5) * 2  # 0=balanced, 1=all one gender
         else:
             gender_bias = 0.0
 
-        # --- Sentiment distribution ---
-        sentiment_counts = Counter(
-            t.get("customer", {}).get("sentiment", "unknown") for t in transcripts
-        )
-
-        # --- Demographic diversity ---
-        name_origins = Counter()
-        for t in transcripts:
-            customer_name = t.get("customer", {}).get("name", "")
-            agent_name = t.get("agent", {}).get("name", "")
-            name_origins[_name_origin_label(customer_name)] += 1
-            name_origins[_name_origin_label(agent_name)] += 1
-
-        num_categories = len([v for v in name_origins.values() if v > 0])
+        num_categories = len([v for v in self.name_origins.values() if v > 0])
         diversity_score = min(num_categories / 4.0, 1.0)  # 4 = max categories
 
-        # --- Safety flags ---
-        all_flags = []
-        for t in transcripts:
-            for turn in t.get("conversation", []):
-                flags = _check_safety(turn.get("text", ""))
-                if flags:
-                    all_flags.extend([f"Transcript {t.get('id', '?')[:8]}: {flag}" for flag in flags])
-
         # --- Overall grade ---
-        penalty = gender_bias * 3 + (len(all_flags) * 0.5) + max(0, (1 - diversity_score) * 2)
+        penalty = gender_bias * 3 + (self.flag_count * 0.5) + max(0, (1 - diversity_score) * 2)
         if penalty < 0.5:
             grade = "A"
         elif penalty < 1.5:
@@ -138,9 +265,16 @@ class BiasAnalyzer:
 
         return BiasReport(
             genderBiasScore=round(gender_bias, 3),
-            sentimentDistribution=dict(sentiment_counts),
+            sentimentDistribution=dict(self.sentiment),
             demographicDiversityScore=round(diversity_score, 3),
-            safetyFlags=all_flags[:20],  # Cap at 20 flags
+            safetyFlags=self.flags,
             overallFairnessGrade=grade,
-            totalAnalyzed=len(transcripts),
+            totalAnalyzed=self.total,
         )
+
+
+class BiasAnalyzer:
+    """Analyzes a batch of transcripts for bias and safety issues."""
+
+    def analyze(self, transcripts: list[dict]) -> BiasReport:
+        return BiasAccumulator().update(transcripts).to_report()
@@ -1,7 +1,8 @@
 """Shared converters from transcript dicts to fine-tuning dataset records.
 
 Used by both the download endpoints and the HuggingFace uploader so the two
-paths always emit identical SFT formats.
+paths always emit identical SFT formats. Every converter works on a single
+transcript so exports can be streamed record by record.
 """
 
 
@@ -62,3 +63,41 @@ def build_sft_instruct_record(transcript: dict) -> dict:
         messages.append({"role": role, "content": turn.get("text", "")})
 
     return {"messages": messages}
+
+
+# Column order of the flat CSV export.
+CSV_FIELDS = [
+    "id", "industry", "scenario", "language", "callType",
+    "customerName", "customerAge", "customerSentiment",
+    "agentName", "agentExperience", "conversationTurns",
+    "durationSeconds", "resolutionStatus", "csatScore",
+    "qualityOverall", "qualityCoherence", "qualityDiversity", "createdAt",
+]
+
+
+def build_csv_row(transcript: dict) -> dict:
+    """Flatten a transcript into one CSV row keyed by CSV_FIELDS."""
+    qs = transcript.get("qualityScores") or {}
+    customer = transcript.get("customer") or {}
+    agent = transcript.get("agent") or {}
+    metadata = transcript.get("metadata") or {}
+    return {
+        "id": transcript.get("id", ""),
+        "industry": transcript.get("industry", ""),
+        "scenario": transcript.get("scenario", ""),
+        "language": transcript.get("language", "english"),
+        "callType": transcript.get("callType", ""),
+        "customerName": customer.get("name", ""),
+        "customerAge": customer.get("age", ""),
+        "customerSentiment": customer.get("sentiment", ""),
+        "agentName": agent.get("name", ""),
+        "agentExperience": agent.get("experienceLevel", ""),
+        "conversationTurns": len(transcript.get("conversation") or []),
+        "durationSeconds": metadata.get("durationSeconds", ""),
+        "resolutionStatus": metadata.get("resolutionStatus", ""),
+        "csatScore": metadata.get("csatScore", ""),
+        "qualityOverall": qs.get("overall", ""),
+        "qualityCoherence": qs.get("coherence", ""),
+        "qualityDiversity": qs.get("diversity", ""),
+        "createdAt": transcript.get("createdAt", ""),
+    }
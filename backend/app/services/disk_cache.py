@@ -0,0 +1,180 @@
+"""Persistent size-capped LRU cache backed by SQLite.
+
+Used to memoise expensive remote calls (LLM judge verdicts, TTS segments)
+across requests and restarts. Keys are caller-computed content hashes; values
+are opaque bytes.
+"""
+
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterable, Optional
+
+# A hit only rewrites its entry's last_access when the stored one is older
+# than this, so repeated hits on hot entries stay read-only. LRU order is
+# only as fine-grained as this interval.
+TOUCH_INTERVAL_SECONDS = 60.0
+
+
+def content_key(*parts: str) -> str:
+    """SHA-256 over the given parts, NUL-separated so ("ab", "c") != ("a", "bc")."""
+    h = hashlib.sha256()
+    for part in parts:
+        h.update(part.encode("utf-8"))
+        h.update(b"\0")
+    return h.hexdigest()
+
+
+class DiskCache:
+    """SQLite key/value cache that evicts least-recently-used entries past ``max_bytes``."""
+
+    def __init__(self, db_path: Path | str, max_bytes: int = 64 * 1024 * 1024):
+        self.db_path = Path(db_path)
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        with self._get_connection() as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS cache (
+                    key TEXT PRIMARY KEY,
+                    value BLOB NOT NULL,
+                    size INTEGER NOT NULL,
+                    last_access REAL NOT NULL
+                )
+            """)
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_cache_last_access ON cache (last_access)")
+            # Running byte total, kept exact by triggers so every process
+            # sharing the file sees it without summing the table.
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS cache_size (
+                    id INTEGER PRIMARY KEY CHECK (id = 0),
+                    total INTEGER NOT NULL
+                )
+            """)
+            conn.execute(
+                "INSERT OR IGNORE INTO cache_size (id, total) SELECT 0, COALESCE(SUM(size), 0) FROM cache"
+            )
+            conn.execute("""
+                CREATE TRIGGER IF NOT EXISTS cache_size_insert AFTER INSERT ON cache
+                BEGIN UPDATE cache_size SET total = total + new.size WHERE id = 0; END
+            """)
+            conn.execute("""
+                CREATE TRIGGER IF NOT EXISTS cache_size_update AFTER UPDATE OF size ON cache
+                BEGIN UPDATE cache_size SET total = total + new.size - old.size WHERE id = 0; END
+            """)
+            conn.execute("""
+                CREATE TRIGGER IF NOT EXISTS cache_size_delete AFTER DELETE ON cache
+                BEGIN UPDATE cache_size SET total = total - old.size WHERE id = 0; END
+            """)
+            conn.commit()
+
+    @contextmanager
+    def _get_connection(self):
+        """Yield this thread's connection, opening it on first use (and after a fork)."""
+        local = self._local
+        conn = getattr(local, "conn", None)
+        if conn is None or local.pid != os.getpid():
+            conn = local.conn = sqlite3.connect(self.db_path, timeout=10, check_same_thread=False)
+            local.pid = os.getpid()
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+        try:
+            yield conn
+        except Exception:
+            conn.rollback()
+            raise
+        finally:
+            if conn.in_transaction:
+                conn.rollback()
+
+    def get(self, key: str) -> Optional[bytes]:
+        return self.get_many([key]).get(key)
+
+    def get_many(self, keys: Iterable[str]) -> dict[str, bytes]:
+        """Look up several keys at once, refreshing the recency of stale hits."""
+        keys = list(dict.fromkeys(keys))
+        found: dict[str, bytes] = {}
+        if not keys:
+            return found
+        now = time.time()
+        stale = []
+        with self._get_connection() as conn:
+            # Stay well below SQLite's bound-parameter limit.
+            for i in range(0, len(keys), 500):
+                batch = keys[i:i + 500]
+                placeholders = ", ".join("?" for _ in batch)
+                for key, value, last_access in conn.execute(
+                    f"SELECT key, value, last_access FROM cache WHERE key IN ({placeholders})", batch
+                ):
+                    found[key] = bytes(value)
+                    if last_access < now - TOUCH_INTERVAL_SECONDS:
+                        stale.append((now, key))
+            if stale:
+                conn.executemany("UPDATE cache SET last_access = ? WHERE key = ?", stale)
+                conn.commit()
+        with self._lock:
+            self.hits += len(found)
+            self.misses += len(keys) - len(found)
+        return found
+
+    def put(self, key: str, value: bytes):
+        self.put_many({key: value})
+
+    def put_many(self, items: dict[str, bytes]):
+        """Insert or replace entries, then evict LRU entries beyond max_bytes."""
+        if not items:
+            return
+        now = time.time()
+        with self._get_connection() as conn:
+            # An upsert rather than INSERT OR REPLACE: REPLACE's implicit
+            # delete does not fire the delete trigger, which would skew the total.
+            conn.executemany(
+                """
+                INSERT INTO cache (key, value, size, last_access) VALUES (?, ?, ?, ?)
+                ON CONFLICT (key) DO UPDATE SET
+                    value = excluded.value, size = excluded.size, last_access = excluded.last_access
+                """,
+                [(key, value, len(value), now) for key, value in items.items()],
+            )
+            self._evict(conn)
+            conn.commit()
+
+    def _evict(self, conn: sqlite3.Connection):
+        total = conn.execute("SELECT total FROM cache_size WHERE id = 0").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        excess = total - self.max_bytes
+        doomed = []
+        for key, size in conn.execute("SELECT key, size FROM cache ORDER BY last_access"):
+            doomed.append((key,))
+            excess -= size
+            if excess <= 0:
+                break
+        conn.executemany("DELETE FROM cache WHERE key = ?", doomed)
+
+    def clear(self):
+        with self._get_connection() as conn:
+            conn.execute("DELETE FROM cache")
+            conn.commit()
+
+    def stats(self) -> dict:
+        with self._get_connection() as conn:
+            entries, size = conn.execute(
+                "SELECT (SELECT COUNT(*) FROM cache), total FROM cache_size WHERE id = 0"
+            ).fetchone()
+        lookups = self.hits + self.misses
+        return {
+            "entries": entries,
+            "bytes": size,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hitRate": round(self.hits / lookups, 3) if lookups else 0.0,
+        }
@@ -0,0 +1,177 @@
+"""Streaming encoders for the /jobs/{id}/download endpoint.
+
+Each export format is produced by an async generator that pulls transcripts
+from the job store a page at a time and yields encoded bytes record by record,
+so memory stays flat regardless of job size and the first bytes go out as soon
+as the first page is read.
+"""
+
+import asyncio
+import csv
+import io
+import zlib
+from typing import AsyncIterator, Callable
+
+from app.services.dataset_formats import (
+    CSV_FIELDS,
+    build_csv_row,
+    build_sft_instruct_record,
+    build_sft_record,
+)
+from app.services import json_codec
+from app.services.job_store import JobStore
+
+PAGE_SIZE = 200
+
+# Compressed output is flushed to the client at least this often so a slow
+# trickle of small records still reaches the client promptly.
+_FLUSH_BYTES = 64 * 1024
+
+try:
+    import zstandard
+except ImportError:  # optional: gzip is always available
+    zstandard = None
+
+
+async def iter_transcripts(store: JobStore, job_id: str, page_size: int = PAGE_SIZE) -> AsyncIterator[dict]:
+    """Yield a job's transcripts, reading each page off the event loop."""
+    after = -1
+    while after is not None:
+        page, after = await asyncio.to_thread(
+            store.get_results_page, job_id, after=after, limit=page_size
+        )
+        for t in page:
+            yield t
+
+
+def _indent(text: str, prefix: str = "  ") -> str:
+    return "\n".join(prefix + line for line in text.split("\n"))
+
+
+async def _encode_json(transcripts: AsyncIterator[dict]) -> AsyncIterator[str]:
+    # Laid out like json.dumps(list, indent=2), one element at a time.
+    first = True
+    async for t in transcripts:
+        yield ("[\n" if first else ",\n") + _indent(json_codec.dumps_pretty(t))
+        first = False
+    yield "[]" if first else "\n]"
+
+
+def _jsonl_encoder(convert: Callable[[dict], dict]) -> Callable[[AsyncIterator[dict]], AsyncIterator[str]]:
+    async def encode(transcripts: AsyncIterator[dict]) -> AsyncIterator[str]:
+        first = True
+        async for t in transcripts:
+            yield ("" if first else "\n") + json_codec.dumps(convert(t))
+            first = False
+    return encode
+
+
+async def _encode_csv(transcripts: AsyncIterator[dict]) -> AsyncIterator[str]:
+    buf = io.StringIO()
+    writer = csv.DictWriter(buf, fieldnames=CSV_FIELDS)
+    header_written = False
+    async for t in transcripts:
+        if not header_written:
+            writer.writeheader()
+            header_written = True
+        writer.writerow(build_csv_row(t))
+        yield buf.getvalue()
+        buf.seek(0)
+        buf.truncate()
+
+
+# format -> (encoder, media type, filename suffix)
+EXPORT_FORMATS: dict[str, tuple[Callable, str, str]] = {
+    "json": (_encode_json, "application/json", ".json"),
+    "jsonl": (_jsonl_encoder(lambda t: t), "application/x-ndjson", ".jsonl"),
+    "csv": (_encode_csv, "text/csv", ".csv"),
+    # Supervised Fine-Tuning format: {prompt, response}
+    "sft": (_jsonl_encoder(build_sft_record), "application/x-ndjson", "_sft.jsonl"),
+    # Chat instruction tuning format with messages array
+    "sft_instruct": (_jsonl_encoder(build_sft_instruct_record), "application/x-ndjson", "_sft_instruct.jsonl"),
+}
+
+
+def _parse_accept_encoding(header: str) -> dict[str, float]:
+    accepted: dict[str, float] = {}
+    for part in header.split(","):
+        token, _, params = part.strip().partition(";")
+        token = token.strip().lower()
+        if not token:
+            continue
+        q = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                q = float(params[2:])
+            except ValueError:
+                q = 0.0
+        accepted[token] = q
+    return accepted
+
+
+def negotiate_encoding(accept_encoding: str | None) -> str | None:
+    """Pick the Content-Encoding for a response: "zstd", "gzip" or None (identity)."""
+    if not accept_encoding:
+        return None
+    accepted = _parse_accept_encoding(accept_encoding)
+    wildcard = accepted.get("*", 0.0)
+    candidates = ["zstd", "gzip"] if zstandard is not None else ["gzip"]
+    best, best_q = None, 0.0
+    for name in candidates:
+        q = accepted.get(name, wildcard)
+        if q > best_q:
+            best, best_q = name, q
+    return best
+
+
+class _Compressor:
+    """Incremental compressor with a zlib-style compress()/flush() interface."""
+
+    def __init__(self, encoding: str):
+        if encoding == "gzip":
+            self._obj = zlib.compressobj(6, zlib.DEFLATED, 31)  # wbits=31 -> gzip framing
+            self._sync = zlib.Z_SYNC_FLUSH
+        elif encoding == "zstd":
+            self._obj = zstandard.ZstdCompressor(level=3).compressobj()
+            self._sync = zstandard.COMPRESSOBJ_FLUSH_BLOCK
+        else:
+            raise ValueError(f"Unsupported encoding: {encoding}")
+
+    def compress(self, data: bytes) -> bytes:
+        return self._obj.compress(data)
+
+    def sync(self) -> bytes:
+        return self._obj.flush(self._sync)
+
+    def finish(self) -> bytes:
+        return self._obj.flush()
+
+
+async def stream_export(
+    store: JobStore,
+    job_id: str,
+    export_format: str,
+    encoding: str | None = None,
+) -> AsyncIterator[bytes]:
+    """Yield the encoded (and optionally compressed) bytes of a job export."""
+    encoder = EXPORT_FORMATS[export_format][0]
+    chunks = encoder(iter_transcripts(store, job_id))
+
+    if encoding is None:
+        async for text in chunks:
+            yield text.encode("utf-8")
+        return
+
+    compressor = _Compressor(encoding)
+    pending = 0
+    async for text in chunks:
+        data = text.encode("utf-8")
+        pending += len(data)
+        out = compressor.compress(data)
+        if pending >= _FLUSH_BYTES:
+            out += compressor.sync()
+            pending = 0
+        if out:
+            yield out
+    yield compressor.finish()
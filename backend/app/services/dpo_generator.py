@@ -0,0 +1,246 @@
+"""DPO (chosen/rejected) dataset generation from completed transcripts."""
+
+import asyncio
+import logging
+import os
+import random
+import shutil
+import tempfile
+import time
+from pathlib import Path
+
+from app.services import json_codec
+from app.services.quality_scorer import NVIDIA_BASE_URL, TokenBucket, _is_retryable
+
+logger = logging.getLogger(__name__)
+
+
+REJECT_MODEL = "meta/llama-3.1-8b-instruct"
+
+# Used when the rejected response cannot be generated after all retries.
+FALLBACK_REJECTION = "I don't know. You'll have to call back."
+
+
+def build_dpo_record(transcript: dict) -> dict | None:
+    """Build the prompt/chosen half of a DPO record, or None if the transcript
+    has no usable customer/agent exchange. ``rejected`` is filled in later."""
+    turns = transcript.get("conversation", [])
+    if len(turns) < 2:
+        return None
+
+    # Build the prompt from all customer turns
+    customer_turns = [turn.get("text", "") for turn in turns if turn.get("speaker") == "customer"]
+    agent_turns = [turn.get("text", "") for turn in turns if turn.get("speaker") == "agent"]
+    if not customer_turns or not agent_turns:
+        return None
+
+    prompt_text = (
+        f"Customer inquiry in {transcript.get('industry', 'general')} "
+        f"({transcript.get('scenario', 'general')}): {customer_turns[0]}"
+    )
+    return {
+        "prompt": prompt_text,
+        "chosen": " ".join(agent_turns)[:500],
+        "rejected": None,
+        "metadata": {
+            "industry": transcript.get("industry"),
+            "scenario": transcript.get("scenario"),
+            "language": transcript.get("language", "english"),
+            "transcript_id": transcript.get("id"),
+        },
+    }
+
+
+def _load_completed(path: Path) -> tuple[set, set]:
+    """Return the ordinals, and the transcript_ids of records without one,
+    already written to ``path``.
+
+    Records carry the input position of their transcript as
+    ``metadata.ordinal``; files written before that existed only have
+    ``transcript_id`` to go on. A crash can leave a half-written last line;
+    the file is truncated back to the last complete record so appends start
+    on a clean line.
+    """
+    ordinals, legacy_ids = set(), set()
+    if not path.exists():
+        return ordinals, legacy_ids
+    good_bytes = 0
+    with open(path, "rb") as f:
+        for line in f:
+            if not line.endswith(b"\n"):
+                break
+            try:
+                record = json_codec.loads(line)
+            except ValueError:
+                break
+            good_bytes += len(line)
+            metadata = record.get("metadata", {})
+            if metadata.get("ordinal") is not None:
+                ordinals.add(metadata["ordinal"])
+            elif metadata.get("transcript_id") is not None:
+                legacy_ids.add(metadata["transcript_id"])
+    if good_bytes != path.stat().st_size:
+        with open(path, "r+b") as f:
+            f.truncate(good_bytes)
+    return ordinals, legacy_ids
+
+
+def _prepare_partial(out_path: Path, partial_path: Path, restart: bool) -> tuple[set, set]:
+    out_path.parent.mkdir(parents=True, exist_ok=True)
+    if restart:
+        partial_path.unlink(missing_ok=True)
+        out_path.unlink(missing_ok=True)
+    elif not partial_path.exists() and out_path.exists():
+        shutil.copyfile(out_path, partial_path)
+    return _load_completed(partial_path)
+
+
+def _append_line(f, line: str):
+    # One write per record keeps lines whole if the process dies.
+    f.write(line)
+    f.flush()
+
+
+def _finalise(partial_path: Path, out_path: Path):
+    """Write the partial file's records to ``out_path`` in input order.
+
+    They were appended in completion order; sorting by ordinal makes the
+    output the same on every run. Records from before ordinals existed keep
+    their place at the front.
+    """
+    with open(partial_path, "rb") as f:
+        lines = [line for line in f if line.strip()]
+    lines.sort(key=lambda line: json_codec.loads(line).get("metadata", {}).get("ordinal", -1))
+    fd, tmp_name = tempfile.mkstemp(dir=out_path.parent, prefix=f".{out_path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as out:
+            out.writelines(lines)
+            out.flush()
+            os.fsync(out.fileno())
+        os.replace(tmp_name, out_path)
+    except BaseException:
+        Path(tmp_name).unlink(missing_ok=True)
+        raise
+    partial_path.unlink()
+
+
+class DPOGenerator:
+    """Generates rejected responses concurrently and appends DPO records to JSONL."""
+
+    def __init__(
+        self,
+        api_key: str,
+        base_url: str = NVIDIA_BASE_URL,
+        model: str = REJECT_MODEL,
+        max_concurrency: int = 16,
+        requests_per_second: float = 16.0,
+        max_retries: int = 4,
+        backoff_base: float = 0.5,
+        backoff_cap: float = 20.0,
+    ):
+        self.api_key = api_key
+        self.base_url = base_url
+        self.model = model
+        self.max_concurrency = max_concurrency
+        self.requests_per_second = requests_per_second
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_cap = backoff_cap
+
+    def _get_async_client(self):
+        try:
+            from openai import AsyncOpenAI
+        except ImportError:
+            raise RuntimeError("openai package required for DPO generation")
+        # Retries are handled by _reject_with_retries so they share the rate limiter.
+        return AsyncOpenAI(api_key=self.api_key, base_url=self.base_url, max_retries=0)
+
+    async def generate(self, transcripts: list[dict], out_path: Path, restart: bool = False) -> dict:
+        """Write a DPO record for every usable transcript to ``out_path``.
+
+        Records are appended to ``{out_path}.partial`` as their rejected
+        response completes, each tagged with its transcript's position in
+        ``transcripts`` as ``metadata.ordinal``. Once every transcript is done
+        they are written to ``out_path`` in input order; an existing
+        ``out_path`` stays downloadable until then. Ordinals already present
+        in the partial or previous output are skipped, so an interrupted run
+        resumes where it stopped; ``restart`` discards both. File I/O runs in
+        threads so the event loop never blocks on the disk.
+        """
+        partial_path = out_path.with_name(out_path.name + ".partial")
+        done, legacy_ids = await asyncio.to_thread(_prepare_partial, out_path, partial_path, restart)
+
+        pending = []
+        for ordinal, t in enumerate(transcripts):
+            if ordinal in done or (t.get("id") is not None and t.get("id") in legacy_ids):
+                continue
+            record = build_dpo_record(t)
+            if record is not None:
+                record["metadata"]["ordinal"] = ordinal
+                pending.append(record)
+
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        bucket = TokenBucket(self.requests_per_second)
+        stats = {"retries": 0, "fallbacks": 0}
+
+        started = time.monotonic()
+        write_lock = asyncio.Lock()
+        f = await asyncio.to_thread(open, partial_path, "a", encoding="utf-8")
+        try:
+
+            async def complete(record: dict):
+                async with semaphore:
+                    try:
+                        record["rejected"] = await self._reject_with_retries(client, bucket, record["prompt"], stats)
+                    except Exception as e:
+                        logger.warning(
+                            f"Rejected response failed for transcript {record['metadata']['transcript_id']}: {e}"
+                        )
+                        stats["fallbacks"] += 1
+                        record["rejected"] = FALLBACK_REJECTION
+                async with write_lock:
+                    await asyncio.to_thread(_append_line, f, json_codec.dumps(record) + "\n")
+
+            if pending:
+                client = self._get_async_client()
+                try:
+                    await asyncio.gather(*(complete(r) for r in pending))
+                finally:
+                    await client.close()
+        finally:
+            await asyncio.to_thread(f.close)
+        await asyncio.to_thread(_finalise, partial_path, out_path)
+
+        return {
+            "written": len(pending),
+            "skipped": len(done) + len(legacy_ids),
+            "fallbacks": stats["fallbacks"],
+            "retries": stats["retries"],
+            "wallSeconds": round(time.monotonic() - started, 3),
+        }
+
+    async def _reject_with_retries(self, client, bucket: TokenBucket, prompt_text: str, stats: dict) -> str:
+        attempt = 0
+        while True:
+            await bucket.acquire()
+            try:
+                response = await client.chat.completions.create(
+                    model=self.model,
+                    messages=[{
+                        "role": "user",
+                        "content": (
+                            f"You are a poor customer service agent. Give a brief, unhelpful, "
+                            f"slightly rude response to: {prompt_text}. Keep it under 50 words."
+                        ),
+                    }],
+                    temperature=0.8,
+                    max_tokens=100,
+                )
+                return response.choices[0].message.content.strip()
+            except Exception as e:
+                if attempt >= self.max_retries or not _is_retryable(e):
+                    raise
+                delay = random.uniform(0, min(self.backoff_cap, self.backoff_base * 2 ** attempt))
+                attempt += 1
+                stats["retries"] += 1
+                await asyncio.sleep(delay)
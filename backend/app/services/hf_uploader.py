@@ -1,11 +1,12 @@
 """HuggingFace Hub dataset uploader."""
 
-import json
 import logging
 import re
 import tempfile
 from pathlib import Path
 
+from app.services import json_codec
+
 logger = logging.getLogger(__name__)
 
 # HF tokens look like "hf_xxxx". Strip any that leak into library exception
@@ -73,18 +74,18 @@ class HFUploader:
                 data_file = tmp_path / "data.jsonl"
                 with open(data_file, "w", encoding="utf-8") as f:
                     for t in transcripts:
-                        f.write(json.dumps(build_sft_record(t)) + "\n")
+                        f.write(json_codec.dumps(build_sft_record(t)) + "\n")
                 hf_data_path = "data/train.jsonl"
             elif dataset_format == "jsonl":
                 data_file = tmp_path / "data.jsonl"
                 with open(data_file, "w", encoding="utf-8") as f:
                     for t in transcripts:
-                        f.write(json.dumps(t) + "\n")
+                        f.write(json_codec.dumps(t) + "\n")
                 hf_data_path = "data/train.jsonl"
             else:
                 data_file = tmp_path / "data.json"
                 with open(data_file, "w", encoding="utf-8") as f:
-                    json.dump(transcripts, f, indent=2)
+                    f.write(json_codec.dumps_pretty(transcripts))
                 hf_data_path = "data/train.json"
 
             # Generate dataset card
@@ -1,38 +1,231 @@
 """Simple job storage using SQLite for persistence."""
 
+import base64
+import binascii
 import json
+import logging
+import os
 import sqlite3
+import threading
+import time
+import uuid
+import weakref
 from datetime import datetime
 from pathlib import Path
-from typing import Optional
+from typing import Iterator, Optional
 from contextlib import contextmanager
 
-from app.models import GenerationJob, GenerationConfig
+from app.config import get_settings
+from app.models import GenerationJob, GenerationConfig, JobSummary
+from app.services import json_codec
+from app.services.statistics import StatsSketch
+from app.services.transcript_codec import DICT_MAX_SAMPLES, DICT_MIN_SAMPLES, TranscriptCodec
+
+logger = logging.getLogger(__name__)
+
+# Per-connection SQLite tuning: memory-map up to this many bytes of the file
+# and keep up to this many KiB of pages in each connection's cache.
+MMAP_SIZE = 256 * 1024 * 1024
+CACHE_SIZE_KB = 8 * 1024
+
+# Transcript fields promoted to their own indexed columns, in insert order after
+# transcript_id. Filters and group-bys are restricted to these names.
+_INDEXED_COLUMNS = (
+    "industry",
+    "scenario",
+    "sentiment",
+    "language",
+    "resolution_status",
+    "quality_overall",
+)
+
+# Columns of ``jobs`` a JobSummary is built from; listing never reads config.
+_SUMMARY_COLUMNS = (
+    "id, status, industry, progress, total_records, completed_records, "
+    "created_at, completed_at, error"
+)
+
+
+def _index_values(t: dict) -> tuple:
+    """Extract (transcript_id, *_INDEXED_COLUMNS) from a transcript dict."""
+    customer = t.get("customer") or {}
+    metadata = t.get("metadata") or {}
+    qs = t.get("qualityScores") or t.get("quality_scores")
+    overall = qs.get("overall") if isinstance(qs, dict) else None
+    return (
+        str(t.get("id", "")),
+        t.get("industry"),
+        t.get("scenario"),
+        customer.get("sentiment"),
+        t.get("language", "english"),
+        metadata.get("resolutionStatus"),
+        overall,
+    )
+
+
+def _filter_clause(job_id: str, filters: dict) -> tuple[str, list]:
+    """Build a WHERE clause for transcript queries.
+
+    Supports equality on ``transcript_id`` and on any of _INDEXED_COLUMNS
+    except quality_overall, plus ``min_quality`` / ``max_quality`` bounds on
+    it. None values are ignored so callers can pass optional query parameters
+    straight through.
+    """
+    clauses = ["job_id = ?"]
+    params: list = [job_id]
+    for key, value in filters.items():
+        if value is None:
+            continue
+        if key == "min_quality":
+            clauses.append("quality_overall >= ?")
+        elif key == "max_quality":
+            clauses.append("quality_overall <= ?")
+        elif key == "transcript_id" or (key in _INDEXED_COLUMNS and key != "quality_overall"):
+            clauses.append(f"{key} = ?")
+        else:
+            raise ValueError(f"Unsupported transcript filter: {key!r}")
+        params.append(value)
+    return " AND ".join(clauses), params
+
+
+def _matches_search(t: dict, needle: str) -> bool:
+    """Case-insensitive substring match on scenario, participant names and turn text."""
+    customer = t.get("customer") or {}
+    agent = t.get("agent") or {}
+    fields = [t.get("scenario"), customer.get("name"), agent.get("name")]
+    fields.extend(turn.get("text") for turn in t.get("conversation") or [])
+    return any(needle in field.lower() for field in fields if isinstance(field, str))
+
+
+def _encode_job_cursor(created_at: str, job_id: str) -> str:
+    return base64.urlsafe_b64encode(f"{created_at}|{job_id}".encode("utf-8")).decode("ascii")
+
+
+def _decode_job_cursor(cursor: str) -> tuple[str, str]:
+    """Inverse of _encode_job_cursor; ValueError for anything it did not produce."""
+    try:
+        created_at, sep, job_id = base64.urlsafe_b64decode(cursor.encode("ascii")).decode("utf-8").partition("|")
+        datetime.fromisoformat(created_at.removesuffix("Z"))
+        uuid.UUID(job_id)
+    except (binascii.Error, UnicodeError, ValueError):
+        raise ValueError(f"Invalid job list cursor: {cursor!r}") from None
+    if not sep:
+        raise ValueError(f"Invalid job list cursor: {cursor!r}")
+    return created_at, job_id
+
+
+class _Connection(sqlite3.Connection):
+    """sqlite3.Connection that can be weakly referenced.
+
+    JobStore tracks its connections weakly so close() can reach every thread's
+    connection while one owned by a thread that has exited is still freed.
+    """
 
 
 class JobStore:
     """SQLite-based job storage for persistence across restarts."""
     
-    def __init__(self, db_path: str = "jobs.db"):
+    def __init__(self, db_path: str = "jobs.db", compression: Optional[str] = None):
         self.db_path = Path(db_path)
+        # None means the TRANSCRIPT_COMPRESSION setting, read on first use so
+        # importing this module does not freeze the settings before .env loads.
+        self._compression = compression
+        self._codec_instance: Optional[TranscriptCodec] = None
+        self._codec_lock = threading.Lock()
+        self._local = threading.local()
+        self._connections: weakref.WeakSet = weakref.WeakSet()
+        self._connections_lock = threading.Lock()
+        self._generation = 0
         self._init_db()
-    
-    @contextmanager
-    def _get_connection(self):
+
+    def _connect(self) -> sqlite3.Connection:
         # timeout lets writers wait out a lock instead of failing immediately;
-        # WAL allows readers and a writer to coexist. Roll back on any error so a
-        # half-applied write is never left behind.
-        conn = sqlite3.connect(self.db_path, timeout=10)
+        # WAL allows readers and a writer to coexist. synchronous=NORMAL is
+        # durable under WAL except for the last commits on power loss.
+        conn = sqlite3.connect(
+            self.db_path,
+            timeout=10,
+            cached_statements=256,
+            check_same_thread=False,
+            factory=_Connection,
+        )
         conn.row_factory = sqlite3.Row
         conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute(f"PRAGMA mmap_size={MMAP_SIZE}")
+        conn.execute(f"PRAGMA cache_size=-{CACHE_SIZE_KB}")
+        with self._connections_lock:
+            self._connections.add(conn)
+        return conn
+
+    @contextmanager
+    def _get_connection(self):
+        """Yield this thread's connection, opening it on first use.
+
+        Each thread keeps one connection (and its statement cache) for the
+        life of the store instead of reconnecting per call. Nested uses share
+        it; the outermost one rolls back anything left uncommitted, as closing
+        a fresh connection used to, so no transaction outlives its block.
+        """
+        local = self._local
+        conn = getattr(local, "conn", None)
+        if conn is None or local.pid != os.getpid() or local.generation != self._generation:
+            conn = local.conn = self._connect()
+            local.pid = os.getpid()
+            local.generation = self._generation
+            local.depth = 0
+        local.depth += 1
         try:
             yield conn
         except Exception:
             conn.rollback()
             raise
         finally:
-            conn.close()
-    
+            local.depth -= 1
+            if local.depth == 0 and conn.in_transaction:
+                conn.rollback()
+
+    @property
+    def _codec(self) -> TranscriptCodec:
+        codec = self._codec_instance
+        if codec is None:
+            with self._codec_lock:
+                if self._codec_instance is None:
+                    codec = TranscriptCodec(
+                        self._compression or get_settings().transcript_compression,
+                        self._load_dictionary,
+                    )
+                    if codec.method == "zstd":
+                        latest = self._latest_dictionary()
+                        if latest is not None:
+                            codec.use_dictionary(latest)
+                    self._codec_instance = codec
+                codec = self._codec_instance
+        return codec
+
+    def _load_dictionary(self, dict_id: int) -> Optional[bytes]:
+        with self._get_connection() as conn:
+            row = conn.execute("SELECT data FROM transcript_dicts WHERE id = ?", (dict_id,)).fetchone()
+            return row["data"] if row else None
+
+    def _latest_dictionary(self) -> Optional[bytes]:
+        with self._get_connection() as conn:
+            row = conn.execute(
+                "SELECT data FROM transcript_dicts ORDER BY created_at DESC LIMIT 1"
+            ).fetchone()
+            return row["data"] if row else None
+
+    def close(self):
+        """Close every thread's connection; later calls reconnect lazily."""
+        with self._connections_lock:
+            connections, self._connections = list(self._connections), weakref.WeakSet()
+            self._generation += 1
+        for conn in connections:
+            try:
+                conn.close()
+            except sqlite3.Error:
+                pass
+
     def _init_db(self):
         with self._get_connection() as conn:
             conn.execute("""
@@ -49,18 +242,130 @@ class JobStore:
                     results TEXT
                 )
             """)
+            # One row per transcript. The JSON document lives in `data`, encoded
+            # by TranscriptCodec (usually zstd-compressed, see transcript_codec); the
+            # fields endpoints filter and group on are copied into indexed
+            # columns so they can be queried without parsing every transcript.
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS transcripts (
+                    job_id TEXT NOT NULL,
+                    ordinal INTEGER NOT NULL,
+                    transcript_id TEXT NOT NULL,
+                    industry TEXT,
+                    scenario TEXT,
+                    sentiment TEXT,
+                    language TEXT,
+                    resolution_status TEXT,
+                    quality_overall REAL,
+                    data TEXT NOT NULL,
+                    PRIMARY KEY (job_id, ordinal)
+                )
+            """)
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_transcripts_tid ON transcripts (job_id, transcript_id)")
+            for column in _INDEXED_COLUMNS:
+                conn.execute(
+                    f"CREATE INDEX IF NOT EXISTS idx_transcripts_{column} "
+                    f"ON transcripts (job_id, {column})"
+                )
+            # Per-job StatsSketch, maintained by every write to `transcripts`.
+            # Kept out of `jobs` because results can be saved for any job_id.
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS job_stats (
+                    job_id TEXT PRIMARY KEY,
+                    sketch TEXT NOT NULL
+                )
+            """)
+            # Serialised reports derived from a job's transcripts (bias report,
+            # statistics), valid while their etag equals the job's results etag.
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS job_reports (
+                    job_id TEXT NOT NULL,
+                    kind TEXT NOT NULL,
+                    etag TEXT NOT NULL,
+                    body TEXT NOT NULL,
+                    PRIMARY KEY (job_id, kind)
+                )
+            """)
+            # Durable work queue (see app/services/task_queue.py). A task is
+            # queued -> leased -> done/failed; a leased task whose lease_expires_at
+            # has passed is claimable again, so work held by a dead worker resumes.
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS tasks (
+                    id TEXT PRIMARY KEY,
+                    kind TEXT NOT NULL,
+                    job_id TEXT NOT NULL,
+                    payload TEXT NOT NULL,
+                    status TEXT NOT NULL,
+                    attempts INTEGER NOT NULL DEFAULT 0,
+                    max_attempts INTEGER NOT NULL,
+                    available_at REAL NOT NULL,
+                    lease_owner TEXT,
+                    lease_expires_at REAL,
+                    last_error TEXT,
+                    created_at REAL NOT NULL
+                )
+            """)
+            # zstd dictionaries transcripts.data may have been compressed with,
+            # keyed by the dictionary id zstd writes into each frame.
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS transcript_dicts (
+                    id INTEGER PRIMARY KEY,
+                    data BLOB NOT NULL,
+                    created_at REAL NOT NULL
+                )
+            """)
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_tasks_status ON tasks (status, available_at)")
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_tasks_job ON tasks (job_id, kind)")
+            # Columns added after the first release; older databases get them
+            # via ALTER TABLE so existing jobs.db files keep working.
+            self._ensure_column(conn, "jobs", "generation_cursor", "INTEGER DEFAULT 0")
+            self._ensure_column(conn, "job_stats", "etag", "TEXT")
+            if self._ensure_column(conn, "jobs", "industry", "TEXT"):
+                for row in conn.execute("SELECT id, config FROM jobs").fetchall():
+                    conn.execute(
+                        "UPDATE jobs SET industry = ? WHERE id = ?",
+                        (json.loads(row["config"]).get("industry"), row["id"]),
+                    )
+            # Job listings walk these newest first, optionally narrowed by
+            # status or industry (see list_job_summaries).
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_jobs_created ON jobs (created_at, id)")
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_jobs_status_created ON jobs (status, created_at, id)")
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_jobs_industry_created ON jobs (industry, created_at, id)")
+            self._migrate_legacy_results(conn)
             conn.commit()
+
+    def _migrate_legacy_results(self, conn: sqlite3.Connection):
+        """Move results stored by older versions into the transcripts table.
+
+        Earlier releases kept each job's transcripts as one JSON blob in
+        jobs.results.
+        """
+        rows = conn.execute("SELECT id, results FROM jobs WHERE results IS NOT NULL").fetchall()
+        for row in rows:
+            self._replace_rows(conn, row["id"], json.loads(row["results"]))
+        if rows:
+            conn.execute("UPDATE jobs SET results = NULL WHERE results IS NOT NULL")
+
+    @staticmethod
+    def _ensure_column(conn: sqlite3.Connection, table: str, column: str, decl: str) -> bool:
+        """Add ``column`` if missing; True when it was just added."""
+        existing = {row["name"] for row in conn.execute(f"PRAGMA table_info({table})")}
+        if column in existing:
+            return False
+        conn.execute(f"ALTER TABLE {table} ADD COLUMN {column} {decl}")
+        return True
     
     def create_job(self, job: GenerationJob) -> GenerationJob:
         with self._get_connection() as conn:
             conn.execute("""
-                INSERT INTO jobs (id, status, config, progress, total_records, 
+                INSERT INTO jobs (id, status, config, industry, progress, total_records,
                                   completed_records, created_at, completed_at, error)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
             """, (
                 job.id,
                 job.status,
                 job.config.model_dump_json(),
+                job.config.industry,
                 job.progress,
                 job.total_records,
                 job.completed_records,
@@ -100,24 +405,319 @@ class JobStore:
             conn.commit()
     
     def save_results(self, job_id: str, results: list[dict]):
+        """Replace a job's full result set (e.g. after scoring rewrites it)."""
+        with self._get_connection() as conn:
+            self._ensure_dictionary(conn, results)
+            self._replace_rows(conn, job_id, results)
+            self._save_sketch(conn, job_id, StatsSketch.from_transcripts(results))
+            conn.commit()
+
+    def append_results(self, job: GenerationJob, results: list[dict], cursor: int):
+        """Commit one generated slice together with the job's progress.
+
+        ``cursor`` is the number of requested records covered by all committed
+        slices so far. It is written in the same transaction as the slice, so a
+        restarted worker resumes exactly after the last slice that landed.
+        """
+        with self._get_connection() as conn:
+            self._ensure_dictionary(conn, results)
+            sketch = self._load_sketch(conn, job.id)
+            self._insert_rows(conn, job.id, results)
+            if sketch is None:
+                sketch = self._rebuild_sketch(conn, job.id)
+            else:
+                sketch.update(results)
+            self._save_sketch(conn, job.id, sketch)
+            conn.execute("""
+                UPDATE jobs SET
+                    progress = ?, completed_records = ?, generation_cursor = ?
+                WHERE id = ?
+            """, (job.progress, job.completed_records, cursor, job.id))
+            conn.commit()
+
+    def get_generation_cursor(self, job_id: str) -> int:
+        """Number of requested records already committed by append_results."""
+        with self._get_connection() as conn:
+            row = conn.execute(
+                "SELECT generation_cursor FROM jobs WHERE id = ?", (job_id,)
+            ).fetchone()
+            return (row["generation_cursor"] or 0) if row else 0
+
+    def get_results(self, job_id: str) -> Optional[list[dict]]:
+        """Return every transcript of a job in generation order, or None."""
+        with self._get_connection() as conn:
+            rows = conn.execute(
+                "SELECT data FROM transcripts WHERE job_id = ? ORDER BY ordinal",
+                (job_id,),
+            ).fetchall()
+        return [self._codec.decode(row["data"]) for row in rows] or None
+
+    def get_stats_sketch(self, job_id: str) -> Optional[StatsSketch]:
+        """Return the job's statistics sketch, or None if it has no results.
+
+        Jobs stored before sketches existed, or whose sketch predates the
+        current SKETCH_VERSION, get theirs built on first access.
+        """
+        with self._get_connection() as conn:
+            sketch = self._load_sketch(conn, job_id)
+            if sketch is None:
+                sketch = self._rebuild_sketch(conn, job_id)
+                if not sketch.count:
+                    return None
+                self._save_sketch(conn, job_id, sketch)
+                conn.commit()
+            return sketch
+
+    @staticmethod
+    def _load_sketch(conn: sqlite3.Connection, job_id: str) -> Optional[StatsSketch]:
+        row = conn.execute("SELECT sketch FROM job_stats WHERE job_id = ?", (job_id,)).fetchone()
+        if row is None:
+            return None
+        try:
+            return StatsSketch.from_json(row["sketch"])
+        except ValueError:
+            # Written by an older version; callers rebuild it.
+            return None
+
+    def _rebuild_sketch(self, conn: sqlite3.Connection, job_id: str) -> StatsSketch:
+        rows = conn.execute(
+            "SELECT data FROM transcripts WHERE job_id = ? ORDER BY ordinal", (job_id,)
+        )
+        return StatsSketch.from_transcripts(self._codec.decode(row["data"]) for row in rows)
+
+    @staticmethod
+    def _save_sketch(conn: sqlite3.Connection, job_id: str, sketch: StatsSketch):
+        # Every write to a job's transcripts passes through here, so this is
+        # where its results etag changes and its cached reports are dropped.
+        conn.execute(
+            "INSERT OR REPLACE INTO job_stats (job_id, sketch, etag) VALUES (?, ?, ?)",
+            (job_id, sketch.to_json(), uuid.uuid4().hex),
+        )
+        conn.execute("DELETE FROM job_reports WHERE job_id = ?", (job_id,))
+
+    def get_results_etag(self, job_id: str) -> Optional[str]:
+        """Opaque token that changes whenever the job's transcripts are written.
+
+        None if the job has no results.
+        """
+        with self._get_connection() as conn:
+            row = conn.execute("SELECT etag FROM job_stats WHERE job_id = ?", (job_id,)).fetchone()
+            if row is not None and row["etag"]:
+                return row["etag"]
+            if row is not None:
+                # Sketch stored before etags existed.
+                etag = uuid.uuid4().hex
+                conn.execute("UPDATE job_stats SET etag = ? WHERE job_id = ?", (etag, job_id))
+                conn.commit()
+                return etag
+        if self.get_stats_sketch(job_id) is None:
+            return None
+        return self.get_results_etag(job_id)
+
+    def get_report(self, job_id: str, kind: str, etag: str) -> Optional[str]:
+        """Return the cached ``kind`` report body if it was built at ``etag``."""
+        with self._get_connection() as conn:
+            row = conn.execute(
+                "SELECT body FROM job_reports WHERE job_id = ? AND kind = ? AND etag = ?",
+                (job_id, kind, etag),
+            ).fetchone()
+            return row["body"] if row else None
+
+    def save_report(self, job_id: str, kind: str, etag: str, body: str):
+        """Cache a report body built from the results at ``etag``.
+
+        Skipped if the results have changed since, so a report computed
+        during a concurrent write never replaces a newer one.
+        """
         with self._get_connection() as conn:
             conn.execute(
-                "UPDATE jobs SET results = ? WHERE id = ?",
-                (json.dumps(results), job_id)
+                """
+                INSERT OR REPLACE INTO job_reports (job_id, kind, etag, body)
+                SELECT ?, ?, ?, ? WHERE EXISTS (
+                    SELECT 1 FROM job_stats WHERE job_id = ? AND etag = ?
+                )
+                """,
+                (job_id, kind, etag, body, job_id, etag),
             )
             conn.commit()
-    
-    def get_results(self, job_id: str) -> Optional[list[dict]]:
+
+    def has_results(self, job_id: str) -> bool:
         with self._get_connection() as conn:
             row = conn.execute(
-                "SELECT results FROM jobs WHERE id = ?", (job_id,)
+                "SELECT 1 FROM transcripts WHERE job_id = ? LIMIT 1", (job_id,)
             ).fetchone()
-            
-            if not row or not row["results"]:
-                return None
-            
-            return json.loads(row["results"])
-    
+            return row is not None
+
+    def count_results(self, job_id: str, **filters) -> int:
+        """Count a job's transcripts matching ``filters`` (see _filter_clause)."""
+        where, params = _filter_clause(job_id, filters)
+        with self._get_connection() as conn:
+            row = conn.execute(
+                f"SELECT COUNT(*) AS n FROM transcripts WHERE {where}", params
+            ).fetchone()
+            return row["n"]
+
+    def count_results_by(self, job_id: str, column: str, **filters) -> dict[str, int]:
+        """Histogram of one indexed column, e.g. ``count_results_by(id, "sentiment")``."""
+        if column not in _INDEXED_COLUMNS:
+            raise ValueError(f"Cannot group transcripts by {column!r}")
+        where, params = _filter_clause(job_id, filters)
+        with self._get_connection() as conn:
+            rows = conn.execute(
+                f"SELECT {column} AS value, COUNT(*) AS n FROM transcripts "
+                f"WHERE {where} GROUP BY {column}",
+                params,
+            ).fetchall()
+            return {row["value"]: row["n"] for row in rows}
+
+    def get_results_page(
+        self,
+        job_id: str,
+        after: int = -1,
+        limit: int = 100,
+        search: Optional[str] = None,
+        **filters,
+    ) -> tuple[list[dict], Optional[int]]:
+        """Return up to ``limit`` transcripts whose ordinal is greater than ``after``.
+
+        The second element is the cursor to pass as ``after`` for the next page,
+        or None when this page is the last one. Keyset pagination keeps every
+        page an index range scan no matter how deep into the job it is.
+
+        ``search`` is matched by _matches_search after the indexed ``filters``
+        narrow the rows, so rows are read in batches until the page fills.
+        """
+        where, params = _filter_clause(job_id, filters)
+        needle = search.strip().lower() if search else ""
+        batch = limit + 1 if not needle else max(limit + 1, 500)
+        page: list[tuple[int, dict]] = []
+        with self._get_connection() as conn:
+            while len(page) <= limit:
+                rows = conn.execute(
+                    f"SELECT ordinal, data FROM transcripts WHERE {where} AND ordinal > ? "
+                    f"ORDER BY ordinal LIMIT ?",
+                    (*params, after, batch),
+                ).fetchall()
+                for row in rows:
+                    t = self._codec.decode(row["data"])
+                    if not needle or _matches_search(t, needle):
+                        page.append((row["ordinal"], t))
+                        if len(page) > limit:
+                            break
+                if len(rows) < batch:
+                    break
+                after = rows[-1]["ordinal"]
+        next_cursor = page[limit - 1][0] if len(page) > limit else None
+        return [t for _, t in page[:limit]], next_cursor
+
+    def iter_results(
+        self, job_id: str, page_size: int = 200, search: Optional[str] = None, **filters
+    ) -> Iterator[dict]:
+        """Yield a job's transcripts page by page without loading them all at once."""
+        after = -1
+        while True:
+            page, after = self.get_results_page(
+                job_id, after=after, limit=page_size, search=search, **filters
+            )
+            yield from page
+            if after is None:
+                return
+
+    def _replace_rows(self, conn: sqlite3.Connection, job_id: str, results: list[dict]):
+        conn.execute("DELETE FROM transcripts WHERE job_id = ?", (job_id,))
+        self._insert_rows(conn, job_id, results)
+
+    def _insert_rows(self, conn: sqlite3.Connection, job_id: str, results: list[dict]):
+        row = conn.execute(
+            "SELECT COALESCE(MAX(ordinal) + 1, 0) AS next_ordinal FROM transcripts WHERE job_id = ?",
+            (job_id,),
+        ).fetchone()
+        start = row["next_ordinal"]
+        codec = self._codec
+        conn.executemany(
+            """
+            INSERT INTO transcripts (job_id, ordinal, transcript_id, industry, scenario,
+                                     sentiment, language, resolution_status,
+                                     quality_overall, data)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """,
+            (
+                (job_id, start + i, *_index_values(t), codec.encode(t))
+                for i, t in enumerate(results)
+            ),
+        )
+
+    def _ensure_dictionary(self, conn: sqlite3.Connection, results: list[dict]):
+        """Train the zstd dictionary once enough transcripts exist to learn from.
+
+        Runs before the caller's writes and commits the dictionary on its own,
+        so no row can ever reference a dictionary that was rolled back. Rows
+        written before it existed keep plain zstd until recompress_results.
+        """
+        codec = self._codec
+        if not codec.wants_dictionary:
+            return
+        stored = conn.execute(
+            "SELECT COUNT(*) FROM (SELECT 1 FROM transcripts LIMIT ?)", (DICT_MIN_SAMPLES,)
+        ).fetchone()[0]
+        if stored + len(results) < DICT_MIN_SAMPLES:
+            return
+        # Another process may have trained one since this codec was set up.
+        latest = self._latest_dictionary()
+        if latest is not None:
+            codec.use_dictionary(latest)
+            return
+        samples = [json_codec.dumpb(t) for t in results[:DICT_MAX_SAMPLES]]
+        rows = conn.execute(
+            "SELECT data FROM transcripts ORDER BY rowid DESC LIMIT ?",
+            (DICT_MAX_SAMPLES - len(samples),),
+        ).fetchall()
+        samples.extend(json_codec.dumpb(codec.decode(row["data"])) for row in rows)
+        try:
+            data = codec.train_dictionary(samples)
+        except Exception:
+            logger.warning("Could not train a transcript dictionary; using plain zstd", exc_info=True)
+            return
+        dict_id = codec.use_dictionary(data)
+        conn.execute(
+            "INSERT OR IGNORE INTO transcript_dicts (id, data, created_at) VALUES (?, ?, ?)",
+            (dict_id, data, time.time()),
+        )
+        conn.commit()
+        logger.info("Trained transcript dictionary %d from %d samples", dict_id, len(samples))
+
+    def recompress_results(self, batch_size: int = 500) -> int:
+        """Rewrite stored transcripts that are not in the current encoding.
+
+        Covers plain-JSON rows from before compression existed, rows written
+        before the dictionary was trained and rows from a different
+        TRANSCRIPT_COMPRESSION. Each batch commits on its own, so this can run
+        alongside the API and workers. Returns the number of rows rewritten.
+        """
+        with self._get_connection() as conn:
+            self._ensure_dictionary(conn, [])
+        codec = self._codec
+        rewritten = 0
+        last_rowid = 0
+        while True:
+            with self._get_connection() as conn:
+                rows = conn.execute(
+                    "SELECT rowid, data FROM transcripts WHERE rowid > ? ORDER BY rowid LIMIT ?",
+                    (last_rowid, batch_size),
+                ).fetchall()
+                if not rows:
+                    return rewritten
+                last_rowid = rows[-1]["rowid"]
+                stale = [
+                    (codec.encode(codec.decode(row["data"])), row["rowid"], row["data"])
+                    for row in rows
+                    if not codec.is_current(row["data"])
+                ]
+                # Matching on the old value skips rows rewritten concurrently.
+                conn.executemany("UPDATE transcripts SET data = ? WHERE rowid = ? AND data = ?", stale)
+                conn.commit()
+                rewritten += len(stale)
+
     def list_jobs(self, limit: int = 50) -> list[GenerationJob]:
         with self._get_connection() as conn:
             rows = conn.execute(
@@ -126,8 +726,83 @@ class JobStore:
             
             return [self._row_to_job(row) for row in rows]
     
+    def list_job_summaries(
+        self,
+        limit: int = 50,
+        cursor: Optional[str] = None,
+        status: Optional[str] = None,
+        industry: Optional[str] = None,
+    ) -> tuple[list[JobSummary], Optional[str]]:
+        """Return up to ``limit`` job summaries, newest first, and the next cursor.
+
+        Jobs are ordered by (created_at, id) descending; the opaque cursor
+        encodes the last job of the page, so each page is an index range scan
+        on idx_jobs_created (or the status/industry index when filtering). The
+        cursor is None when this page is the last one. Raises ValueError for a
+        cursor this method did not return.
+        """
+        clauses, params = [], []
+        if status:
+            clauses.append("status = ?")
+            params.append(status)
+        if industry:
+            clauses.append("industry = ?")
+            params.append(industry)
+        if cursor:
+            created_at, job_id = _decode_job_cursor(cursor)
+            clauses.append("(created_at < ? OR (created_at = ? AND id < ?))")
+            params.extend((created_at, created_at, job_id))
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        with self._get_connection() as conn:
+            rows = conn.execute(
+                f"SELECT {_SUMMARY_COLUMNS} FROM jobs {where} "
+                f"ORDER BY created_at DESC, id DESC LIMIT ?",
+                (*params, limit + 1),
+            ).fetchall()
+        summaries = [self._row_to_summary(row) for row in rows[:limit]]
+        next_cursor = None
+        if len(rows) > limit:
+            last = summaries[-1]
+            next_cursor = _encode_job_cursor(last.created_at, last.id)
+        return summaries, next_cursor
+
+    def list_jobs_created_between(
+        self,
+        since: Optional[str] = None,
+        until: Optional[str] = None,
+        limit: int = 100,
+    ) -> list[JobSummary]:
+        """Summaries of jobs whose ISO ``created_at`` falls in [since, until), newest first."""
+        clauses, params = [], []
+        if since:
+            clauses.append("created_at >= ?")
+            params.append(since)
+        if until:
+            clauses.append("created_at < ?")
+            params.append(until)
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        with self._get_connection() as conn:
+            rows = conn.execute(
+                f"SELECT {_SUMMARY_COLUMNS} FROM jobs {where} ORDER BY created_at DESC LIMIT ?", (*params, limit)
+            ).fetchall()
+        return [self._row_to_summary(row) for row in rows]
+
+    def list_jobs_by_status(self, *statuses: str) -> list[GenerationJob]:
+        placeholders = ", ".join("?" for _ in statuses)
+        with self._get_connection() as conn:
+            rows = conn.execute(
+                f"SELECT * FROM jobs WHERE status IN ({placeholders}) ORDER BY created_at",
+                statuses,
+            ).fetchall()
+            return [self._row_to_job(row) for row in rows]
+
     def delete_job(self, job_id: str) -> bool:
         with self._get_connection() as conn:
+            conn.execute("DELETE FROM transcripts WHERE job_id = ?", (job_id,))
+            conn.execute("DELETE FROM job_stats WHERE job_id = ?", (job_id,))
+            conn.execute("DELETE FROM job_reports WHERE job_id = ?", (job_id,))
+            # A worker holding one of these loses its lease at the next heartbeat.
+            conn.execute("DELETE FROM tasks WHERE job_id = ?", (job_id,))
             cursor = conn.execute("DELETE FROM jobs WHERE id = ?", (job_id,))
             conn.commit()
             return cursor.rowcount > 0
@@ -146,6 +821,19 @@ class JobStore:
             error=row["error"],
         )
 
+    def _row_to_summary(self, row: sqlite3.Row) -> JobSummary:
+        return JobSummary(
+            id=row["id"],
+            status=row["status"],
+            industry=row["industry"],
+            progress=row["progress"],
+            totalRecords=row["total_records"],
+            completedRecords=row["completed_records"],
+            createdAt=row["created_at"],
+            completedAt=row["completed_at"],
+            error=row["error"],
+        )
+
 
 # Global instance
 job_store = JobStore()
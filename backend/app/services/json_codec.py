@@ -0,0 +1,130 @@
+"""JSON encoding for the hot paths: the job store, downloads, exports and uploads.
+
+orjson is used when installed, then msgspec, then the stdlib. Every backend
+writes compact, UTF-8 (not \\u-escaped) JSON, identical across backends for
+the dicts/lists/str/numbers transcripts are made of except for the spelling of
+float exponents (1e16 vs 1e+16), so any of them reads what another wrote. A
+value a fast backend refuses (e.g. an int beyond 64 bits) is encoded by the
+stdlib instead. Decoding errors are always raised as ValueError.
+
+Transcripts stay plain dicts rather than typed structs: the generator, quality
+scorer and older jobs add keys the Transcript model does not declare, and a
+struct decoder would silently drop them.
+"""
+
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # optional: see the fastjson extra
+    orjson = None
+
+try:
+    import msgspec
+except ImportError:  # optional alternative to orjson
+    msgspec = None
+
+
+class _Stdlib:
+    name = "stdlib"
+
+    @staticmethod
+    def dumpb(obj: Any) -> bytes:
+        return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+    @staticmethod
+    def dumpb_pretty(obj: Any) -> bytes:
+        return json.dumps(obj, ensure_ascii=False, indent=2).encode("utf-8")
+
+    @staticmethod
+    def loads(data) -> Any:
+        return json.loads(data)
+
+
+class _Orjson:
+    name = "orjson"
+
+    @staticmethod
+    def dumpb(obj: Any) -> bytes:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+        except TypeError:
+            return _Stdlib.dumpb(obj)
+
+    @staticmethod
+    def dumpb_pretty(obj: Any) -> bytes:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_INDENT_2)
+        except TypeError:
+            return _Stdlib.dumpb_pretty(obj)
+
+    @staticmethod
+    def loads(data) -> Any:
+        return orjson.loads(data)  # orjson.JSONDecodeError is a ValueError
+
+
+class _Msgspec:
+    name = "msgspec"
+
+    @staticmethod
+    def dumpb(obj: Any) -> bytes:
+        try:
+            return _msgspec_encoder.encode(obj)
+        except (TypeError, OverflowError, msgspec.EncodeError):
+            return _Stdlib.dumpb(obj)
+
+    @staticmethod
+    def dumpb_pretty(obj: Any) -> bytes:
+        return msgspec.json.format(_Msgspec.dumpb(obj), indent=2)
+
+    @staticmethod
+    def loads(data) -> Any:
+        try:
+            return _msgspec_decoder.decode(data)
+        except msgspec.DecodeError as e:
+            raise ValueError(str(e)) from e
+
+
+if msgspec is not None:
+    _msgspec_encoder = msgspec.json.Encoder()
+    _msgspec_decoder = msgspec.json.Decoder()
+
+BACKENDS = {
+    backend.name: backend
+    for backend, available in ((_Orjson, orjson), (_Msgspec, msgspec), (_Stdlib, json))
+    if available is not None
+}
+_backend = next(iter(BACKENDS.values()))
+
+
+def backend_name() -> str:
+    return _backend.name
+
+
+def use_backend(name: str):
+    """Switch every caller to another installed backend (benchmarks, debugging)."""
+    global _backend
+    if name not in BACKENDS:
+        raise ValueError(f"JSON backend {name!r} is not available (installed: {', '.join(BACKENDS)})")
+    _backend = BACKENDS[name]
+
+
+def dumpb(obj: Any) -> bytes:
+    """Compact UTF-8 JSON bytes."""
+    return _backend.dumpb(obj)
+
+
+def dumps(obj: Any) -> str:
+    """Compact JSON text."""
+    return _backend.dumpb(obj).decode("utf-8")
+
+
+def dumps_pretty(obj: Any) -> str:
+    """JSON text indented by two spaces, laid out like ``json.dumps(obj, indent=2)``."""
+    return _backend.dumpb_pretty(obj).decode("utf-8")
+
+
+def loads(data) -> Any:
+    """Parse JSON from str or bytes; raises ValueError on malformed input."""
+    return _backend.loads(data)
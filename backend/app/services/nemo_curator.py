@@ -1,33 +1,146 @@
 """NeMo Curator-inspired data curation: dedup, PII filtering, quality filtering."""
 
 import re
-import copy
+import gzip
+import hashlib
 import logging
-import json
+import multiprocessing
+import os
+import random
+import tempfile
+from bisect import bisect_right
+from collections import Counter, defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from itertools import repeat
 from pathlib import Path
 from app.models.transcript import CurationResult
+from app.services import json_codec
+
+try:
+    import numpy as np
+except ImportError:  # pure-Python signatures are used instead
+    np = None
 
 logger = logging.getLogger(__name__)
 
-# PII patterns
-PII_PATTERNS = [
-    (re.compile(r"\b\d{3}[-.\s]?\d{3}[-.\s]?\d{4}\b"), "[PHONE_REDACTED]"),
-    (re.compile(r"\b\d{3}[-\s]?\d{2}[-\s]?\d{4}\b"), "[SSN_REDACTED]"),
-    (re.compile(r"\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b"), "[EMAIL_REDACTED]"),
-    (re.compile(r"\b(?:\d{4}[-\s]?){3}\d{4}\b"), "[CARD_REDACTED]"),
-    (re.compile(r"\b\d{1,2}[/-]\d{1,2}[/-]\d{2,4}\b"), "[DATE_REDACTED]"),
-    (re.compile(r"\b\d{5}(?:-\d{4})?\b"), "[ZIP_REDACTED]"),
+# PII categories in priority order. Redaction applies them one after another,
+# so where matches of two categories overlap the earlier category wins.
+PII_CATEGORIES = [
+    ("PHONE", r"\b\d{3}[-.\s]?\d{3}[-.\s]?\d{4}\b"),
+    ("SSN", r"\b\d{3}[-\s]?\d{2}[-\s]?\d{4}\b"),
+    ("EMAIL", r"\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b"),
+    ("CARD", r"\b(?:\d{4}[-\s]?){3}\d{4}\b"),
+    ("DATE", r"\b\d{1,2}[/-]\d{1,2}[/-]\d{2,4}\b"),
+    ("ZIP", r"\b\d{5}(?:-\d{4})?\b"),
 ]
 
+PII_PATTERNS = [(re.compile(pattern), f"[{name}_REDACTED]") for name, pattern in PII_CATEGORIES]
+
+# Separator used by PIIRedactor.redact_batch. NUL is neither a word nor a
+# whitespace character, so no pattern can match across it.
+_BATCH_SEP = "\x00"
+
+
+@dataclass(frozen=True)
+class _RedactionPass:
+    """The categories that can match a class of texts, and one regex finding any of them."""
+    detector: re.Pattern
+    patterns: tuple[tuple[str, re.Pattern], ...]
+
+
+class PIIRedactor:
+    """Redacts PII with the same result as applying each category in turn.
+
+    Texts with no "@" cannot match the email pattern and texts with no digit
+    cannot match the numeric ones; most turns contain neither and return
+    without running a regex at all. The rest are scanned once by an
+    alternation of the categories that apply, which finds nothing in most of
+    them. Only texts that do contain PII are redacted category by category.
+    The alternation alone cannot redact them: it resolves overlaps
+    leftmost-first, so in "12/12/555-123-4567" a date starting earlier would
+    win over the phone number and leave its last digits in the text.
+    """
+
+    def __init__(self, categories: list[tuple[str, str]] = PII_CATEGORIES):
+        self._replacements = {name: f"[{name}_REDACTED]" for name, _ in categories}
+        self._full = self._compile(categories)
+        self._numeric = self._compile([c for c in categories if c[0] != "EMAIL"])
+        self._email = self._compile([c for c in categories if c[0] == "EMAIL"])
+        self._digit = re.compile(r"\d")
+
+    @staticmethod
+    def _compile(categories: list[tuple[str, str]]) -> _RedactionPass | None:
+        if not categories:
+            return None
+        return _RedactionPass(
+            detector=re.compile("|".join(f"(?:{pattern})" for _, pattern in categories)),
+            patterns=tuple((name, re.compile(pattern)) for name, pattern in categories),
+        )
+
+    def _pass_for(self, text: str) -> _RedactionPass | None:
+        has_email = "@" in text
+        has_digit = self._digit.search(text) is not None
+        if has_email and has_digit:
+            return self._full
+        if has_digit:
+            return self._numeric
+        if has_email:
+            return self._email
+        return None
+
+    def _sub(self, redaction: _RedactionPass, text: str, counts: Counter) -> str:
+        if redaction.detector.search(text) is None:
+            return text
+        for name, pattern in redaction.patterns:
+            text, n = pattern.subn(self._replacements[name], text)
+            if n:
+                counts[name] += n
+        return text
+
+    def redact(self, text: str) -> tuple[str, Counter]:
+        """Return (cleaned_text, matches per category)."""
+        counts: Counter = Counter()
+        redaction = self._pass_for(text)
+        if redaction is None:
+            return text, counts
+        return self._sub(redaction, text, counts), counts
+
+    def redact_batch(self, texts: list[str]) -> tuple[list[str], Counter]:
+        """Redact many texts (e.g. all turns of a transcript) at once.
+
+        Texts that need the same categories are joined and scanned together,
+        so a whole list with no PII costs at most three regex passes. Returns
+        the cleaned texts in order and the combined category counts.
+        """
+        counts: Counter = Counter()
+        groups: dict[_RedactionPass, list[int]] = {}
+        for i, text in enumerate(texts):
+            redaction = self._pass_for(text)
+            if redaction is not None:
+                groups.setdefault(redaction, []).append(i)
+        if not groups:
+            return texts, counts
+
+        cleaned = list(texts)
+        for redaction, indices in groups.items():
+            if any(_BATCH_SEP in texts[i] for i in indices):
+                for i in indices:
+                    cleaned[i] = self._sub(redaction, texts[i], counts)
+                continue
+            joined = self._sub(redaction, _BATCH_SEP.join(texts[i] for i in indices), counts)
+            for i, text in zip(indices, joined.split(_BATCH_SEP)):
+                cleaned[i] = text
+        return cleaned, counts
+
+
+_redactor = PIIRedactor()
+
 
 def _redact_pii(text: str) -> tuple[str, int]:
     """Redact PII from text. Returns (cleaned_text, count_redacted)."""
-    count = 0
-    for pattern, replacement in PII_PATTERNS:
-        new_text, n = pattern.subn(replacement, text)
-        text = new_text
-        count += n
-    return text, count
+    cleaned, counts = _redactor.redact(text)
+    return cleaned, sum(counts.values())
 
 
 def _conversation_fingerprint(transcript: dict) -> str:
@@ -40,10 +153,8 @@ def _conversation_fingerprint(transcript: dict) -> str:
     return re.sub(r"\s+", " ", text).strip()
 
 
-def _minhash_similarity(fp1: str, fp2: str) -> float:
-    """Simple token-level Jaccard similarity as MinHash approximation."""
-    tokens1 = set(fp1.split())
-    tokens2 = set(fp2.split())
+def _jaccard_similarity(tokens1: frozenset, tokens2: frozenset) -> float:
+    """Exact token-level Jaccard similarity."""
     if not tokens1 and not tokens2:
         return 1.0
     if not tokens1 or not tokens2:
@@ -51,6 +162,345 @@ def _minhash_similarity(fp1: str, fp2: str) -> float:
     return len(tokens1 & tokens2) / len(tokens1 | tokens2)
 
 
+# MinHash / LSH parameters. 32 bands of 8 rows put the S-curve's midpoint at
+# (1/32)**(1/8) ~= 0.65: a pair at Jaccard 0.85 becomes a candidate with
+# probability 1 - (1 - 0.85**8)**32 > 0.99996 (higher still above it), while
+# pairs below ~0.5 almost never do. Wider bands let templated transcripts,
+# which share most of their tokens, pair up en masse and the candidate count
+# grows quadratically. Candidates are confirmed by an exact Jaccard check.
+_LSH_BANDS = 32
+_LSH_ROWS = 8
+_NUM_PERM = _LSH_BANDS * _LSH_ROWS
+_MERSENNE_PRIME = (1 << 61) - 1
+_MAX_HASH = (1 << 32) - 1
+# Fixed seed: signatures must be identical across processes and runs. a and b
+# stay below 2**32 so a * x + b fits in an unsigned 64-bit integer.
+_rng = random.Random(1)
+_PERM_A = [_rng.randint(1, _MAX_HASH) for _ in range(_NUM_PERM)]
+_PERM_B = [_rng.randint(0, _MAX_HASH) for _ in range(_NUM_PERM)]
+del _rng
+
+# Upper bound on token rows processed per NumPy block (_NUM_PERM * 8 bytes each).
+_SIGNATURE_BLOCK_TOKENS = 65536
+
+
+def _token_hash(token: str) -> int:
+    return int.from_bytes(hashlib.blake2b(token.encode("utf-8"), digest_size=4).digest(), "little")
+
+
+def _minhash_signatures(token_sets: list[frozenset]):
+    """MinHash signatures (length _NUM_PERM) of non-empty token sets.
+
+    Returns an (n, _NUM_PERM) array when NumPy is available, otherwise a list
+    of tuples. Both paths produce the same values.
+    """
+    if np is None:
+        hash_cache: dict[str, int] = {}
+        signatures = []
+        for tokens in token_sets:
+            for tok in tokens:
+                if tok not in hash_cache:
+                    hash_cache[tok] = _token_hash(tok)
+            hashes = [hash_cache[tok] for tok in tokens]
+            signatures.append(tuple(
+                min(((a * x + b) % _MERSENNE_PRIME) & _MAX_HASH for x in hashes)
+                for a, b in zip(_PERM_A, _PERM_B)
+            ))
+        return signatures
+
+    # Permute each distinct token once (vocabularies are far smaller than the
+    # total token count), then min-reduce each document's columns.
+    vocab: dict[str, int] = {}
+    token_ids: list[int] = []
+    offsets: list[int] = []
+    for tokens in token_sets:
+        offsets.append(len(token_ids))
+        token_ids.extend([vocab.setdefault(tok, len(vocab)) for tok in tokens])
+
+    # Laid out permutation-major so the reductions run along contiguous memory.
+    values = np.array([_token_hash(tok) for tok in vocab], dtype=np.uint64)[None, :]
+    perm_a = np.array(_PERM_A, dtype=np.uint64)[:, None]
+    perm_b = np.array(_PERM_B, dtype=np.uint64)[:, None]
+    permuted = np.empty((_NUM_PERM, len(vocab)), dtype=np.uint32)
+    for lo in range(0, len(vocab), _SIGNATURE_BLOCK_TOKENS):
+        block = values[:, lo:lo + _SIGNATURE_BLOCK_TOKENS]
+        permuted[:, lo:lo + block.shape[1]] = (perm_a * block + perm_b) % np.uint64(_MERSENNE_PRIME) & np.uint64(_MAX_HASH)
+
+    # Documents of equal length form a rectangular (docs, length) id matrix, so
+    # each group reduces with one vectorised min instead of a ragged reduceat.
+    token_ids_arr = np.array(token_ids, dtype=np.int64)
+    offsets_arr = np.array(offsets, dtype=np.int64)
+    lengths = np.array([len(tokens) for tokens in token_sets], dtype=np.int64)
+    signatures = np.empty((len(token_sets), _NUM_PERM), dtype=np.uint32)
+    for length in np.unique(lengths):
+        docs = np.flatnonzero(lengths == length)
+        per_block = max(1, _SIGNATURE_BLOCK_TOKENS // int(length))
+        for lo in range(0, len(docs), per_block):
+            chunk = docs[lo:lo + per_block]
+            ids = token_ids_arr[offsets_arr[chunk][:, None] + np.arange(length)[None, :]]
+            signatures[chunk] = permuted[:, ids].min(axis=2).T
+    return signatures
+
+
+def _band_buckets(signatures, band: int) -> list[list[int]]:
+    """Groups (ascending indices) of signatures that agree on every row of ``band``.
+
+    Only groups with at least two members are returned.
+    """
+    lo = band * _LSH_ROWS
+    if np is None:
+        buckets: dict[tuple[int, ...], list[int]] = defaultdict(list)
+        for idx, sig in enumerate(signatures):
+            buckets[sig[lo:lo + _LSH_ROWS]].append(idx)
+        return [members for members in buckets.values() if len(members) > 1]
+
+    # Fold the band's rows into one 64-bit key (wrapping arithmetic), then find
+    # runs of equal keys with a stable sort. A rare key collision only adds a
+    # candidate pair, which the exact Jaccard check rejects.
+    rows = signatures[:, lo:lo + _LSH_ROWS].astype(np.uint64)
+    keys = rows[:, 0].copy()
+    for r in range(1, _LSH_ROWS):
+        keys = keys * np.uint64(0x9E3779B97F4A7C15) ^ rows[:, r]
+    order = np.argsort(keys, kind="stable")
+    sorted_keys = keys[order]
+    starts = np.flatnonzero(np.concatenate(([True], sorted_keys[1:] != sorted_keys[:-1])))
+    ends = np.append(starts[1:], len(order))
+    multi = np.flatnonzero(ends - starts > 1)
+    return [order[starts[g]:ends[g]].tolist() for g in multi]
+
+
+class _LSHIndex:
+    """Multi-member LSH buckets of every band, and the buckets each signature is in.
+
+    Memory is linear in the number of signatures: candidate pairs are never
+    materialised, only enumerated per signature by ``later_candidates``.
+    """
+
+    def __init__(self, signatures):
+        self.buckets: list[list[int]] = []
+        self.member_of: list[list[int]] = [[] for _ in range(len(signatures))]
+        for band in range(_LSH_BANDS):
+            for members in _band_buckets(signatures, band):
+                for idx in members:
+                    self.member_of[idx].append(len(self.buckets))
+                self.buckets.append(members)
+
+    def later_candidates(self, idx: int):
+        """Yield each index greater than ``idx`` sharing a bucket with it, once."""
+        seen: set[int] = set()
+        for bucket in self.member_of[idx]:
+            members = self.buckets[bucket]
+            for other in members[bisect_right(members, idx):]:
+                if other not in seen:
+                    seen.add(other)
+                    yield other
+
+
+def _near_duplicate_mask(fingerprints: list[str], threshold: float) -> list[bool]:
+    """Greedy near-duplicate removal: keep[j] is False when an earlier kept
+    fingerprint has Jaccard similarity >= threshold with it.
+
+    Same result as comparing every pair in order, but only pairs sharing an
+    LSH bucket are compared exactly. Fingerprints with identical token sets
+    are collapsed up front: every later copy is always dropped, either by the
+    first copy or by whatever dropped the first copy.
+    """
+    token_sets = [frozenset(fp.split()) for fp in fingerprints]
+    keep = [True] * len(fingerprints)
+
+    first_seen: dict[frozenset, int] = {}
+    representatives: list[int] = []
+    for idx, tokens in enumerate(token_sets):
+        if tokens in first_seen:
+            keep[idx] = False
+        else:
+            first_seen[tokens] = idx
+            representatives.append(idx)
+
+    # An empty token set has similarity 0 with any non-empty one, so it can only
+    # duplicate another empty set, which the collapse above already handled.
+    reps = [idx for idx in representatives if token_sets[idx]]
+    if len(reps) < 2:
+        return keep
+
+    # Walk the reps in order like the exact greedy pass. Candidates already
+    # dropped are skipped before any set work, so a bucket full of copies is
+    # resolved by its first kept member instead of pair by pair.
+    index = _LSHIndex(_minhash_signatures([token_sets[idx] for idx in reps]))
+    for pos, i in enumerate(reps):
+        if not keep[i]:
+            continue
+        tokens_i = token_sets[i]
+        len_i = len(tokens_i)
+        for other in index.later_candidates(pos):
+            j = reps[other]
+            if not keep[j]:
+                continue
+            tokens_j = token_sets[j]
+            len_j = len(tokens_j)
+            # Jaccard can never exceed min/max of the set sizes; skip the
+            # intersection when that bound already rules the pair out.
+            if min(len_i, len_j) < threshold * max(len_i, len_j):
+                continue
+            inter = len(tokens_i & tokens_j)
+            if inter >= threshold * (len_i + len_j - inter):
+                keep[j] = False
+    return keep
+
+
+def near_duplicate_groups(fingerprints: list[str], threshold: float) -> tuple[list[int], list[set[int]]]:
+    """Group fingerprints for overlap analysis (not for removal).
+
+    Returns ``(group_of, neighbours)``: fingerprints with identical token sets
+    share a group id, and ``neighbours[g]`` holds every other group whose
+    Jaccard similarity with ``g`` is >= threshold (symmetric). Unlike
+    _near_duplicate_mask nothing is dropped greedily; every similar pair is
+    reported.
+    """
+    token_sets = [frozenset(fp.split()) for fp in fingerprints]
+    group_ids: dict[frozenset, int] = {}
+    group_of = [group_ids.setdefault(tokens, len(group_ids)) for tokens in token_sets]
+    groups = list(group_ids)
+    neighbours: list[set[int]] = [set() for _ in groups]
+
+    reps = [g for g, tokens in enumerate(groups) if tokens]
+    if len(reps) < 2:
+        return group_of, neighbours
+
+    index = _LSHIndex(_minhash_signatures([groups[g] for g in reps]))
+    for pos, g in enumerate(reps):
+        tokens_g = groups[g]
+        len_g = len(tokens_g)
+        for other in index.later_candidates(pos):
+            h = reps[other]
+            tokens_h = groups[h]
+            len_h = len(tokens_h)
+            if min(len_g, len_h) < threshold * max(len_g, len_h):
+                continue
+            inter = len(tokens_g & tokens_h)
+            if inter >= threshold * (len_g + len_h - inter):
+                neighbours[g].add(h)
+                neighbours[h].add(g)
+    return group_of, neighbours
+
+
+def curated_artifact_path(artifacts_dir: Path, job_id: str) -> Path | None:
+    """Return the current curated JSONL artifact (plain or gzipped), if any."""
+    for suffix in (".jsonl", ".jsonl.gz"):
+        path = artifacts_dir / f"{job_id}_curated{suffix}"
+        if path.exists():
+            return path
+    return None
+
+
+def _write_jsonl_atomic(path: Path, records, compress: bool = False) -> int:
+    """Stream records to a temp file next to ``path``, fsync, then rename over it.
+
+    Readers of ``path`` see either the previous complete file or the new one,
+    never a partial write; a reader that already opened the old file keeps
+    reading it to the end. Returns the number of records written.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    count = 0
+    try:
+        with os.fdopen(fd, "wb") as raw:
+            out = gzip.GzipFile(fileobj=raw, mode="wb", compresslevel=6, mtime=0) if compress else raw
+            try:
+                for record in records:
+                    out.write(json_codec.dumpb(record) + b"\n")
+                    count += 1
+            finally:
+                if compress:
+                    out.close()
+            raw.flush()
+            os.fsync(raw.fileno())
+        os.replace(tmp_name, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_name)
+        except FileNotFoundError:
+            pass
+        raise
+    return count
+
+
+@dataclass
+class _ShardResult:
+    """Output of the per-transcript curation stages for one shard."""
+    transcripts: list[dict]
+    fingerprints: list[str]
+    quality_filtered_count: int = 0
+    pii_removed_count: int = 0
+    pii_category_counts: Counter = field(default_factory=Counter)
+
+
+def _pool_context():
+    method = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+    return multiprocessing.get_context(method)
+
+
+def _curate_shard(
+    transcripts: list[dict],
+    filter_pii: bool,
+    min_quality_score: float,
+    fingerprint: bool,
+) -> _ShardResult:
+    """Quality filter, PII redaction and fingerprinting for independent transcripts.
+
+    Module-level so a ProcessPoolExecutor can pickle it. The input is never
+    mutated: a transcript with PII is replaced by a shallow copy whose
+    conversation list holds new dicts only for the turns that changed, and
+    everything else is shared with the caller's data (copy-on-write).
+    """
+    result = _ShardResult(transcripts=[], fingerprints=[])
+
+    # Step 1: Quality filtering
+    if min_quality_score > 0:
+        filtered = []
+        for t in transcripts:
+            qs = t.get("qualityScores") or t.get("quality_scores")
+            if qs:
+                overall = qs.get("overall", 10.0) if isinstance(qs, dict) else 10.0
+                if overall >= min_quality_score:
+                    filtered.append(t)
+                else:
+                    result.quality_filtered_count += 1
+            else:
+                filtered.append(t)  # No score → keep
+        transcripts = filtered
+
+    # Step 2: PII filtering
+    if filter_pii:
+        redacted = []
+        for t in transcripts:
+            turns = t.get("conversation", [])
+            cleaned, counts = _redactor.redact_batch([turn.get("text", "") for turn in turns])
+            if counts:
+                t = {
+                    **t,
+                    "conversation": [
+                        turn if text == turn.get("text", "") else {**turn, "text": text}
+                        for turn, text in zip(turns, cleaned)
+                    ],
+                }
+                result.pii_removed_count += 1
+                result.pii_category_counts.update(counts)
+            redacted.append(t)
+        transcripts = redacted
+
+    result.transcripts = transcripts
+    if fingerprint:
+        result.fingerprints = [_conversation_fingerprint(t) for t in transcripts]
+    return result
+
+
+def _split(items: list, parts: int) -> list[list]:
+    """Split into at most ``parts`` contiguous, near-equal slices (order preserved)."""
+    size = -(-len(items) // parts) if items else 1
+    return [items[i:i + size] for i in range(0, len(items), size)]
+
+
 class NemoCurator:
     """
     NeMo Curator-inspired curation pipeline.
@@ -60,6 +510,9 @@ class NemoCurator:
 
     SIMILARITY_THRESHOLD = 0.85  # Transcripts above this similarity are considered duplicates
 
+    # Below this many transcripts a process pool costs more than it saves.
+    MIN_PARALLEL_TRANSCRIPTS = 200
+
     def curate(
         self,
         transcripts: list[dict],
@@ -68,75 +521,81 @@ class NemoCurator:
         min_quality_score: float = 0.0,
         artifacts_dir: Path | None = None,
         job_id: str | None = None,
+        workers: int = 1,
+        compress: bool = False,
+        include_transcripts: bool = True,
     ) -> CurationResult:
+        """Run the curation pipeline.
+
+        With ``workers > 1`` (capped at the CPU count) only the per-transcript
+        stages (quality filter, PII redaction, fingerprinting) run on
+        contiguous shards in a process pool; shard results are merged in order
+        and the global dedup step runs here, so the output is identical to the
+        serial path. The pool's processes come from a forkserver (spawn where
+        that is unavailable): forking the API process, with its worker and
+        SQLite threads, could deadlock the children. They import only this
+        module's dependencies, not Data Designer or the job store.
+
+        The curated artifact is written atomically as ``{job_id}_curated.jsonl``
+        (or ``.jsonl.gz`` with ``compress``); the other variant is removed so
+        only the latest run is served. With ``include_transcripts=False`` the
+        survivors are streamed straight to disk and ``curated_transcripts`` is
+        left empty.
+        """
         original_count = len(transcripts)
-        pii_removed_count = 0
+        fingerprint = deduplicate and len(transcripts) > 1
+        args = (filter_pii, min_quality_score, fingerprint)
+
+        # No up-front copy: _curate_shard copies only the turns it redacts, so the
+        # caller's transcripts (and the data behind /download) stay untouched.
+        workers = min(workers, os.cpu_count() or 1)
+        if workers > 1 and len(transcripts) >= self.MIN_PARALLEL_TRANSCRIPTS:
+            shards = _split(transcripts, workers * 4)
+            with ProcessPoolExecutor(max_workers=workers, mp_context=_pool_context()) as pool:
+                shard_results = list(pool.map(_curate_shard, shards, *(repeat(arg) for arg in args)))
+        else:
+            shard_results = [_curate_shard(transcripts, *args)]
+
+        transcripts = []
+        fingerprints: list[str] = []
         quality_filtered_count = 0
+        pii_removed_count = 0
+        pii_category_counts: Counter = Counter()
+        for shard in shard_results:
+            transcripts.extend(shard.transcripts)
+            fingerprints.extend(shard.fingerprints)
+            quality_filtered_count += shard.quality_filtered_count
+            pii_removed_count += shard.pii_removed_count
+            pii_category_counts.update(shard.pii_category_counts)
 
-        # Deep-copy up front: the PII step mutates turn["text"] in place. Without
-        # this, the caller's stored transcripts get silently redacted, so the
-        # curated file on disk and the data returned by /download would diverge.
-        transcripts = copy.deepcopy(transcripts)
-
-        # Step 1: Quality filtering
-        if min_quality_score > 0:
-            filtered = []
-            for t in transcripts:
-                qs = t.get("qualityScores") or t.get("quality_scores")
-                if qs:
-                    overall = qs.get("overall", 10.0) if isinstance(qs, dict) else 10.0
-                    if overall >= min_quality_score:
-                        filtered.append(t)
-                    else:
-                        quality_filtered_count += 1
-                else:
-                    filtered.append(t)  # No score → keep
-            transcripts = filtered
-
-        # Step 2: PII filtering
-        if filter_pii:
-            for t in transcripts:
-                total_pii = 0
-                for turn in t.get("conversation", []):
-                    cleaned, count = _redact_pii(turn.get("text", ""))
-                    if count > 0:
-                        turn["text"] = cleaned
-                        total_pii += count
-                if total_pii > 0:
-                    pii_removed_count += 1
-
-        # Step 3: Deduplication (approximate, similarity-based)
+        # Step 3: Deduplication (MinHash/LSH candidates, exact Jaccard check)
         deduplicated_count = 0
-        if deduplicate and len(transcripts) > 1:
-            fingerprints = [_conversation_fingerprint(t) for t in transcripts]
-            keep = [True] * len(transcripts)
-
-            for i in range(len(transcripts)):
-                if not keep[i]:
-                    continue
-                for j in range(i + 1, len(transcripts)):
-                    if not keep[j]:
-                        continue
-                    sim = _minhash_similarity(fingerprints[i], fingerprints[j])
-                    if sim >= self.SIMILARITY_THRESHOLD:
-                        keep[j] = False
-                        deduplicated_count += 1
-
-            transcripts = [t for t, k in zip(transcripts, keep) if k]
+        survivors = transcripts
+        if fingerprint and len(transcripts) > 1:
+            keep = _near_duplicate_mask(fingerprints, self.SIMILARITY_THRESHOLD)
+            deduplicated_count = keep.count(False)
+            survivors = (t for t, k in zip(transcripts, keep) if k)
+        final_count = len(transcripts) - deduplicated_count
+
+        curated: list[dict] = []
+        if include_transcripts:
+            curated = list(survivors)
+            survivors = curated
 
         # Step 4: Save curated output
         if artifacts_dir and job_id:
-            out_path = artifacts_dir / f"{job_id}_curated.jsonl"
-            out_path.parent.mkdir(parents=True, exist_ok=True)
-            with open(out_path, "w", encoding="utf-8") as f:
-                for t in transcripts:
-                    f.write(json.dumps(t) + "\n")
+            plain = artifacts_dir / f"{job_id}_curated.jsonl"
+            gzipped = artifacts_dir / f"{job_id}_curated.jsonl.gz"
+            out_path, stale = (gzipped, plain) if compress else (plain, gzipped)
+            _write_jsonl_atomic(out_path, survivors, compress=compress)
+            stale.unlink(missing_ok=True)
 
         return CurationResult(
             originalCount=original_count,
             deduplicatedCount=deduplicated_count,
             piiRemovedCount=pii_removed_count,
+            piiCategoryCounts=dict(pii_category_counts),
             qualityFilteredCount=quality_filtered_count,
-            finalCount=len(transcripts),
-            curatedTranscripts=transcripts,
+            finalCount=final_count,
+            curatedTranscripts=curated,
         )
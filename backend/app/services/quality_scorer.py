@@ -1,11 +1,17 @@
 """LLM-based quality scoring for generated transcripts."""
 
+import asyncio
 import json
 import logging
+import math
+import random
 import re
-from typing import Any
+import time
+from functools import lru_cache
 
-from app.models.transcript import QualityScores
+from app.config import get_settings
+from app.models.transcript import QualityScores, ScoringSummary
+from app.services.disk_cache import DiskCache, content_key
 
 logger = logging.getLogger(__name__)
 
@@ -44,11 +50,150 @@ Respond with ONLY a valid JSON object in this exact format:
 {{"coherence": <float 0-10>, "diversity": <float 0-10>, "factualConsistency": <float 0-10>}}"""
 
 
+JUDGE_MODEL = "meta/llama-3.1-8b-instruct"
+
+# Part of every judge cache key. Bump it whenever QUALITY_JUDGE_PROMPT or
+# _parse_scores changes so verdicts produced under the old prompt are not reused.
+PROMPT_VERSION = "1"
+NVIDIA_BASE_URL = "https://integrate.api.nvidia.com/v1"
+
+# Neutral verdict used when a transcript cannot be scored.
+_FALLBACK_SCORES = QualityScores(coherence=7.0, diversity=7.0, factualConsistency=7.0, overall=7.0)
+
+_RETRYABLE_STATUS = {408, 409, 429}
+
+
+def _build_prompt(transcript: dict) -> str:
+    conversation_text = "\n".join(
+        f"[{turn.get('speaker', 'unknown').upper()}]: {turn.get('text', '')}"
+        for turn in transcript.get("conversation", [])
+    )
+    return QUALITY_JUDGE_PROMPT.format(
+        industry=transcript.get("industry", "unknown"),
+        scenario=transcript.get("scenario", "unknown"),
+        language=transcript.get("language", "english"),
+        conversation=conversation_text[:3000],  # Truncate very long convos
+    )
+
+
+def _parse_scores(raw: str) -> QualityScores:
+    # Extract the first JSON object regardless of markdown fences or
+    # surrounding prose. The previous split("```") approach broke on
+    # uppercase ```JSON fences and silently fell back to neutral scores.
+    match = re.search(r"\{.*\}", raw, re.DOTALL)
+    if not match:
+        raise ValueError(f"No JSON object found in model output: {raw[:200]!r}")
+
+    scores = json.loads(match.group(0))
+    coherence = float(scores.get("coherence", 7.0))
+    diversity = float(scores.get("diversity", 7.0))
+    factual = float(scores.get("factualConsistency", 7.0))
+    overall = round((coherence + diversity + factual) / 3, 2)
+
+    return QualityScores(
+        coherence=round(coherence, 2),
+        diversity=round(diversity, 2),
+        factualConsistency=round(factual, 2),
+        overall=overall,
+    )
+
+
+def judge_cache_key(model: str, transcript: dict) -> str:
+    """Content address of a judge verdict.
+
+    Covers everything that reaches the prompt: the prompt version, the model,
+    the industry/scenario/language header and the conversation with whitespace
+    collapsed. Transcript ids and timestamps are deliberately excluded so
+    copies of the same conversation share a verdict.
+    """
+    conversation = "\n".join(
+        f"{turn.get('speaker', 'unknown')}: {' '.join(str(turn.get('text', '')).split())}"
+        for turn in transcript.get("conversation", [])
+    )
+    return content_key(
+        PROMPT_VERSION,
+        model,
+        str(transcript.get("industry", "unknown")),
+        str(transcript.get("scenario", "unknown")),
+        str(transcript.get("language", "english")),
+        conversation,
+    )
+
+
+@lru_cache
+def get_judge_cache() -> DiskCache:
+    """Process-wide judge verdict cache under the artifacts directory."""
+    settings = get_settings()
+    return DiskCache(
+        settings.artifact_path / "judge_cache.db",
+        max_bytes=settings.judge_cache_max_mb * 1024 * 1024,
+    )
+
+
+def _is_retryable(exc: Exception) -> bool:
+    """429s, 5xx and transport errors are worth retrying; other 4xx are not."""
+    import openai
+    if isinstance(exc, (openai.APIConnectionError, openai.APITimeoutError)):
+        return True
+    if isinstance(exc, openai.APIStatusError):
+        return exc.status_code in _RETRYABLE_STATUS or exc.status_code >= 500
+    return False
+
+
+def _percentile(sorted_values: list[float], pct: float) -> float:
+    """Nearest-rank percentile of an ascending list."""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, math.ceil(pct / 100 * len(sorted_values)))
+    return sorted_values[min(rank, len(sorted_values)) - 1]
+
+
+class TokenBucket:
+    """Async token bucket: sustains ``rate`` acquisitions/second with bursts up to ``capacity``."""
+
+    def __init__(self, rate: float, capacity: float | None = None):
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else max(1.0, rate)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self):
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+
+
 class QualityScorer:
     """Scores transcripts using an LLM judge."""
 
-    def __init__(self, api_key: str):
+    def __init__(
+        self,
+        api_key: str,
+        base_url: str = NVIDIA_BASE_URL,
+        model: str = JUDGE_MODEL,
+        max_concurrency: int = 8,
+        requests_per_second: float = 8.0,
+        max_retries: int = 4,
+        backoff_base: float = 0.5,
+        backoff_cap: float = 20.0,
+        cache: DiskCache | None = None,
+    ):
         self.api_key = api_key
+        self.base_url = base_url
+        self.model = model
+        self.max_concurrency = max_concurrency
+        self.requests_per_second = requests_per_second
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_cap = backoff_cap
+        self.cache = cache
         self._client = None
 
     def _get_client(self):
@@ -57,65 +202,45 @@ class QualityScorer:
                 from openai import OpenAI
                 self._client = OpenAI(
                     api_key=self.api_key,
-                    base_url="https://integrate.api.nvidia.com/v1",
+                    base_url=self.base_url,
                 )
             except ImportError:
                 raise RuntimeError("openai package required for quality scoring")
         return self._client
 
-    def score_transcript(self, transcript: dict) -> QualityScores:
-        """Score a single transcript dict using LLM judge."""
+    def _get_async_client(self):
         try:
-            conversation_text = "\n".join(
-                f"[{turn.get('speaker', 'unknown').upper()}]: {turn.get('text', '')}"
-                for turn in transcript.get("conversation", [])
-            )
+            from openai import AsyncOpenAI
+        except ImportError:
+            raise RuntimeError("openai package required for quality scoring")
+        # Retries are handled by score_batch_async so they share the rate limiter.
+        return AsyncOpenAI(api_key=self.api_key, base_url=self.base_url, max_retries=0)
 
-            prompt = QUALITY_JUDGE_PROMPT.format(
-                industry=transcript.get("industry", "unknown"),
-                scenario=transcript.get("scenario", "unknown"),
-                language=transcript.get("language", "english"),
-                conversation=conversation_text[:3000],  # Truncate very long convos
-            )
+    def score_transcript(self, transcript: dict) -> QualityScores:
+        """Score a single transcript dict using LLM judge."""
+        key = judge_cache_key(self.model, transcript) if self.cache is not None else None
+        if key is not None:
+            cached = self.cache.get(key)
+            if cached is not None:
+                return QualityScores.model_validate_json(cached)
 
+        try:
             client = self._get_client()
             response = client.chat.completions.create(
-                model="meta/llama-3.1-8b-instruct",
-                messages=[{"role": "user", "content": prompt}],
+                model=self.model,
+                messages=[{"role": "user", "content": _build_prompt(transcript)}],
                 temperature=0.1,
                 max_tokens=200,
             )
-
-            raw = response.choices[0].message.content.strip()
-            # Extract the first JSON object regardless of markdown fences or
-            # surrounding prose. The previous split("```") approach broke on
-            # uppercase ```JSON fences and silently fell back to neutral scores.
-            match = re.search(r"\{.*\}", raw, re.DOTALL)
-            if not match:
-                raise ValueError(f"No JSON object found in model output: {raw[:200]!r}")
-
-            scores = json.loads(match.group(0))
-            coherence = float(scores.get("coherence", 7.0))
-            diversity = float(scores.get("diversity", 7.0))
-            factual = float(scores.get("factualConsistency", 7.0))
-            overall = round((coherence + diversity + factual) / 3, 2)
-
-            return QualityScores(
-                coherence=round(coherence, 2),
-                diversity=round(diversity, 2),
-                factualConsistency=round(factual, 2),
-                overall=overall,
-            )
-
+            scores = _parse_scores(response.choices[0].message.content.strip())
         except Exception as e:
             logger.warning(f"Quality scoring failed for transcript {transcript.get('id', '?')}: {e}")
             # Return neutral scores on failure rather than crashing
-            return QualityScores(
-                coherence=7.0,
-                diversity=7.0,
-                factualConsistency=7.0,
-                overall=7.0,
-            )
+            return _FALLBACK_SCORES
+
+        if key is not None:
+            self.cache.put(key, scores.model_dump_json(by_alias=True).encode("utf-8"))
+        return scores
 
     def score_batch(self, transcripts: list[dict]) -> list[dict]:
         """Score a list of transcript dicts in-place, adding qualityScores field."""
@@ -123,3 +248,95 @@ class QualityScorer:
             scores = self.score_transcript(t)
             t["qualityScores"] = scores.model_dump(by_alias=True)
         return transcripts
+
+    async def score_batch_async(self, transcripts: list[dict]) -> tuple[list[dict], ScoringSummary]:
+        """Score transcripts concurrently, adding qualityScores in-place.
+
+        Verdicts are looked up by content address first (see judge_cache_key),
+        and identical conversations within the batch are sent to the judge
+        once. At most ``max_concurrency`` requests are in flight and new
+        requests start no faster than ``requests_per_second``. 429/5xx/transport
+        errors are retried with full-jitter exponential backoff; a transcript
+        that still fails gets neutral scores, as in score_transcript, and its
+        verdict is not cached.
+        """
+        keys = [judge_cache_key(self.model, t) for t in transcripts]
+        verdicts: dict[str, QualityScores] = {}
+        if self.cache is not None:
+            cached = await asyncio.to_thread(self.cache.get_many, keys)
+            verdicts = {k: QualityScores.model_validate_json(v) for k, v in cached.items()}
+        cache_hits = sum(1 for k in keys if k in verdicts)
+
+        to_score = {k: t for k, t in zip(keys, transcripts) if k not in verdicts}
+        failed_keys: set[str] = set()
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        bucket = TokenBucket(self.requests_per_second)
+        latencies: list[float] = []
+        stats = {"retries": 0}
+
+        async def score_one(key: str, t: dict):
+            async with semaphore:
+                started = time.monotonic()
+                try:
+                    verdicts[key] = await self._score_with_retries(client, bucket, t, stats)
+                except Exception as e:
+                    logger.warning(f"Quality scoring failed for transcript {t.get('id', '?')}: {e}")
+                    failed_keys.add(key)
+                    verdicts[key] = _FALLBACK_SCORES
+                latencies.append(time.monotonic() - started)
+
+        started = time.monotonic()
+        if to_score:
+            client = self._get_async_client()
+            try:
+                await asyncio.gather(*(score_one(k, t) for k, t in to_score.items()))
+            finally:
+                await client.close()
+        wall = time.monotonic() - started
+
+        if self.cache is not None:
+            fresh = {
+                k: verdicts[k].model_dump_json(by_alias=True).encode("utf-8")
+                for k in to_score if k not in failed_keys
+            }
+            await asyncio.to_thread(self.cache.put_many, fresh)
+
+        for key, t in zip(keys, transcripts):
+            t["qualityScores"] = verdicts[key].model_dump(by_alias=True)
+
+        failed = sum(1 for k in keys if k in failed_keys)
+        latencies.sort()
+        summary = ScoringSummary(
+            scored=len(transcripts) - failed,
+            failed=failed,
+            retries=stats["retries"],
+            cacheHits=cache_hits,
+            cacheMisses=len(transcripts) - cache_hits if self.cache is not None else 0,
+            wallSeconds=round(wall, 3),
+            latencyP50Ms=round(_percentile(latencies, 50) * 1000, 1),
+            latencyP90Ms=round(_percentile(latencies, 90) * 1000, 1),
+            latencyP99Ms=round(_percentile(latencies, 99) * 1000, 1),
+            latencyMaxMs=round((latencies[-1] if latencies else 0.0) * 1000, 1),
+        )
+        return transcripts, summary
+
+    async def _score_with_retries(self, client, bucket: TokenBucket, transcript: dict, stats: dict) -> QualityScores:
+        prompt = _build_prompt(transcript)
+        attempt = 0
+        while True:
+            await bucket.acquire()
+            try:
+                response = await client.chat.completions.create(
+                    model=self.model,
+                    messages=[{"role": "user", "content": prompt}],
+                    temperature=0.1,
+                    max_tokens=200,
+                )
+                return _parse_scores(response.choices[0].message.content.strip())
+            except Exception as e:
+                if attempt >= self.max_retries or not _is_retryable(e):
+                    raise
+                delay = random.uniform(0, min(self.backoff_cap, self.backoff_base * 2 ** attempt))
+                attempt += 1
+                stats["retries"] += 1
+                await asyncio.sleep(delay)
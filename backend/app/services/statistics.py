@@ -1,6 +1,9 @@
 """Dataset statistics computation for generated transcript batches."""
 
+import json
 from collections import Counter
+from dataclasses import dataclass, field
+
 from app.models.transcript import DatasetStats
 
 
@@ -28,11 +31,151 @@ def _quality_bucket(score: float) -> str:
         return "low (0-6)"
 
 
-class StatisticsService:
-    """Computes summary statistics over a list of transcript dicts."""
+# Bumped whenever StatsSketch gains a field; stored sketches of another
+# version are rebuilt from the transcripts instead of being read.
+SKETCH_VERSION = 2
+
+_TURN_BUCKETS = ["2-4", "5-8", "9-12", "13-18", "19-25", "26+"]
+
+# Counter-valued fields of StatsSketch, in DatasetStats order.
+_COUNTER_FIELDS = (
+    "sentiment",
+    "turn_buckets",
+    "industry",
+    "scenario",
+    "language",
+    "resolution",
+    "csat",
+    "quality_buckets",
+)
+
+# Scalar fields of StatsSketch, all plain sums.
+_SUM_FIELDS = (
+    "count",
+    "duration_sum",
+    "turn_sum",
+    "escalated",
+    "csat_sum",
+    "csat_scored",
+    "quality_sum",
+    "quality_scored",
+)
+
+
+@dataclass
+class StatsSketch:
+    """Mergeable summary of a transcript set.
+
+    Every field is a count or a sum, so sketches form a monoid: ``StatsSketch()``
+    is the identity and ``merge`` is associative. The job store keeps one per
+    job, updated as slices are saved, so statistics never need to re-read the
+    transcripts, and sketches of many jobs combine without touching raw data.
+    """
+
+    count: int = 0
+    duration_sum: float = 0.0
+    turn_sum: int = 0
+    escalated: int = 0
+    csat_sum: float = 0.0
+    csat_scored: int = 0
+    quality_sum: float = 0.0
+    quality_scored: int = 0
+    sentiment: Counter = field(default_factory=Counter)
+    turn_buckets: Counter = field(default_factory=Counter)
+    industry: Counter = field(default_factory=Counter)
+    scenario: Counter = field(default_factory=Counter)
+    language: Counter = field(default_factory=Counter)
+    resolution: Counter = field(default_factory=Counter)
+    csat: Counter = field(default_factory=Counter)
+    quality_buckets: Counter = field(default_factory=Counter)
+
+    @classmethod
+    def from_transcripts(cls, transcripts) -> "StatsSketch":
+        sketch = cls()
+        sketch.update(transcripts)
+        return sketch
+
+    def add(self, t: dict):
+        """Fold one transcript into the sketch."""
+        self.count += 1
+
+        # Sentiment
+        self.sentiment[t.get("customer", {}).get("sentiment", "unknown")] += 1
+
+        # Turn length
+        turns = len(t.get("conversation", []))
+        self.turn_buckets[_bucket_turns(turns)] += 1
+        self.turn_sum += turns
+
+        # Industry & Scenario
+        self.industry[t.get("industry", "unknown")] += 1
+        self.scenario[t.get("scenario", "unknown")] += 1
+
+        # Language
+        self.language[t.get("language", "english")] += 1
+
+        # Resolution
+        metadata = t.get("metadata", {})
+        self.resolution[metadata.get("resolutionStatus", "unknown")] += 1
+
+        # CSAT
+        csat = metadata.get("csatScore")
+        if csat is not None:
+            self.csat[str(csat)] += 1
+            if isinstance(csat, (int, float)):
+                self.csat_sum += csat
+                self.csat_scored += 1
+
+        if metadata.get("escalated"):
+            self.escalated += 1
+
+        # Duration
+        self.duration_sum += metadata.get("durationSeconds", 0) or 0
+
+        # Quality score distribution
+        qs = t.get("qualityScores") or t.get("quality_scores")
+        if qs:
+            overall = qs.get("overall", 7.0) if isinstance(qs, dict) else 7.0
+            self.quality_buckets[_quality_bucket(overall)] += 1
+            if isinstance(qs, dict) and isinstance(qs.get("overall"), (int, float)):
+                self.quality_sum += qs["overall"]
+                self.quality_scored += 1
+
+    def update(self, transcripts) -> "StatsSketch":
+        for t in transcripts:
+            self.add(t)
+        return self
+
+    def merge(self, other: "StatsSketch") -> "StatsSketch":
+        """Return the sketch of both transcript sets combined."""
+        merged = StatsSketch(**{
+            name: getattr(self, name) + getattr(other, name) for name in _SUM_FIELDS
+        })
+        for name in _COUNTER_FIELDS:
+            counter = getattr(merged, name)
+            counter.update(getattr(self, name))
+            counter.update(getattr(other, name))
+        return merged
+
+    def to_json(self) -> str:
+        data = {"version": SKETCH_VERSION}
+        data.update({name: getattr(self, name) for name in _SUM_FIELDS})
+        data.update({name: dict(getattr(self, name)) for name in _COUNTER_FIELDS})
+        return json.dumps(data)
+
+    @classmethod
+    def from_json(cls, raw: str) -> "StatsSketch":
+        """Parse a stored sketch; ValueError if it predates SKETCH_VERSION."""
+        data = json.loads(raw)
+        if data.get("version") != SKETCH_VERSION:
+            raise ValueError(f"Stats sketch version {data.get('version')!r} is not {SKETCH_VERSION}")
+        return cls(
+            **{name: data[name] for name in _SUM_FIELDS},
+            **{name: Counter(data.get(name, {})) for name in _COUNTER_FIELDS},
+        )
 
-    def compute(self, transcripts: list[dict]) -> DatasetStats:
-        if not transcripts:
+    def to_stats(self) -> DatasetStats:
+        if not self.count:
             return DatasetStats(
                 sentimentDistribution={},
                 turnLengthHistogram=[],
@@ -46,67 +189,31 @@ class StatisticsService:
                 totalTranscripts=0,
             )
 
-        sentiment_counts = Counter()
-        turn_bucket_counts = Counter()
-        industry_counts = Counter()
-        scenario_counts = Counter()
-        language_counts = Counter()
-        resolution_counts = Counter()
-        csat_counts = Counter()
-        quality_bucket_counts = Counter()
-        total_duration = 0.0
-
-        for t in transcripts:
-            # Sentiment
-            sentiment = t.get("customer", {}).get("sentiment", "unknown")
-            sentiment_counts[sentiment] += 1
-
-            # Turn length
-            num_turns = len(t.get("conversation", []))
-            turn_bucket_counts[_bucket_turns(num_turns)] += 1
-
-            # Industry & Scenario
-            industry_counts[t.get("industry", "unknown")] += 1
-            scenario_counts[t.get("scenario", "unknown")] += 1
-
-            # Language
-            language_counts[t.get("language", "english")] += 1
-
-            # Resolution
-            metadata = t.get("metadata", {})
-            resolution_counts[metadata.get("resolutionStatus", "unknown")] += 1
-
-            # CSAT
-            csat = metadata.get("csatScore")
-            if csat is not None:
-                csat_counts[str(csat)] += 1
-
-            # Duration
-            total_duration += metadata.get("durationSeconds", 0) or 0
-
-            # Quality score distribution
-            qs = t.get("qualityScores") or t.get("quality_scores")
-            if qs:
-                overall = qs.get("overall", 7.0) if isinstance(qs, dict) else 7.0
-                quality_bucket_counts[_quality_bucket(overall)] += 1
-
         # Build histogram list sorted by bucket
-        bucket_order = ["2-4", "5-8", "9-12", "13-18", "19-25", "26+"]
         turn_histogram = [
-            {"range": b, "count": turn_bucket_counts.get(b, 0)} for b in bucket_order
+            {"range": b, "count": self.turn_buckets.get(b, 0)} for b in _TURN_BUCKETS
         ]
 
-        avg_duration = total_duration / len(transcripts) if transcripts else 0.0
-
         return DatasetStats(
-            sentimentDistribution=dict(sentiment_counts),
+            sentimentDistribution=dict(self.sentiment),
             turnLengthHistogram=turn_histogram,
-            industryBreakdown=dict(industry_counts),
-            scenarioBreakdown=dict(scenario_counts),
-            languageDistribution=dict(language_counts),
-            resolutionStatusDistribution=dict(resolution_counts),
-            csatDistribution=dict(csat_counts),
-            qualityScoreDistribution=dict(quality_bucket_counts),
-            avgDurationSeconds=round(avg_duration, 1),
-            totalTranscripts=len(transcripts),
+            industryBreakdown=dict(self.industry),
+            scenarioBreakdown=dict(self.scenario),
+            languageDistribution=dict(self.language),
+            resolutionStatusDistribution=dict(self.resolution),
+            csatDistribution=dict(self.csat),
+            qualityScoreDistribution=dict(self.quality_buckets),
+            avgDurationSeconds=round(self.duration_sum / self.count, 1),
+            totalTranscripts=self.count,
+            avgTurns=round(self.turn_sum / self.count, 2),
+            escalationRate=round(self.escalated / self.count, 4),
+            avgCsat=round(self.csat_sum / self.csat_scored, 2) if self.csat_scored else None,
+            avgQuality=round(self.quality_sum / self.quality_scored, 2) if self.quality_scored else None,
         )
+
+
+class StatisticsService:
+    """Computes summary statistics over a list of transcript dicts."""
+
+    def compute(self, transcripts: list[dict]) -> DatasetStats:
+        return StatsSketch.from_transcripts(transcripts).to_stats()
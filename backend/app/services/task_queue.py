@@ -0,0 +1,254 @@
+"""Durable work queue on top of the job store's SQLite database.
+
+API processes enqueue tasks; any number of workers (``python -m app.worker``
+or the one embedded in the API, see app/worker.py) claim them. A claim is a
+lease: the worker must heartbeat before ``lease_expires_at`` or the task
+becomes claimable again, so work held by a crashed or restarted worker is
+picked up by another instead of staying wedged. Failed attempts are retried
+after a backoff until ``max_attempts`` is used up.
+"""
+
+import json
+import logging
+import time
+import uuid
+from dataclasses import dataclass
+from typing import Optional
+
+from app.services.job_store import JobStore, job_store
+
+logger = logging.getLogger(__name__)
+
+# Statuses a task can be in. Only queued and leased tasks are "active".
+QUEUED = "queued"
+LEASED = "leased"
+DONE = "done"
+FAILED = "failed"
+
+
+class TaskConflict(Exception):
+    """A task of this kind is already running for the job with a different payload."""
+
+    def __init__(self, task_id: str):
+        super().__init__(f"Task {task_id} is already running with different options")
+        self.task_id = task_id
+
+
+@dataclass
+class Task:
+    id: str
+    kind: str
+    job_id: str
+    payload: dict
+    attempts: int
+    max_attempts: int
+    last_error: Optional[str] = None
+
+    @classmethod
+    def from_row(cls, row) -> "Task":
+        return cls(
+            id=row["id"],
+            kind=row["kind"],
+            job_id=row["job_id"],
+            payload=json.loads(row["payload"]),
+            attempts=row["attempts"],
+            max_attempts=row["max_attempts"],
+            last_error=row["last_error"],
+        )
+
+
+class TaskQueue:
+    """Enqueue, lease, heartbeat and settle tasks stored in the ``tasks`` table."""
+
+    def __init__(self, store: JobStore):
+        self.store = store
+
+    def enqueue(self, kind: str, job_id: str, payload: Optional[dict] = None, max_attempts: int = 3) -> str:
+        """Queue a task and return its id.
+
+        Idempotent per (kind, job_id): if such a task is already active its id
+        is returned and nothing new is queued. A queued one with a different
+        payload takes the new payload and starts over with a fresh attempt
+        budget; a leased one with a different payload raises TaskConflict,
+        as the running attempt cannot pick the change up.
+        """
+        now = time.time()
+        payload_json = json.dumps(payload or {})
+        with self.store._get_connection() as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            row = conn.execute(
+                "SELECT id, status, payload FROM tasks WHERE job_id = ? AND kind = ? AND status IN (?, ?)",
+                (job_id, kind, QUEUED, LEASED),
+            ).fetchone()
+            if row is not None:
+                if json.loads(row["payload"]) != (payload or {}):
+                    if row["status"] == LEASED:
+                        conn.commit()
+                        raise TaskConflict(row["id"])
+                    conn.execute(
+                        "UPDATE tasks SET payload = ?, attempts = 0, max_attempts = ?, available_at = ? "
+                        "WHERE id = ?",
+                        (payload_json, max_attempts, now, row["id"]),
+                    )
+                conn.commit()
+                return row["id"]
+            task_id = str(uuid.uuid4())
+            conn.execute(
+                """
+                INSERT INTO tasks (id, kind, job_id, payload, status, attempts,
+                                   max_attempts, available_at, created_at)
+                VALUES (?, ?, ?, ?, ?, 0, ?, ?, ?)
+                """,
+                (task_id, kind, job_id, payload_json, QUEUED, max_attempts, now, now),
+            )
+            conn.commit()
+            return task_id
+
+    def claim(self, worker_id: str, kinds: list[str], lease_seconds: float) -> Optional[Task]:
+        """Lease the oldest runnable task of one of ``kinds``, or return None.
+
+        Runnable means queued and due, or leased with an expired lease and
+        attempts left. BEGIN IMMEDIATE takes the write lock before reading, so
+        two workers can never lease the same task.
+        """
+        now = time.time()
+        placeholders = ", ".join("?" for _ in kinds)
+        with self.store._get_connection() as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            row = conn.execute(
+                f"""
+                SELECT * FROM tasks
+                WHERE kind IN ({placeholders}) AND (
+                    (status = ? AND available_at <= ?)
+                    OR (status = ? AND lease_expires_at < ? AND attempts < max_attempts)
+                )
+                ORDER BY available_at LIMIT 1
+                """,
+                (*kinds, QUEUED, now, LEASED, now),
+            ).fetchone()
+            if row is None:
+                conn.commit()
+                return None
+            if row["status"] == LEASED:
+                logger.warning(
+                    "Task %s (%s for job %s) lease held by %s expired; reclaiming",
+                    row["id"], row["kind"], row["job_id"], row["lease_owner"],
+                )
+            conn.execute(
+                """
+                UPDATE tasks SET status = ?, attempts = attempts + 1,
+                                 lease_owner = ?, lease_expires_at = ?
+                WHERE id = ?
+                """,
+                (LEASED, worker_id, now + lease_seconds, row["id"]),
+            )
+            conn.commit()
+            task = Task.from_row(row)
+            task.attempts += 1
+            return task
+
+    def heartbeat(self, task_id: str, worker_id: str, lease_seconds: float) -> bool:
+        """Extend a lease. False means the lease was lost and the work must stop."""
+        with self.store._get_connection() as conn:
+            cursor = conn.execute(
+                "UPDATE tasks SET lease_expires_at = ? WHERE id = ? AND status = ? AND lease_owner = ?",
+                (time.time() + lease_seconds, task_id, LEASED, worker_id),
+            )
+            conn.commit()
+            return cursor.rowcount == 1
+
+    def complete(self, task_id: str, worker_id: str) -> bool:
+        return self._settle(task_id, worker_id, DONE)
+
+    def fail(self, task_id: str, worker_id: str, error: str, retry_delay: float) -> bool:
+        """Record a failed attempt. Returns True if the task will be retried.
+
+        The task is re-queued ``retry_delay`` seconds out while it has
+        attempts left, and marked failed otherwise.
+        """
+        with self.store._get_connection() as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            row = conn.execute(
+                "SELECT attempts, max_attempts FROM tasks WHERE id = ? AND status = ? AND lease_owner = ?",
+                (task_id, LEASED, worker_id),
+            ).fetchone()
+            if row is None:
+                conn.commit()
+                return False
+            retry = row["attempts"] < row["max_attempts"]
+            conn.execute(
+                """
+                UPDATE tasks SET status = ?, available_at = ?, last_error = ?,
+                                 lease_owner = NULL, lease_expires_at = NULL
+                WHERE id = ?
+                """,
+                (QUEUED if retry else FAILED, time.time() + retry_delay, error[:1000], task_id),
+            )
+            conn.commit()
+            return retry
+
+    def release(self, task_id: str, worker_id: str):
+        """Hand a task back without counting the attempt (e.g. worker shutdown)."""
+        with self.store._get_connection() as conn:
+            conn.execute(
+                """
+                UPDATE tasks SET status = ?, attempts = attempts - 1, available_at = ?,
+                                 lease_owner = NULL, lease_expires_at = NULL
+                WHERE id = ? AND status = ? AND lease_owner = ?
+                """,
+                (QUEUED, time.time(), task_id, LEASED, worker_id),
+            )
+            conn.commit()
+
+    def reap_expired(self, kinds: list[str]) -> list[Task]:
+        """Fail tasks whose lease expired on their last attempt and return them.
+
+        These were held by workers that died mid-task every time; the caller
+        reports the failure on the job since no handler will run again.
+        """
+        now = time.time()
+        placeholders = ", ".join("?" for _ in kinds)
+        with self.store._get_connection() as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            rows = conn.execute(
+                f"""
+                SELECT * FROM tasks
+                WHERE kind IN ({placeholders}) AND status = ?
+                  AND lease_expires_at < ? AND attempts >= max_attempts
+                """,
+                (*kinds, LEASED, now),
+            ).fetchall()
+            reaped = []
+            for row in rows:
+                task = Task.from_row(row)
+                task.last_error = f"Worker {row['lease_owner']} stopped responding on the final attempt"
+                conn.execute(
+                    "UPDATE tasks SET status = ?, last_error = ?, lease_owner = NULL, lease_expires_at = NULL "
+                    "WHERE id = ?",
+                    (FAILED, task.last_error, task.id),
+                )
+                reaped.append(task)
+            conn.commit()
+            return reaped
+
+    def has_active(self, job_id: str, kind: str) -> bool:
+        with self.store._get_connection() as conn:
+            row = conn.execute(
+                "SELECT 1 FROM tasks WHERE job_id = ? AND kind = ? AND status IN (?, ?) LIMIT 1",
+                (job_id, kind, QUEUED, LEASED),
+            ).fetchone()
+            return row is not None
+
+    def _settle(self, task_id: str, worker_id: str, status: str) -> bool:
+        with self.store._get_connection() as conn:
+            cursor = conn.execute(
+                "UPDATE tasks SET status = ?, lease_owner = NULL, lease_expires_at = NULL "
+                "WHERE id = ? AND status = ? AND lease_owner = ?",
+                (status, task_id, LEASED, worker_id),
+            )
+            conn.commit()
+            return cursor.rowcount == 1
+
+
+# Global instance, sharing the job store's database
+task_queue = TaskQueue(job_store)
@@ -0,0 +1,140 @@
+"""Compressed encoding of the transcript documents kept in ``transcripts.data``.
+
+Generated transcripts repeat the same keys, greetings and scenario names over
+and over, so they compress well, and better still with a zstd dictionary
+trained on them. A stored value is one of:
+
+* ``str`` - plain JSON, as written before compression existed (or with
+  ``TRANSCRIPT_COMPRESSION=none``);
+* ``bytes`` tagged ``ZLIB`` (first byte 0x01) - a zlib stream of the JSON;
+* ``bytes`` tagged ``ZSTD`` (first byte 0x02) - a zstd frame of the JSON. Frames made
+  with a dictionary carry its id in the frame header, and the dictionary
+  itself is stored in the ``transcript_dicts`` table under that id.
+
+Every reader accepts all three, so rows written by older versions or under a
+different setting stay readable; ``JobStore.recompress_results`` rewrites them
+in the current encoding.
+"""
+
+import logging
+import threading
+import zlib
+from typing import Callable, Optional
+
+from app.services import json_codec
+
+try:
+    import zstandard
+except ImportError:  # optional: falls back to zlib
+    zstandard = None
+
+logger = logging.getLogger(__name__)
+
+COMPRESSION_METHODS = ("zstd", "zlib", "none")
+
+ZLIB = b"\x01"
+ZSTD = b"\x02"
+
+ZLIB_LEVEL = 6
+ZSTD_LEVEL = 3
+# Dictionary training: target size, and how many stored transcripts must exist
+# (and at most how many are sampled) before one is trained.
+DICT_SIZE = 64 * 1024
+DICT_MIN_SAMPLES = 200
+DICT_MAX_SAMPLES = 2000
+
+
+class TranscriptCodec:
+    """Encodes transcripts for storage and decodes any stored form.
+
+    ``load_dictionary(dict_id)`` fetches a stored zstd dictionary the first
+    time a frame referencing it is read. zstandard compressors are not
+    thread-safe, so each thread keeps its own.
+    """
+
+    def __init__(self, method: str, load_dictionary: Callable[[int], Optional[bytes]]):
+        if method not in COMPRESSION_METHODS:
+            raise ValueError(f"Unknown transcript compression {method!r}")
+        if method == "zstd" and zstandard is None:
+            logger.warning("zstandard is not installed; compressing transcripts with zlib")
+            method = "zlib"
+        self.method = method
+        self._load_dictionary = load_dictionary
+        self._dictionaries: dict[int, "zstandard.ZstdCompressionDict"] = {}
+        self._dictionary_id = 0  # the one new rows are compressed with; 0 = none
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    @property
+    def wants_dictionary(self) -> bool:
+        return self.method == "zstd" and not self._dictionary_id
+
+    def use_dictionary(self, data: bytes) -> int:
+        """Compress new rows with this dictionary from now on; returns its id."""
+        dictionary = zstandard.ZstdCompressionDict(data)
+        dict_id = dictionary.dict_id()
+        with self._lock:
+            self._dictionaries[dict_id] = dictionary
+            self._dictionary_id = dict_id
+        return dict_id
+
+    @staticmethod
+    def train_dictionary(samples: list[bytes]) -> bytes:
+        return zstandard.train_dictionary(DICT_SIZE, samples, level=ZSTD_LEVEL).as_bytes()
+
+    def encode(self, t: dict):
+        if self.method == "none":
+            return json_codec.dumps(t)
+        raw = json_codec.dumpb(t)
+        if self.method == "zlib":
+            return ZLIB + zlib.compress(raw, ZLIB_LEVEL)
+        return ZSTD + self._compressor(self._dictionary_id).compress(raw)
+
+    def decode(self, value) -> dict:
+        if isinstance(value, str):
+            return json_codec.loads(value)
+        tag, body = value[:1], value[1:]
+        if tag == ZLIB:
+            return json_codec.loads(zlib.decompress(body))
+        if tag == ZSTD:
+            if zstandard is None:
+                raise RuntimeError("zstandard is required to read zstd-compressed transcripts")
+            dict_id = zstandard.get_frame_parameters(body).dict_id
+            return json_codec.loads(self._decompressor(dict_id).decompress(body))
+        raise ValueError(f"Unrecognised transcript encoding {tag!r}")
+
+    def is_current(self, value) -> bool:
+        """Whether a stored value is already in the encoding ``encode`` produces."""
+        if self.method == "none":
+            return isinstance(value, str)
+        if isinstance(value, str):
+            return False
+        if self.method == "zlib":
+            return value[:1] == ZLIB
+        return value[:1] == ZSTD and zstandard.get_frame_parameters(value[1:]).dict_id == self._dictionary_id
+
+    def _dictionary(self, dict_id: int):
+        with self._lock:
+            dictionary = self._dictionaries.get(dict_id)
+        if dictionary is None:
+            data = self._load_dictionary(dict_id)
+            if data is None:
+                raise RuntimeError(f"zstd dictionary {dict_id} is missing from the database")
+            dictionary = zstandard.ZstdCompressionDict(data)
+            with self._lock:
+                self._dictionaries[dict_id] = dictionary
+        return dictionary
+
+    def _compressor(self, dict_id: int):
+        compressors = self._local.__dict__.setdefault("compressors", {})
+        if dict_id not in compressors:
+            dictionary = self._dictionary(dict_id) if dict_id else None
+            compressors[dict_id] = zstandard.ZstdCompressor(level=ZSTD_LEVEL, dict_data=dictionary)
+        return compressors[dict_id]
+
+    def _decompressor(self, dict_id: int):
+        decompressors = self._local.__dict__.setdefault("decompressors", {})
+        if dict_id not in decompressors:
+            dictionary = self._dictionary(dict_id) if dict_id else None
+            decompressors[dict_id] = zstandard.ZstdDecompressor(dict_data=dictionary)
+        return decompressors[dict_id]
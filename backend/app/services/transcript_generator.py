@@ -430,9 +430,17 @@ Return a JSON object with:
         except Exception as e:
             raise RuntimeError(f"Generation failed: {str(e)}")
 
-    async def generate_batch(self, config: GenerationConfig) -> list[Transcript]:
-        """Generate a full batch of transcripts."""
+    async def generate_batch(
+        self, config: GenerationConfig, num_records: int | None = None
+    ) -> list[Transcript]:
+        """Generate a batch of transcripts.
+
+        ``num_records`` overrides ``config.num_records`` so callers can generate a
+        large job as a series of smaller slices.
+        """
         builder = self._build_config(config)
+        if num_records is None:
+            num_records = config.num_records
 
         try:
             # data_designer.create is a long, blocking call — keep it off the
@@ -440,7 +448,7 @@ Return a JSON object with:
             results = await asyncio.to_thread(
                 self.data_designer.create,
                 builder,
-                num_records=config.num_records,
+                num_records=num_records,
                 dataset_name=f"transcripts_{datetime.now().strftime('%Y%m%d_%H%M%S')}",
             )
             df = await asyncio.to_thread(results.load_dataset)
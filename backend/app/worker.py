@@ -0,0 +1,201 @@
+"""Task queue worker: runs queued generation, DPO and audio tasks.
+
+Run standalone with ``python -m app.worker`` (any number of processes, sharing
+jobs.db), or let the API run one in-process (``EMBEDDED_WORKER``, the default).
+"""
+
+import asyncio
+import logging
+import os
+import random
+import signal
+import socket
+import threading
+import uuid
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Awaitable, Callable
+
+from dotenv import load_dotenv
+
+from app.config import get_settings
+from app.services.task_queue import Task, TaskQueue, task_queue
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class TaskHandler:
+    # Runs one attempt; raising fails the attempt.
+    run: Callable[[Task], Awaitable[None]]
+    # Called once the task has no attempts left, to record the failure on the job.
+    give_up: Callable[[Task, str], None]
+
+
+def _handlers() -> dict[str, TaskHandler]:
+    # Imported here so the worker and the routers can import each other's module.
+    from app.routers.generate import fail_batch_generation, run_batch_generation
+    from app.routers.jobs import _write_background_error, run_audio_generation, run_dpo_generation
+
+    async def run_audio(task: Task):
+        # Cancelling to_thread leaves the thread running; the event stops it.
+        cancel = threading.Event()
+        try:
+            await asyncio.to_thread(
+                run_audio_generation,
+                task.job_id,
+                audio_format=task.payload.get("audioFormat", "wav"),
+                use_cache=task.payload.get("useCache", True),
+                cancel=cancel,
+            )
+        finally:
+            cancel.set()
+
+    def write_error(kind: str):
+        def give_up(task: Task, error: str):
+            _write_background_error(get_settings().artifact_path, task.job_id, kind, RuntimeError(error))
+        return give_up
+
+    return {
+        "generate": TaskHandler(
+            run=lambda task: run_batch_generation(task.job_id),
+            give_up=lambda task, error: fail_batch_generation(task.job_id, error),
+        ),
+        "dpo": TaskHandler(
+            # Only the first attempt honours restart; retries resume the partial file.
+            run=lambda task: run_dpo_generation(
+                task.job_id, restart=task.payload.get("restart", False) and task.attempts == 1
+            ),
+            give_up=write_error("dpo"),
+        ),
+        "audio": TaskHandler(
+            run=run_audio,
+            give_up=write_error("audio"),
+        ),
+    }
+
+
+class Worker:
+    """Claims tasks from the queue and runs up to ``concurrency`` at a time.
+
+    Each running task is heartbeated every third of its lease. If a heartbeat
+    finds the lease gone (it expired and another worker reclaimed the task, or
+    the job was deleted) the attempt is cancelled; audio attempts run in a
+    thread, which stops at its next transcript and discards its partial
+    archive. On ``stop()`` the running tasks
+    are cancelled and handed back to the queue without using up an attempt.
+    """
+
+    def __init__(
+        self,
+        queue: TaskQueue = task_queue,
+        handlers: dict[str, TaskHandler] | None = None,
+        concurrency: int = 2,
+        lease_seconds: float = 60.0,
+        poll_interval: float = 1.0,
+        backoff_base: float = 5.0,
+        backoff_cap: float = 300.0,
+        worker_id: str | None = None,
+    ):
+        self.queue = queue
+        self.handlers = handlers if handlers is not None else _handlers()
+        self.concurrency = concurrency
+        self.lease_seconds = lease_seconds
+        self.poll_interval = poll_interval
+        self.backoff_base = backoff_base
+        self.backoff_cap = backoff_cap
+        self.worker_id = worker_id or f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:6]}"
+        self._stopping = asyncio.Event()
+
+    def stop(self):
+        self._stopping.set()
+
+    async def run(self):
+        kinds = list(self.handlers)
+        running: set[asyncio.Task] = set()
+        logger.info("Worker %s started (kinds: %s, concurrency: %d)", self.worker_id, kinds, self.concurrency)
+        stop_wait = asyncio.create_task(self._stopping.wait())
+        try:
+            while not self._stopping.is_set():
+                for task in await asyncio.to_thread(self.queue.reap_expired, kinds):
+                    logger.error("Task %s (%s for job %s) gave up: %s", task.id, task.kind, task.job_id, task.last_error)
+                    self._give_up(task, task.last_error)
+
+                while len(running) < self.concurrency:
+                    task = await asyncio.to_thread(self.queue.claim, self.worker_id, kinds, self.lease_seconds)
+                    if task is None:
+                        break
+                    running.add(asyncio.create_task(self._execute(task)))
+
+                done, _ = await asyncio.wait(
+                    running | {stop_wait}, timeout=self.poll_interval, return_when=asyncio.FIRST_COMPLETED
+                )
+                running -= done
+        finally:
+            stop_wait.cancel()
+            for execution in running:
+                execution.cancel()
+            await asyncio.gather(*running, return_exceptions=True)
+            logger.info("Worker %s stopped", self.worker_id)
+
+    async def _execute(self, task: Task):
+        logger.info(
+            "Running task %s (%s for job %s), attempt %d/%d",
+            task.id, task.kind, task.job_id, task.attempts, task.max_attempts,
+        )
+        attempt = asyncio.create_task(self.handlers[task.kind].run(task))
+        heartbeat = asyncio.create_task(self._heartbeat(task, attempt))
+        try:
+            await attempt
+        except asyncio.CancelledError:
+            if heartbeat.done() and not heartbeat.cancelled() and heartbeat.result() is False:
+                logger.warning("Task %s lost its lease; abandoned", task.id)
+                return
+            attempt.cancel()
+            await asyncio.to_thread(self.queue.release, task.id, self.worker_id)
+            raise
+        except Exception as e:
+            logger.exception("Task %s (%s for job %s) failed", task.id, task.kind, task.job_id)
+            delay = random.uniform(0, min(self.backoff_cap, self.backoff_base * 2 ** (task.attempts - 1)))
+            if not await asyncio.to_thread(self.queue.fail, task.id, self.worker_id, str(e), delay):
+                self._give_up(task, str(e))
+        else:
+            await asyncio.to_thread(self.queue.complete, task.id, self.worker_id)
+        finally:
+            heartbeat.cancel()
+
+    async def _heartbeat(self, task: Task, attempt: asyncio.Task) -> bool:
+        while not attempt.done():
+            await asyncio.sleep(self.lease_seconds / 3)
+            if not await asyncio.to_thread(self.queue.heartbeat, task.id, self.worker_id, self.lease_seconds):
+                attempt.cancel()
+                return False
+        return True
+
+    def _give_up(self, task: Task, error: str):
+        try:
+            self.handlers[task.kind].give_up(task, error)
+        except Exception:
+            logger.exception("Could not record failure of task %s", task.id)
+
+
+def worker_from_settings() -> Worker:
+    settings = get_settings()
+    return Worker(concurrency=settings.worker_concurrency, lease_seconds=settings.task_lease_seconds)
+
+
+async def _main():
+    worker = worker_from_settings()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, worker.stop)
+    try:
+        await worker.run()
+    finally:
+        worker.queue.store.close()
+
+
+if __name__ == "__main__":
+    load_dotenv(Path(__file__).parent.parent.parent / ".env")
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(name)s: %(message)s")
+    asyncio.run(_main())
@@ -0,0 +1,116 @@
+"""Encode/decode throughput of each installed JSON backend on transcript-shaped data.
+
+    cd backend && python -m benchmarks.bench_json [--transcripts 2000] [--repeat 5]
+
+Transcripts are synthetic but shaped like generated ones (profiles, 4-16
+turns, metadata, quality scores). Reports the best of ``--repeat`` runs per
+operation, plus the zstd/zlib round trip the job store adds on top.
+"""
+
+import argparse
+import random
+import time
+import uuid
+import zlib
+
+from app.services import json_codec
+from app.services.transcript_codec import ZLIB_LEVEL, ZSTD_LEVEL, zstandard
+
+_LINES = [
+    "Thank you for calling, my name is {agent}. How can I help you today?",
+    "Hi, I was charged twice for my last order and I'd like a refund.",
+    "I'm sorry to hear that. Could you confirm the account number for me?",
+    "Sure, it's {number}. This is the second time this has happened.",
+    "I can see both charges. I've reversed the duplicate; it'll show in 3-5 business days.",
+    "Great, thanks. Is there anything I need to do on my side?",
+    "No, you're all set. Is there anything else I can help with?",
+    "No, that's everything. Thanks for your help, {agent}.",
+]
+_NAMES = ["Maria Garcia", "James Smith", "Wei Chen", "Amara Okafor", "Priya Patel", "Linda Park"]
+
+
+def make_transcript(rng: random.Random) -> dict:
+    agent = rng.choice(_NAMES)
+    turns = rng.randint(4, 16)
+    return {
+        "id": str(uuid.UUID(int=rng.getrandbits(128))),
+        "industry": rng.choice(["retail", "finance", "telecom", "healthcare"]),
+        "scenario": rng.choice(["billing_dispute", "refund_request", "technical_support"]),
+        "callType": "inbound",
+        "customer": {
+            "name": rng.choice(_NAMES),
+            "sentiment": rng.choice(["frustrated", "neutral", "satisfied"]),
+            "issueComplexity": rng.choice(["low", "medium", "high"]),
+        },
+        "agent": {"name": agent, "department": "Customer Care", "experienceLevel": "senior"},
+        "conversation": [
+            {
+                "speaker": "agent" if i % 2 == 0 else "customer",
+                "text": _LINES[i % len(_LINES)].format(agent=agent, number=rng.randint(10**7, 10**8)),
+                "timestamp": f"00:{i // 2:02d}:{(i * 17) % 60:02d}",
+            }
+            for i in range(turns)
+        ],
+        "metadata": {
+            "durationSeconds": rng.randint(60, 1200),
+            "resolutionStatus": rng.choice(["resolved", "escalated", "unresolved"]),
+            "csatScore": rng.randint(1, 5),
+            "callReasonPrimary": "billing",
+            "escalated": rng.random() < 0.1,
+        },
+        "createdAt": "2026-01-01T12:00:00Z",
+        "language": "english",
+        "qualityScores": {"overall": round(rng.uniform(4, 10), 2), "coherence": round(rng.uniform(4, 10), 2)},
+    }
+
+
+def _best(fn, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--transcripts", type=int, default=2000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    transcripts = [make_transcript(rng) for _ in range(args.transcripts)]
+    encoded = [json_codec.BACKENDS["stdlib"].dumpb(t) for t in transcripts]
+    mb = sum(map(len, encoded)) / 2**20
+    n = len(transcripts)
+    print(f"{n} transcripts, {mb:.1f} MB of JSON ({mb * 2**20 / n:.0f} B each), best of {args.repeat}\n")
+    print(f"{'backend':<10}{'op':<14}{'ms':>9}{'MB/s':>9}{'docs/s':>11}")
+
+    def row(name: str, op: str, seconds: float):
+        print(f"{name:<10}{op:<14}{seconds * 1000:>9.1f}{mb / seconds:>9.0f}{n / seconds:>11.0f}")
+
+    for name, backend in json_codec.BACKENDS.items():
+        row(name, "encode", _best(lambda: [backend.dumpb(t) for t in transcripts], args.repeat))
+        row(name, "decode", _best(lambda: [backend.loads(b) for b in encoded], args.repeat))
+        row(name, "encode pretty", _best(lambda: [backend.dumpb_pretty(t) for t in transcripts], args.repeat))
+
+    print()
+    zlibbed = [zlib.compress(b, ZLIB_LEVEL) for b in encoded]
+    print(f"zlib:  {sum(map(len, zlibbed)) / 2**20:.2f} MB")
+    row("zlib", "compress", _best(lambda: [zlib.compress(b, ZLIB_LEVEL) for b in encoded], args.repeat))
+    row("zlib", "decompress", _best(lambda: [zlib.decompress(b) for b in zlibbed], args.repeat))
+    if zstandard is not None:
+        dictionary = zstandard.ZstdCompressionDict(
+            zstandard.train_dictionary(64 * 1024, encoded[:2000], level=ZSTD_LEVEL).as_bytes()
+        )
+        compressor = zstandard.ZstdCompressor(level=ZSTD_LEVEL, dict_data=dictionary)
+        decompressor = zstandard.ZstdDecompressor(dict_data=dictionary)
+        frames = [compressor.compress(b) for b in encoded]
+        print(f"zstd+dict: {sum(map(len, frames)) / 2**20:.2f} MB")
+        row("zstd+dict", "compress", _best(lambda: [compressor.compress(b) for b in encoded], args.repeat))
+        row("zstd+dict", "decompress", _best(lambda: [decompressor.decompress(f) for f in frames], args.repeat))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,21 @@
+import os
+import shutil
+import tempfile
+
+_original_cwd = None
+_scratch_dir = None
+
+
+def pytest_configure(config):
+    # Importing app.services opens the global JobStore, which creates jobs.db
+    # in the working directory; run from a scratch directory so the suite
+    # never writes into the checkout.
+    global _original_cwd, _scratch_dir
+    _original_cwd = os.getcwd()
+    _scratch_dir = tempfile.mkdtemp(prefix="backend-tests-")
+    os.chdir(_scratch_dir)
+
+
+def pytest_unconfigure(config):
+    os.chdir(_original_cwd)
+    shutil.rmtree(_scratch_dir, ignore_errors=True)
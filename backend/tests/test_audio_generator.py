@@ -0,0 +1,121 @@
+"""AudioGenerator with an injected fake SpeechSynthesisServiceStub."""
+
+import threading
+import time
+import wave
+from io import BytesIO
+from types import SimpleNamespace
+
+from app.services.audio_generator import AGENT_VOICE, AudioGenerator
+from app.services.disk_cache import DiskCache
+
+
+class FakeTTS:
+    """Stands in for riva.client.SpeechSynthesisServiceStub.
+
+    Each call takes ``delay`` seconds and returns PCM derived from the text, so
+    audio for different turns differs and can be compared across runs.
+    """
+
+    def __init__(self, delay: float = 0.05, fail: bool = False):
+        self.delay = delay
+        self.fail = fail
+        self.calls: list[tuple[str, str]] = []
+        self._lock = threading.Lock()
+
+    def Synthesize(self, request):
+        with self._lock:
+            self.calls.append((request.voice_name, request.text))
+        time.sleep(self.delay)
+        if self.fail:
+            raise RuntimeError("synthesis unavailable")
+        return SimpleNamespace(audio=request.text.encode("utf-8").ljust(64, b"\0")[:64])
+
+
+def _transcript(*turns: tuple[str, str], sentiment: str = "neutral") -> dict:
+    return {
+        "id": "t",
+        "customer": {"sentiment": sentiment},
+        "conversation": [{"speaker": speaker, "text": text} for speaker, text in turns],
+    }
+
+
+CALL = _transcript(
+    ("agent", "Thank you for calling, how can I help?"),
+    ("customer", "I need to check my balance."),
+    ("agent", "One moment please."),
+    ("customer", "Thanks."),
+    ("agent", "One moment please."),
+)
+
+
+def _frames(wav_bytes: bytes) -> bytes:
+    with wave.open(BytesIO(wav_bytes), "rb") as w:
+        return w.readframes(w.getnframes())
+
+
+def test_identical_in_flight_turns_share_one_call():
+    tts = FakeTTS()
+    generator = AudioGenerator(max_concurrency=4, stub=tts)
+
+    audio = generator.generate_transcript_audio(CALL)
+
+    assert len(tts.calls) == 4
+    assert tts.calls.count((AGENT_VOICE, "One moment please.")) == 1
+    assert generator.cache_stats()["hits"] == 1
+    assert _frames(audio).count(b"One moment please.") == 2
+
+
+def test_same_text_in_different_voices_is_synthesised_separately():
+    tts = FakeTTS()
+    generator = AudioGenerator(max_concurrency=4, stub=tts)
+
+    generator.generate_transcript_audio(_transcript(("agent", "Hello."), ("customer", "Hello.")))
+
+    assert len(tts.calls) == 2
+
+
+def test_cached_segments_skip_synthesis(tmp_path):
+    cache = DiskCache(tmp_path / "tts_cache.db")
+    first = AudioGenerator(stub=FakeTTS(), cache=cache).generate_transcript_audio(CALL)
+
+    tts = FakeTTS()
+    generator = AudioGenerator(stub=tts, cache=cache)
+    second = generator.generate_transcript_audio(CALL)
+
+    assert tts.calls == []
+    assert generator.cache_stats() == {"hits": 5, "misses": 0, "hitRate": 1.0}
+    assert second == first
+
+
+def test_whitespace_variants_share_a_cached_segment(tmp_path):
+    cache = DiskCache(tmp_path / "tts_cache.db")
+    AudioGenerator(stub=FakeTTS(), cache=cache).generate_transcript_audio(_transcript(("agent", "Please  hold.")))
+
+    tts = FakeTTS()
+    AudioGenerator(stub=tts, cache=cache).generate_transcript_audio(_transcript(("agent", " Please hold.\n")))
+
+    assert tts.calls == []
+
+
+def test_failed_synthesis_is_not_cached(tmp_path):
+    cache = DiskCache(tmp_path / "tts_cache.db")
+    audio = AudioGenerator(stub=FakeTTS(fail=True), cache=cache).generate_transcript_audio(CALL)
+
+    assert set(_frames(audio)) == {0}
+    assert cache.stats()["entries"] == 0
+
+    tts = FakeTTS()
+    AudioGenerator(stub=tts, cache=cache).generate_transcript_audio(CALL)
+    assert len(tts.calls) == 4
+
+
+def test_placeholders_bypass_the_cache(tmp_path):
+    cache = DiskCache(tmp_path / "tts_cache.db")
+    generator = AudioGenerator(cache=cache)
+
+    audio = generator.generate_transcript_audio(CALL)
+
+    assert set(_frames(audio)) == {0}
+    assert cache.stats()["entries"] == 0
+    assert generator.cache_stats() == {"hits": 0, "misses": 0, "hitRate": 0.0}
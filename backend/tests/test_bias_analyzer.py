@@ -0,0 +1,59 @@
+"""BiasAccumulator over streamed transcripts."""
+
+import random
+
+from app.services.bias_analyzer import UPDATE_BATCH_SIZE, BiasAccumulator
+
+TURNS = [
+    ("agent", "He said his manager would call you back."),
+    ("customer", "She told me her order was lost."),
+    ("customer", "This is stupid, I hate this service."),
+    ("agent", "I understand, let me check that for you."),
+    ("customer", "Thanks, that helps."),
+]
+NAMES = ["Maria Garcia", "John Smith", "Priya Patel", "Kofi Mensah", "Yuki Tanaka"]
+
+
+def transcripts(n: int, seed: int = 0) -> list[dict]:
+    rng = random.Random(seed)
+    return [
+        {
+            "id": f"transcript-{i}",
+            "customer": {"name": rng.choice(NAMES), "sentiment": rng.choice(["neutral", "angry"])},
+            "agent": {"name": rng.choice(NAMES)},
+            "conversation": [{"speaker": s, "text": t} for s, t in rng.sample(TURNS, 3)],
+        }
+        for i in range(n)
+    ]
+
+
+def test_update_streams_in_bounded_batches():
+    data = transcripts(5 * UPDATE_BATCH_SIZE + 7)
+    pulled = 0
+    lead = 0
+    acc = BiasAccumulator()
+
+    def stream():
+        nonlocal pulled, lead
+        for t in data:
+            pulled += 1
+            # Transcripts pulled but not yet folded into the totals.
+            lead = max(lead, pulled - acc.total)
+            yield t
+
+    acc.update(stream())
+
+    assert acc.total == len(data)
+    assert lead <= UPDATE_BATCH_SIZE
+
+
+def test_batching_does_not_change_the_report():
+    data = transcripts(3 * UPDATE_BATCH_SIZE, seed=1)
+    one_by_one = BiasAccumulator()
+    for t in data:
+        one_by_one.add(t)
+
+    streamed = BiasAccumulator().update(iter(data))
+
+    assert streamed == one_by_one
+    assert streamed.flag_count > 0
@@ -0,0 +1,217 @@
+"""NemoCurator stages checked against straightforward reference implementations."""
+
+import os
+import random
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from app.services import nemo_curator
+from app.services.nemo_curator import (
+    PII_PATTERNS,
+    NemoCurator,
+    PIIRedactor,
+    _conversation_fingerprint,
+    _LSHIndex,
+    _minhash_signatures,
+    _near_duplicate_mask,
+    _redact_pii,
+    near_duplicate_groups,
+)
+
+THRESHOLD = NemoCurator.SIMILARITY_THRESHOLD
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+
+PHRASES = [
+    "Thank you for calling, my name is Emily.",
+    "I need help with my card ending 4242 4242 4242 4242.",
+    "Call me at 555-123-4567 please.",
+    "My email is john.doe@example.com",
+    "My SSN is 123-45-6789",
+    "I was born 01/02/1980 in 90210.",
+    "Let me check that for you.",
+    "Is there anything else?",
+    "No that's all, thanks!",
+    "I'm frustrated with the service.",
+    "The order hasn't arrived yet.",
+    "Can you reset my password?",
+]
+
+
+def templated_transcripts(n: int, seed: int) -> list[dict]:
+    """Call-center transcripts assembled from a handful of stock phrases."""
+    rng = random.Random(seed)
+    transcripts = []
+    for i in range(n):
+        conversation = [
+            {
+                "speaker": "agent" if turn % 2 == 0 else "customer",
+                "text": rng.choice(PHRASES) + (f" extra {rng.randint(0, 3)}" if rng.random() < 0.3 else ""),
+            }
+            for turn in range(rng.randint(2, 9))
+        ]
+        transcript = {"id": f"tx-{i}", "industry": "finance", "conversation": conversation}
+        if rng.random() < 0.5:
+            transcript["qualityScores"] = {"overall": rng.uniform(4, 10)}
+        transcripts.append(transcript)
+    return transcripts
+
+
+def jaccard(a: str, b: str) -> float:
+    tokens_a, tokens_b = set(a.split()), set(b.split())
+    if not tokens_a and not tokens_b:
+        return 1.0
+    if not tokens_a or not tokens_b:
+        return 0.0
+    return len(tokens_a & tokens_b) / len(tokens_a | tokens_b)
+
+
+def exact_mask(fingerprints: list[str], threshold: float) -> list[bool]:
+    """The all-pairs greedy pass _near_duplicate_mask must reproduce."""
+    keep = [True] * len(fingerprints)
+    for i in range(len(fingerprints)):
+        if not keep[i]:
+            continue
+        for j in range(i + 1, len(fingerprints)):
+            if keep[j] and jaccard(fingerprints[i], fingerprints[j]) >= threshold:
+                keep[j] = False
+    return keep
+
+
+def sequential_redact(text: str) -> tuple[str, int]:
+    """Redaction as it was done before PIIRedactor: each pattern in turn."""
+    count = 0
+    for pattern, replacement in PII_PATTERNS:
+        text, n = pattern.subn(replacement, text)
+        count += n
+    return text, count
+
+
+def mutated_corpus(n: int, seed: int) -> list[str]:
+    """Token strings drawn from a few bases with varying numbers of edits."""
+    rng = random.Random(seed)
+    vocab = [f"w{i}" for i in range(300)]
+    bases = [[rng.choice(vocab) for _ in range(40)] for _ in range(30)]
+    corpus = []
+    for _ in range(n):
+        tokens = list(rng.choice(bases))
+        for _ in range(rng.choice([0, 0, 1, 2, 3, 6, 15])):
+            tokens[rng.randrange(len(tokens))] = rng.choice(vocab)
+        corpus.append(" ".join(tokens) if rng.random() > 0.01 else "")
+    return corpus
+
+
+@pytest.mark.parametrize("seed", range(3))
+def test_near_duplicate_mask_matches_exact_pass(seed):
+    templated = [_conversation_fingerprint(t) for t in templated_transcripts(600, seed)]
+    for fingerprints in (templated, mutated_corpus(600, seed)):
+        assert _near_duplicate_mask(fingerprints, THRESHOLD) == exact_mask(fingerprints, THRESHOLD)
+
+
+def test_pure_python_signatures_match_numpy(monkeypatch):
+    if nemo_curator.np is None:
+        pytest.skip("numpy is not installed")
+    token_sets = [frozenset(fp.split()) for fp in mutated_corpus(50, 0) if fp]
+    vectorised = [tuple(row) for row in _minhash_signatures(token_sets).tolist()]
+    monkeypatch.setattr(nemo_curator, "np", None)
+    assert _minhash_signatures(token_sets) == vectorised
+
+
+def test_near_duplicate_groups_report_every_similar_pair():
+    fingerprints = mutated_corpus(400, 3)
+    group_of, neighbours = near_duplicate_groups(fingerprints, THRESHOLD)
+
+    representative = {}
+    for idx, group in enumerate(group_of):
+        representative.setdefault(group, fingerprints[idx])
+    expected = [set() for _ in representative]
+    for g, a in representative.items():
+        for h, b in representative.items():
+            if g != h and a and b and jaccard(a, b) >= THRESHOLD:
+                expected[g].add(h)
+    assert neighbours == expected
+
+
+def test_candidates_checked_stay_linear_on_templated_input(monkeypatch):
+    # Templated transcripts share most tokens: a few percent of all pairs are
+    # genuinely similar, and bands tuned below the threshold used to make
+    # over 150 candidates per transcript here. The greedy pass only has to
+    # look at candidates of transcripts it keeps.
+    checked = 0
+    later_candidates = _LSHIndex.later_candidates
+
+    def counting(self, idx):
+        nonlocal checked
+        for other in later_candidates(self, idx):
+            checked += 1
+            yield other
+
+    monkeypatch.setattr(_LSHIndex, "later_candidates", counting)
+    counts = {}
+    for n in (2000, 4000):
+        checked = 0
+        fingerprints = [_conversation_fingerprint(t) for t in templated_transcripts(n, 7)]
+        _near_duplicate_mask(fingerprints, THRESHOLD)
+        counts[n] = checked
+    assert counts[4000] < 40 * 4000
+    assert counts[4000] < 3 * counts[2000]
+
+
+def test_parallel_curation_matches_serial(monkeypatch):
+    transcripts = templated_transcripts(600, 11)
+    transcripts += [dict(t) for t in transcripts[::10]]
+    serial = NemoCurator().curate(transcripts, min_quality_score=5.0)
+
+    # Workers are capped at the CPU count; make sure the pool is used.
+    monkeypatch.setattr(nemo_curator.os, "cpu_count", lambda: 4)
+    parallel = NemoCurator().curate(transcripts, min_quality_score=5.0, workers=4)
+
+    assert parallel == serial
+    assert serial.deduplicated_count > 0 and serial.pii_removed_count > 0
+
+
+def test_curation_workers_do_not_load_the_app_services():
+    # Each pool process imports this module; it must not pull in Data
+    # Designer or open the global job store via app/services/__init__.py.
+    code = (
+        "import sys, app.services.nemo_curator; "
+        "print(sorted(m for m in ('app.services.transcript_generator', 'app.services.job_store', "
+        "'data_designer') if m in sys.modules))"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True, text=True, check=True,
+        env={**os.environ, "PYTHONPATH": str(BACKEND_DIR)},
+    )
+    assert result.stdout.strip() == "[]"
+
+
+@pytest.mark.parametrize(
+    "text, expected",
+    [
+        ("call 12/12/555-123-4567", "call 12/12/[PHONE_REDACTED]"),
+        ("2/96/969@.ba.cao", "2/96/[EMAIL_REDACTED]"),
+        ("born 01/02/1980 near 90210", "born [DATE_REDACTED] near [ZIP_REDACTED]"),
+        ("no numbers here", "no numbers here"),
+    ],
+)
+def test_overlapping_pii_keeps_category_priority(text, expected):
+    assert _redact_pii(text)[0] == expected
+    assert sequential_redact(text)[0] == expected
+
+
+def test_redaction_matches_sequential_patterns():
+    rng = random.Random(0)
+    alphabet = "0123456789  -./@ab.com"
+    texts = ["".join(rng.choice(alphabet) for _ in range(rng.randint(5, 40))) for _ in range(20000)]
+    texts += [turn["text"] for t in templated_transcripts(300, 0) for turn in t["conversation"]]
+
+    redactor = PIIRedactor()
+    for text in texts:
+        assert _redact_pii(text) == sequential_redact(text), text
+
+    cleaned, counts = redactor.redact_batch(texts)
+    assert cleaned == [sequential_redact(text)[0] for text in texts]
+    assert sum(counts.values()) == sum(sequential_redact(text)[1] for text in texts)
@@ -0,0 +1,154 @@
+"""QualityScorer.score_batch_async against a local OpenAI-compatible stub."""
+
+import asyncio
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from app.services.disk_cache import DiskCache
+from app.services.quality_scorer import QualityScorer
+
+VERDICT = {"coherence": 9.0, "diversity": 8.0, "factualConsistency": 7.0}
+
+
+class JudgeStub:
+    """Serves chat completions; ``failures`` is a list of status codes returned
+    (in order) before requests start succeeding."""
+
+    def __init__(self):
+        self.failures: list[int] = []
+        self.requests = 0
+        self._lock = threading.Lock()
+
+    def respond(self) -> tuple[int, dict]:
+        with self._lock:
+            self.requests += 1
+            if self.failures:
+                return self.failures.pop(0), {"error": {"message": "stub failure"}}
+        return 200, {
+            "id": "chatcmpl-stub",
+            "object": "chat.completion",
+            "created": 0,
+            "model": "stub",
+            "choices": [
+                {
+                    "index": 0,
+                    "finish_reason": "stop",
+                    "message": {"role": "assistant", "content": json.dumps(VERDICT)},
+                }
+            ],
+        }
+
+
+@pytest.fixture
+def judge():
+    stub = JudgeStub()
+
+    class Handler(BaseHTTPRequestHandler):
+        def log_message(self, *args):
+            pass
+
+        def do_POST(self):
+            self.rfile.read(int(self.headers["Content-Length"]))
+            status, body = stub.respond()
+            data = json.dumps(body).encode()
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    stub.base_url = f"http://127.0.0.1:{server.server_port}/v1"
+    yield stub
+    server.shutdown()
+    server.server_close()
+
+
+def _scorer(judge, **kwargs) -> QualityScorer:
+    options = dict(requests_per_second=1000.0, backoff_base=0.01, backoff_cap=0.05)
+    options.update(kwargs)
+    return QualityScorer("test-key", base_url=judge.base_url, **options)
+
+
+def _transcripts(n: int) -> list[dict]:
+    return [
+        {
+            "id": f"t{i}",
+            "industry": "banking",
+            "scenario": "balance",
+            "conversation": [
+                {"speaker": "customer", "text": f"What is my balance on account {i}?"},
+                {"speaker": "agent", "text": "Let me check that for you."},
+            ],
+        }
+        for i in range(n)
+    ]
+
+
+def test_retries_transient_errors(judge):
+    judge.failures = [429, 503, 500]
+    transcripts, summary = asyncio.run(_scorer(judge, max_concurrency=1).score_batch_async(_transcripts(2)))
+
+    assert summary.retries == 3
+    assert summary.scored == 2 and summary.failed == 0
+    assert judge.requests == 5
+    assert all(t["qualityScores"]["overall"] == 8.0 for t in transcripts)
+
+
+def test_gives_up_after_max_retries(judge):
+    judge.failures = [503] * 10
+    transcripts, summary = asyncio.run(
+        _scorer(judge, max_retries=2).score_batch_async(_transcripts(1))
+    )
+
+    assert judge.requests == 3
+    assert summary.retries == 2
+    assert summary.failed == 1
+    assert transcripts[0]["qualityScores"]["overall"] == 7.0  # neutral fallback
+
+
+def test_no_cache_reports_no_cache_traffic(judge):
+    _, summary = asyncio.run(_scorer(judge).score_batch_async(_transcripts(3)))
+
+    assert summary.scored == 3
+    assert summary.cache_hits == 0 and summary.cache_misses == 0
+
+
+def test_client_errors_are_not_retried(judge):
+    judge.failures = [400]
+    _, summary = asyncio.run(_scorer(judge).score_batch_async(_transcripts(1)))
+
+    assert judge.requests == 1
+    assert summary.retries == 0
+    assert summary.failed == 1
+
+
+def test_duplicates_and_cached_verdicts_skip_the_judge(judge, tmp_path):
+    cache = DiskCache(tmp_path / "judge_cache.db")
+    batch = _transcripts(3)
+    batch.append({**batch[0], "id": "copy-of-t0"})
+
+    _, summary = asyncio.run(_scorer(judge, cache=cache).score_batch_async(batch))
+    assert judge.requests == 3
+    assert summary.cache_hits == 0
+
+    transcripts, summary = asyncio.run(_scorer(judge, cache=cache).score_batch_async(_transcripts(3)))
+    assert judge.requests == 3
+    assert summary.cache_hits == 3
+    assert all(t["qualityScores"]["overall"] == 8.0 for t in transcripts)
+
+
+def test_failed_verdicts_are_not_cached(judge, tmp_path):
+    cache = DiskCache(tmp_path / "judge_cache.db")
+    judge.failures = [400]
+    asyncio.run(_scorer(judge, cache=cache).score_batch_async(_transcripts(1)))
+    assert cache.stats()["entries"] == 0
+
+    _, summary = asyncio.run(_scorer(judge, cache=cache).score_batch_async(_transcripts(1)))
+    assert summary.failed == 0
+    assert cache.stats()["entries"] == 1
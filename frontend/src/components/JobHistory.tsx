@@ -2,21 +2,23 @@ import { useQuery } from '@tanstack/react-query'
 import { Link } from 'react-router-dom'
 import { Clock, CheckCircle, XCircle, Loader2, Download, Eye } from 'lucide-react'
 import { api } from '@/services/api'
-import type { GenerationJob } from '@/types'
+import type { JobSummary, JobsPage } from '@/types'
 
 export function JobHistory() {
-  const { data: jobs, isLoading } = useQuery({
+  const { data, isLoading } = useQuery({
     queryKey: ['jobs'],
-    queryFn: api.listJobs,
+    queryFn: () => api.listJobs(),
     // Only poll while something is actually in progress; otherwise stop so we
     // don't hammer /jobs forever on an idle, open tab.
     refetchInterval: (query) => {
-      const data = query.state.data as GenerationJob[] | undefined
-      const active = data?.some((j) => j.status === 'running' || j.status === 'pending')
+      const data = query.state.data as JobsPage | undefined
+      const active = data?.jobs.some((j) => j.status === 'running' || j.status === 'pending')
       return active ? 5000 : false
     },
   })
 
+  const jobs = data?.jobs
+
   if (isLoading) {
     return (
       <div className="flex items-center justify-center py-8">
@@ -46,7 +48,7 @@ export function JobHistory() {
   )
 }
 
-function JobRow({ job }: { job: GenerationJob }) {
+function JobRow({ job }: { job: JobSummary }) {
   const handleDownload = async (format: 'json' | 'csv' | 'jsonl') => {
     try {
       const blob = await api.downloadJob(job.id, format)
@@ -69,7 +71,7 @@ function JobRow({ job }: { job: GenerationJob }) {
           <div>
             <div className="flex items-center gap-2">
               <span className="text-white font-medium capitalize">
-                {job.config.industry}
+                {job.industry}
               </span>
               <span className="text-xs text-gray-500">
                 {job.id.slice(0, 8)}
@@ -1,6 +1,6 @@
 import { useEffect, useMemo, useState } from 'react'
 import { Link, useParams } from 'react-router-dom'
-import { useQuery } from '@tanstack/react-query'
+import { keepPreviousData, useInfiniteQuery, useQuery, useQueryClient } from '@tanstack/react-query'
 import {
   ArrowLeft, Play, Pause, Square, Loader2, Search, User, Headphones,
   ChevronDown, ChevronUp, AlertCircle, Volume2, VolumeX,
@@ -9,43 +9,72 @@ import { clsx } from 'clsx'
 import { api } from '@/services/api'
 import { useSpeech } from '@/hooks/useSpeech'
 import { TranscriptConversation } from './TranscriptConversation'
-import type { Transcript } from '@/types'
+import type { DatasetStats, Transcript } from '@/types'
+
+const PAGE_SIZE = 50
+
+// The list only needs card headers; conversations are fetched per card on expand.
+const LIST_FIELDS: Array<keyof Transcript> = [
+  'id', 'industry', 'scenario', 'language', 'customer', 'agent', 'metadata', 'qualityScores',
+]
 
 export function TranscriptViewer() {
   const { jobId } = useParams<{ jobId: string }>()
+  const queryClient = useQueryClient()
   const [search, setSearch] = useState('')
+  const [query, setQuery] = useState('')
   const [sentimentFilter, setSentimentFilter] = useState<string>('all')
 
   const speech = useSpeech()
   const [playingId, setPlayingId] = useState<string | null>(null)
 
-  const { data, isLoading, isError, error } = useQuery({
-    queryKey: ['job-results', jobId],
-    queryFn: () => api.getJobResults(jobId!),
+  // Search on the server once typing pauses rather than on every keystroke.
+  useEffect(() => {
+    const timer = setTimeout(() => setQuery(search.trim()), 300)
+    return () => clearTimeout(timer)
+  }, [search])
+
+  const {
+    data, isLoading, isError, error, fetchNextPage, hasNextPage, isFetchingNextPage,
+  } = useInfiniteQuery({
+    queryKey: ['job-results', jobId, sentimentFilter, query],
+    queryFn: ({ pageParam }) =>
+      api.getJobResults(jobId!, {
+        cursor: pageParam,
+        limit: PAGE_SIZE,
+        sentiment: sentimentFilter === 'all' ? undefined : sentimentFilter,
+        q: query || undefined,
+        fields: LIST_FIELDS,
+      }),
+    initialPageParam: undefined as number | undefined,
+    getNextPageParam: (last) => last.nextCursor ?? undefined,
+    // Keep the current list (and the focused search box) on screen while a
+    // new filter's first page loads.
+    placeholderData: keepPreviousData,
     enabled: !!jobId,
     retry: false,
   })
 
-  const transcripts = data?.transcripts ?? []
-  const kpis = useMemo(() => computeKpis(transcripts), [transcripts])
-
-  const filtered = useMemo(() => {
-    const q = search.trim().toLowerCase()
-    return transcripts.filter((t) => {
-      if (sentimentFilter !== 'all' && t.customer?.sentiment !== sentimentFilter) return false
-      if (!q) return true
-      return (
-        t.scenario?.toLowerCase().includes(q) ||
-        t.customer?.name?.toLowerCase().includes(q) ||
-        t.agent?.name?.toLowerCase().includes(q) ||
-        t.conversation?.some((turn) => turn.text.toLowerCase().includes(q))
-      )
-    })
-  }, [transcripts, search, sentimentFilter])
+  // KPIs come from the job's precomputed statistics, not the loaded pages.
+  const { data: stats } = useQuery({
+    queryKey: ['job-statistics', jobId],
+    queryFn: () => api.getJobStatistics(jobId!),
+    enabled: !!jobId && !isError,
+    retry: false,
+  })
 
-  const playCall = (t: Transcript) => {
+  const transcripts = useMemo(() => data?.pages.flatMap((p) => p.transcripts) ?? [], [data])
+  const matching = data?.pages[0]?.total
+  const kpis = useMemo(() => (stats ? computeKpis(stats) : null), [stats])
+  const filtersActive = sentimentFilter !== 'all' || query !== ''
+
+  const playCall = async (t: Transcript) => {
     setPlayingId(t.id)
-    speech.play(t.conversation)
+    const full = await queryClient.fetchQuery({
+      queryKey: ['transcript', jobId, t.id],
+      queryFn: () => api.getTranscript(jobId!, t.id),
+    })
+    speech.play(full.conversation)
   }
   const stopCall = () => {
     speech.stop()
@@ -94,25 +123,27 @@ export function TranscriptViewer() {
           </div>
         )}
 
-        {!isLoading && !isError && transcripts.length > 0 && (
+        {!isLoading && !isError && (transcripts.length > 0 || filtersActive) && (
           <>
             {/* KPI bar */}
-            <section>
-              <h2 className="text-sm font-semibold text-gray-400 uppercase mb-3">Key Metrics</h2>
-              <div className="grid grid-cols-2 md:grid-cols-4 gap-3">
-                <Kpi label="Total Transcripts" value={kpis.total} />
-                <Kpi label="Avg Duration" value={formatDuration(kpis.avgDuration)} />
-                <Kpi label="Avg CSAT" value={kpis.avgCsat != null ? `${kpis.avgCsat.toFixed(1)}/5` : '—'} />
-                <Kpi label="Resolution Rate" value={`${Math.round(kpis.resolutionRate * 100)}%`} />
-                <Kpi label="Escalation Rate" value={`${Math.round(kpis.escalationRate * 100)}%`} />
-                <Kpi label="Avg Turns" value={kpis.avgTurns.toFixed(1)} />
-                <Kpi
-                  label="Avg Quality"
-                  value={kpis.avgQuality != null ? `${kpis.avgQuality.toFixed(1)}/10` : 'Not scored'}
-                />
-                <SentimentKpi sentiments={kpis.sentiments} total={kpis.total} />
-              </div>
-            </section>
+            {kpis && (
+              <section>
+                <h2 className="text-sm font-semibold text-gray-400 uppercase mb-3">Key Metrics</h2>
+                <div className="grid grid-cols-2 md:grid-cols-4 gap-3">
+                  <Kpi label="Total Transcripts" value={kpis.total} />
+                  <Kpi label="Avg Duration" value={formatDuration(kpis.avgDuration)} />
+                  <Kpi label="Avg CSAT" value={kpis.avgCsat != null ? `${kpis.avgCsat.toFixed(1)}/5` : '—'} />
+                  <Kpi label="Resolution Rate" value={`${Math.round(kpis.resolutionRate * 100)}%`} />
+                  <Kpi label="Escalation Rate" value={`${Math.round(kpis.escalationRate * 100)}%`} />
+                  <Kpi label="Avg Turns" value={kpis.avgTurns.toFixed(1)} />
+                  <Kpi
+                    label="Avg Quality"
+                    value={kpis.avgQuality != null ? `${kpis.avgQuality.toFixed(1)}/10` : 'Not scored'}
+                  />
+                  <SentimentKpi sentiments={kpis.sentiments} total={kpis.total} />
+                </div>
+              </section>
+            )}
 
             {/* Filters */}
             <section className="flex flex-col sm:flex-row gap-3">
@@ -131,21 +162,24 @@ export function TranscriptViewer() {
                 className="select"
               >
                 <option value="all">All sentiments</option>
-                {Object.keys(kpis.sentiments).map((s) => (
+                {Object.keys(kpis?.sentiments ?? {}).map((s) => (
                   <option key={s} value={s}>{s}</option>
                 ))}
               </select>
             </section>
 
             <p className="text-sm text-gray-500">
-              Showing {filtered.length} of {transcripts.length} transcripts
+              {matching != null
+                ? `Showing ${transcripts.length} of ${matching} transcripts`
+                : `Showing ${transcripts.length}${hasNextPage ? '+' : ''} matching transcripts`}
             </p>
 
             {/* Transcript list */}
             <div className="space-y-4">
-              {filtered.map((t, i) => (
+              {transcripts.map((t, i) => (
                 <TranscriptCard
                   key={t.id}
+                  jobId={jobId!}
                   transcript={t}
                   defaultExpanded={i === 0}
                   isPlaying={playingId === t.id && speech.isPlaying}
@@ -159,8 +193,24 @@ export function TranscriptViewer() {
                   onPlayTurn={(turn, idx) => { setPlayingId(t.id); speech.playTurn(turn, idx) }}
                 />
               ))}
+              {!hasNextPage && transcripts.length === 0 && filtersActive && (
+                <div className="text-center py-10 text-gray-500">No transcripts match these filters.</div>
+              )}
             </div>
 
+            {hasNextPage && (
+              <div className="flex justify-center">
+                <button
+                  onClick={() => fetchNextPage()}
+                  disabled={isFetchingNextPage}
+                  className="btn-secondary flex items-center gap-2"
+                >
+                  {isFetchingNextPage && <Loader2 className="w-4 h-4 animate-spin" />}
+                  Load more
+                </button>
+              </div>
+            )}
+
             {/* Playback speed */}
             {speech.isSupported && (
               <div className="flex items-center gap-3 text-sm text-gray-400 border-t border-gray-800 pt-4">
@@ -178,7 +228,7 @@ export function TranscriptViewer() {
           </>
         )}
 
-        {!isLoading && !isError && transcripts.length === 0 && (
+        {!isLoading && !isError && !filtersActive && transcripts.length === 0 && (
           <div className="text-center py-20 text-gray-500">No transcripts found for this job.</div>
         )}
       </main>
@@ -189,6 +239,7 @@ export function TranscriptViewer() {
 // ─── Transcript card ───────────────────────────────────────────────────────
 
 interface CardProps {
+  jobId: string
   transcript: Transcript
   defaultExpanded: boolean
   isPlaying: boolean
@@ -203,10 +254,15 @@ interface CardProps {
 }
 
 function TranscriptCard({
-  transcript: t, defaultExpanded, isPlaying, isPaused, activeIndex,
+  jobId, transcript: t, defaultExpanded, isPlaying, isPaused, activeIndex,
   voiceSupported, onPlay, onPause, onResume, onStop, onPlayTurn,
 }: CardProps) {
   const [expanded, setExpanded] = useState(defaultExpanded)
+  const { data: full, isLoading: loadingFull } = useQuery({
+    queryKey: ['transcript', jobId, t.id],
+    queryFn: () => api.getTranscript(jobId, t.id),
+    enabled: expanded,
+  })
 
   return (
     <div className="bg-gray-800/50 border border-gray-700 rounded-lg overflow-hidden">
@@ -286,11 +342,17 @@ function TranscriptCard({
 
           {/* Conversation (text) */}
           <div className="max-h-96 overflow-y-auto pr-1">
-            <TranscriptConversation
-              conversation={t.conversation}
-              activeIndex={activeIndex}
-              onPlayTurn={voiceSupported ? onPlayTurn : undefined}
-            />
+            {loadingFull || !full ? (
+              <div className="flex items-center text-sm text-gray-400">
+                <Loader2 className="w-4 h-4 animate-spin mr-2" /> Loading conversation…
+              </div>
+            ) : (
+              <TranscriptConversation
+                conversation={full.conversation}
+                activeIndex={activeIndex}
+                onPlayTurn={voiceSupported ? onPlayTurn : undefined}
+              />
+            )}
           </div>
 
           {/* Metadata */}
@@ -321,27 +383,17 @@ interface Kpis {
   avgQuality: number | null
 }
 
-function computeKpis(transcripts: Transcript[]): Kpis {
-  const total = transcripts.length
-  const mean = (nums: number[]) => (nums.length ? nums.reduce((a, b) => a + b, 0) / nums.length : 0)
-
-  const csats = transcripts.map((t) => t.metadata?.csatScore).filter((c): c is number => c != null)
-  const quals = transcripts.map((t) => t.qualityScores?.overall).filter((q): q is number => q != null)
-  const sentiments: Record<string, number> = {}
-  for (const t of transcripts) {
-    const s = t.customer?.sentiment ?? 'unknown'
-    sentiments[s] = (sentiments[s] || 0) + 1
-  }
-
+function computeKpis(stats: DatasetStats): Kpis {
+  const total = stats.totalTranscripts
   return {
     total,
-    avgDuration: mean(transcripts.map((t) => t.metadata?.durationSeconds ?? 0)),
-    avgCsat: csats.length ? mean(csats) : null,
-    resolutionRate: total ? transcripts.filter((t) => t.metadata?.resolutionStatus === 'resolved').length / total : 0,
-    escalationRate: total ? transcripts.filter((t) => t.metadata?.escalated).length / total : 0,
-    avgTurns: mean(transcripts.map((t) => t.conversation?.length ?? 0)),
-    sentiments,
-    avgQuality: quals.length ? mean(quals) : null,
+    avgDuration: stats.avgDurationSeconds,
+    avgCsat: stats.avgCsat,
+    resolutionRate: total ? (stats.resolutionStatusDistribution.resolved ?? 0) / total : 0,
+    escalationRate: stats.escalationRate,
+    avgTurns: stats.avgTurns,
+    sentiments: stats.sentimentDistribution,
+    avgQuality: stats.avgQuality,
   }
 }
 
@@ -1,4 +1,4 @@
-import type { GenerationConfig, GenerationJob, Transcript, BiasReport, DatasetStats, CurationResult } from '@/types'
+import type { GenerationConfig, GenerationJob, Transcript, BiasReport, DatasetStats, CurationResult, AnalyticsReport, ResultsPage, ResultsQuery, JobsPage, JobsQuery } from '@/types'
 
 export const API_URL = import.meta.env.VITE_API_URL || 'http://localhost:8000/api/v1'
 
@@ -38,13 +38,34 @@ export const api = {
   getJob: (jobId: string): Promise<GenerationJob> =>
     fetchApi(`/jobs/${jobId}`),
 
-  // Get a job's generated transcripts for in-app viewing (text, voice, KPIs)
-  getJobResults: (jobId: string): Promise<{ transcripts: Transcript[] }> =>
-    fetchApi(`/jobs/${jobId}/results`),
+  // Get a job's generated transcripts for in-app viewing; pass `limit` to page
+  // through them with `cursor`, plus optional server-side filters
+  getJobResults: (jobId: string, query: ResultsQuery = {}): Promise<ResultsPage> => {
+    const params = new URLSearchParams()
+    for (const [key, value] of Object.entries(query)) {
+      if (value === undefined || value === '') continue
+      params.set(key, Array.isArray(value) ? value.join(',') : String(value))
+    }
+    const qs = params.toString()
+    return fetchApi(`/jobs/${jobId}/results${qs ? `?${qs}` : ''}`)
+  },
+
+  // Get one transcript of a job in full
+  getTranscript: async (jobId: string, transcriptId: string): Promise<Transcript> => {
+    const page = await api.getJobResults(jobId, { transcriptId, limit: 1 })
+    if (!page.transcripts.length) throw new Error('Transcript not found')
+    return page.transcripts[0]
+  },
 
-  // List all jobs
-  listJobs: (): Promise<GenerationJob[]> =>
-    fetchApi('/jobs'),
+  // List jobs, newest first, one page at a time
+  listJobs: (query: JobsQuery = {}): Promise<JobsPage> => {
+    const params = new URLSearchParams()
+    for (const [key, value] of Object.entries(query)) {
+      if (value !== undefined && value !== '') params.set(key, String(value))
+    }
+    const qs = params.toString()
+    return fetchApi(`/jobs${qs ? `?${qs}` : ''}`)
+  },
 
   // Delete a job
   deleteJob: (jobId: string): Promise<{ message: string }> =>
@@ -77,7 +98,7 @@ export const api = {
   // Run NeMo Curator-inspired curation
   curateJob: (
     jobId: string,
-    opts: { min_quality_score: number; deduplicate: boolean; filter_pii: boolean }
+    opts: { min_quality_score: number; deduplicate: boolean; filter_pii: boolean; compress?: boolean }
   ): Promise<CurationResult> =>
     fetchApi(`/jobs/${jobId}/curate`, {
       method: 'POST',
@@ -102,6 +123,21 @@ export const api = {
   generateAudio: (jobId: string): Promise<{ message: string; job_id: string; riva_available: boolean }> =>
     fetchApi(`/jobs/${jobId}/generate-audio`, { method: 'POST' }),
 
+  // Combined analytics over several jobs, or over jobs created in a time window
+  getDatasetAnalytics: (opts: {
+    jobIds?: string[]
+    since?: string
+    until?: string
+    include?: Array<'statistics' | 'bias' | 'quality' | 'overlap'>
+  }): Promise<AnalyticsReport> => {
+    const params = new URLSearchParams()
+    opts.jobIds?.forEach((id) => params.append('jobId', id))
+    if (opts.since) params.set('since', opts.since)
+    if (opts.until) params.set('until', opts.until)
+    opts.include?.forEach((section) => params.append('include', section))
+    return fetchApi(`/analytics/datasets?${params}`)
+  },
+
   // Health check
   health: (): Promise<{ status: string }> =>
     fetchApi('/health'),
@@ -40,12 +40,46 @@ export interface DatasetStats {
   qualityScoreDistribution: Record<string, number>
   avgDurationSeconds: number
   totalTranscripts: number
+  avgTurns: number
+  escalationRate: number
+  avgCsat: number | null
+  avgQuality: number | null
+}
+
+export interface QualityDistribution {
+  scored: number
+  unscored: number
+  meanOverall: number
+  histogram: Array<{ range: string; count: number }>
+}
+
+export interface JobAnalytics {
+  statistics: DatasetStats | null
+  biasReport: BiasReport | null
+  qualityDistribution: QualityDistribution | null
+}
+
+export interface DedupOverlap {
+  threshold: number
+  transcriptsCompared: number
+  crossJobDuplicates: number
+  combinedRemovable: number
+  pairs: Array<{ jobId: string; otherJobId: string; transcripts: number }>
+}
+
+export interface AnalyticsReport {
+  jobIds: string[]
+  missingJobIds: string[]
+  combined: JobAnalytics
+  perJob: Record<string, JobAnalytics>
+  dedupOverlap: DedupOverlap | null
 }
 
 export interface CurationResult {
   originalCount: number
   deduplicatedCount: number
   piiRemovedCount: number
+  piiCategoryCounts?: Record<string, number>
   qualityFilteredCount: number
   finalCount: number
 }
@@ -109,6 +143,28 @@ export interface Transcript {
   createdAt: string
 }
 
+// One page of GET /jobs/{id}/results. Transcripts are partial when the
+// request projected `fields`; `total` is null for free-text searches.
+export interface ResultsPage {
+  transcripts: Transcript[]
+  nextCursor: number | null
+  total: number | null
+}
+
+export interface ResultsQuery {
+  cursor?: number
+  limit?: number
+  scenario?: string
+  sentiment?: string
+  resolutionStatus?: string
+  language?: string
+  minQuality?: number
+  maxQuality?: number
+  transcriptId?: string
+  q?: string
+  fields?: Array<keyof Transcript>
+}
+
 export interface GenerationConfig {
   industry: string
   scenarios: string[]
@@ -132,3 +188,28 @@ export interface GenerationJob {
   completedAt?: string
   error?: string
 }
+
+// Row of the jobs list: a GenerationJob without its config.
+export interface JobSummary {
+  id: string
+  status: GenerationJob['status']
+  industry?: string
+  progress: number
+  totalRecords: number
+  completedRecords: number
+  createdAt: string
+  completedAt?: string
+  error?: string
+}
+
+export interface JobsPage {
+  jobs: JobSummary[]
+  nextCursor: string | null
+}
+
+export interface JobsQuery {
+  cursor?: string
+  limit?: number
+  status?: GenerationJob['status']
+  industry?: string
+}